@@ -0,0 +1,460 @@
+-- Migration: Base schema
+-- Description: Core tables and indexes, formerly created by Database._init_tables on every
+-- process start. Applied once by src/batch/migrate.py like every other migration.
+
+-- Workers 테이블
+CREATE TABLE IF NOT EXISTS workers (
+    id SERIAL PRIMARY KEY,
+    telegram_id BIGINT UNIQUE NOT NULL,
+    name TEXT NOT NULL,
+    birth_date TEXT,
+    phone TEXT NOT NULL,
+    driver_license BOOLEAN DEFAULT FALSE,
+    security_cert BOOLEAN DEFAULT FALSE,
+    ssn TEXT,
+    bank_name TEXT,
+    bank_account TEXT,
+    contract_signed BOOLEAN DEFAULT FALSE,
+    contract_sent_at TIMESTAMP,
+    tokens INTEGER DEFAULT 3,
+    wallet_address TEXT,
+    gender TEXT,
+    residence TEXT,
+    face_photo_file_id TEXT,
+    email TEXT UNIQUE,
+    password_hash TEXT,
+    is_admin BOOLEAN DEFAULT FALSE,
+    region_id INTEGER,
+    home_dong TEXT,
+    career_months INTEGER DEFAULT 0,
+    work_score REAL DEFAULT 0,
+    work_score_updated_at TIMESTAMP,
+    preferred_regions TEXT,
+    preferred_job_types TEXT,
+    preferred_work_days TEXT,
+    min_pay_per_hour INTEGER,
+    previous_experience TEXT,
+    total_worked_events INTEGER DEFAULT 0,
+    total_worked_hours INTEGER DEFAULT 0,
+    first_work_date TEXT,
+    last_work_date TEXT,
+    reliability_score REAL DEFAULT 50,
+    no_show_count INTEGER DEFAULT 0,
+    same_day_cancel_count INTEGER DEFAULT 0,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Events 테이블
+CREATE TABLE IF NOT EXISTS events (
+    id SERIAL PRIMARY KEY,
+    short_code TEXT UNIQUE NOT NULL,
+    title TEXT NOT NULL,
+    event_date TEXT NOT NULL,
+    event_time TEXT,
+    start_time TEXT,
+    end_time TEXT,
+    location TEXT NOT NULL,
+    pay_amount INTEGER NOT NULL,
+    pay_description TEXT,
+    headcount INTEGER,
+    meal_provided BOOLEAN DEFAULT FALSE,
+    dress_code TEXT,
+    age_requirement TEXT,
+    work_type TEXT,
+    application_method TEXT,
+    manager_name TEXT,
+    manager_phone TEXT,
+    status TEXT DEFAULT 'OPEN',
+    created_by INTEGER,
+    requires_driver_license BOOLEAN DEFAULT FALSE,
+    requires_security_cert BOOLEAN DEFAULT FALSE,
+    region_id INTEGER,
+    category_id INTEGER,
+    difficulty_level INTEGER DEFAULT 3,
+    indoor_outdoor TEXT,
+    weather_condition TEXT,
+    temperature REAL,
+    actual_headcount INTEGER,
+    event_completion_rate REAL,
+    avg_worker_rating REAL,
+    client_satisfaction REAL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Applications 테이블
+CREATE TABLE IF NOT EXISTS applications (
+    id SERIAL PRIMARY KEY,
+    event_id INTEGER NOT NULL REFERENCES events(id),
+    worker_id INTEGER NOT NULL REFERENCES workers(id),
+    status TEXT DEFAULT 'PENDING',
+    applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    confirmed_at TIMESTAMP,
+    confirmed_by INTEGER,
+    rejection_reason TEXT,
+    notified BOOLEAN DEFAULT FALSE,
+    cancelled_at TIMESTAMP,
+    cancel_reason TEXT,
+    UNIQUE(event_id, worker_id)
+);
+
+-- Attendance 테이블
+CREATE TABLE IF NOT EXISTS attendance (
+    id SERIAL PRIMARY KEY,
+    application_id INTEGER UNIQUE NOT NULL REFERENCES applications(id),
+    event_id INTEGER NOT NULL REFERENCES events(id),
+    worker_id INTEGER NOT NULL REFERENCES workers(id),
+    check_in_code TEXT,
+    check_in_time TIMESTAMP,
+    check_out_time TIMESTAMP,
+    worked_minutes INTEGER,
+    status TEXT DEFAULT 'PENDING',
+    completed_by INTEGER,
+    late_minutes INTEGER DEFAULT 0,
+    scheduled_start TEXT,
+    scheduled_end TEXT,
+    cancel_type TEXT,
+    cancel_time TIMESTAMP,
+    time_compliance INTEGER DEFAULT 100,
+    check_in_lat REAL,
+    check_in_lng REAL,
+    check_out_lat REAL,
+    check_out_lng REAL,
+    distance_from_venue REAL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Chain logs 테이블
+CREATE TABLE IF NOT EXISTS chain_logs (
+    id SERIAL PRIMARY KEY,
+    attendance_id INTEGER UNIQUE NOT NULL REFERENCES attendance(id),
+    event_id INTEGER NOT NULL REFERENCES events(id),
+    worker_uid_hash TEXT NOT NULL,
+    log_hash TEXT NOT NULL,
+    tx_hash TEXT,
+    block_number INTEGER,
+    network TEXT DEFAULT 'amoy',
+    recorded_at TIMESTAMP,
+    metadata_hash TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Payroll exports 테이블
+CREATE TABLE IF NOT EXISTS payroll_exports (
+    id SERIAL PRIMARY KEY,
+    event_id INTEGER NOT NULL REFERENCES events(id),
+    file_path TEXT NOT NULL,
+    exported_by INTEGER NOT NULL,
+    worker_count INTEGER,
+    total_amount INTEGER,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Admin users 테이블
+CREATE TABLE IF NOT EXISTS admin_users (
+    id SERIAL PRIMARY KEY,
+    telegram_id BIGINT UNIQUE NOT NULL,
+    username TEXT,
+    is_active BOOLEAN DEFAULT TRUE,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Pending admin requests 테이블
+CREATE TABLE IF NOT EXISTS pending_admin_requests (
+    id SERIAL PRIMARY KEY,
+    telegram_id BIGINT UNIQUE NOT NULL,
+    username TEXT,
+    first_name TEXT,
+    last_name TEXT,
+    status TEXT DEFAULT 'PENDING',
+    requested_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    reviewed_by INTEGER,
+    reviewed_at TIMESTAMP
+);
+
+-- Notifications 테이블
+CREATE TABLE IF NOT EXISTS notifications (
+    id SERIAL PRIMARY KEY,
+    worker_id INTEGER NOT NULL REFERENCES workers(id),
+    type TEXT NOT NULL,
+    title TEXT NOT NULL,
+    message TEXT NOT NULL,
+    data TEXT,
+    is_read BOOLEAN DEFAULT FALSE,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Notification counters 테이블 (읽지 않은 알림 수, 알림 생성/읽음과 같은 트랜잭션에서 갱신)
+CREATE TABLE IF NOT EXISTS notification_counters (
+    worker_id INTEGER PRIMARY KEY REFERENCES workers(id) ON DELETE CASCADE,
+    unread_count INTEGER NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Credit history 테이블
+CREATE TABLE IF NOT EXISTS credit_history (
+    id SERIAL PRIMARY KEY,
+    worker_id INTEGER NOT NULL REFERENCES workers(id),
+    amount INTEGER NOT NULL,
+    balance_after INTEGER,
+    tx_type TEXT NOT NULL,
+    reason TEXT NOT NULL,
+    tx_hash TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Daily check-in 테이블
+CREATE TABLE IF NOT EXISTS daily_checkins (
+    id SERIAL PRIMARY KEY,
+    worker_id INTEGER NOT NULL REFERENCES workers(id),
+    check_date TEXT NOT NULL,
+    reward_amount INTEGER DEFAULT 1,
+    streak_days INTEGER DEFAULT 1,
+    tx_hash TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE(worker_id, check_date)
+);
+
+-- Monthly bonuses 테이블
+CREATE TABLE IF NOT EXISTS monthly_bonuses (
+    id SERIAL PRIMARY KEY,
+    worker_id INTEGER NOT NULL REFERENCES workers(id),
+    year INTEGER NOT NULL,
+    month INTEGER NOT NULL,
+    bonus_type TEXT NOT NULL,
+    amount INTEGER NOT NULL,
+    tx_hash TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE(worker_id, year, month, bonus_type)
+);
+
+-- Email verifications 테이블
+CREATE TABLE IF NOT EXISTS email_verifications (
+    id SERIAL PRIMARY KEY,
+    email TEXT NOT NULL,
+    code TEXT NOT NULL,
+    verified BOOLEAN DEFAULT FALSE,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    expires_at TIMESTAMP NOT NULL
+);
+
+-- Regions 테이블
+CREATE TABLE IF NOT EXISTS regions (
+    id SERIAL PRIMARY KEY,
+    sido TEXT NOT NULL,
+    sigungu TEXT NOT NULL,
+    dong TEXT,
+    lat REAL,
+    lng REAL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Job categories 테이블
+CREATE TABLE IF NOT EXISTS job_categories (
+    id SERIAL PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE,
+    parent_id INTEGER REFERENCES job_categories(id),
+    avg_pay INTEGER,
+    description TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Skills 테이블
+CREATE TABLE IF NOT EXISTS skills (
+    id SERIAL PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE,
+    category TEXT,
+    description TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Worker skills 테이블
+CREATE TABLE IF NOT EXISTS worker_skills (
+    id SERIAL PRIMARY KEY,
+    worker_id INTEGER NOT NULL REFERENCES workers(id),
+    skill_id INTEGER NOT NULL REFERENCES skills(id),
+    acquired_date TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE(worker_id, skill_id)
+);
+
+-- Worker history 테이블
+CREATE TABLE IF NOT EXISTS worker_history (
+    id SERIAL PRIMARY KEY,
+    worker_id INTEGER NOT NULL REFERENCES workers(id),
+    field_name TEXT NOT NULL,
+    old_value TEXT,
+    new_value TEXT,
+    changed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    changed_by INTEGER
+);
+
+-- Application status history 테이블
+CREATE TABLE IF NOT EXISTS application_status_history (
+    id SERIAL PRIMARY KEY,
+    application_id INTEGER NOT NULL REFERENCES applications(id),
+    old_status TEXT,
+    new_status TEXT,
+    changed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    changed_by INTEGER,
+    reason TEXT
+);
+
+-- Worker monthly stats 테이블
+CREATE TABLE IF NOT EXISTS worker_monthly_stats (
+    id SERIAL PRIMARY KEY,
+    worker_id INTEGER NOT NULL REFERENCES workers(id),
+    year INTEGER NOT NULL,
+    month INTEGER NOT NULL,
+    worked_events INTEGER DEFAULT 0,
+    worked_hours INTEGER DEFAULT 0,
+    total_earnings INTEGER DEFAULT 0,
+    on_time_rate REAL DEFAULT 100,
+    completion_rate REAL DEFAULT 100,
+    avg_rating REAL,
+    cancellation_count INTEGER DEFAULT 0,
+    no_show_count INTEGER DEFAULT 0,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE(worker_id, year, month)
+);
+
+-- Event monthly stats 테이블
+CREATE TABLE IF NOT EXISTS event_monthly_stats (
+    id SERIAL PRIMARY KEY,
+    year INTEGER NOT NULL,
+    month INTEGER NOT NULL,
+    category_id INTEGER,
+    region_id INTEGER,
+    total_events INTEGER DEFAULT 0,
+    total_workers INTEGER DEFAULT 0,
+    total_revenue INTEGER DEFAULT 0,
+    avg_pay INTEGER,
+    fill_rate REAL,
+    completion_rate REAL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE(year, month, category_id, region_id)
+);
+
+-- Regional stats 테이블
+CREATE TABLE IF NOT EXISTS regional_stats (
+    id SERIAL PRIMARY KEY,
+    region_id INTEGER NOT NULL REFERENCES regions(id),
+    year INTEGER NOT NULL,
+    month INTEGER NOT NULL,
+    active_workers INTEGER DEFAULT 0,
+    total_events INTEGER DEFAULT 0,
+    avg_pay INTEGER,
+    demand_index REAL,
+    supply_index REAL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE(region_id, year, month)
+);
+
+-- Ratings 테이블
+CREATE TABLE IF NOT EXISTS ratings (
+    id SERIAL PRIMARY KEY,
+    attendance_id INTEGER NOT NULL REFERENCES attendance(id),
+    rater_type TEXT NOT NULL,
+    rating INTEGER NOT NULL,
+    feedback TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE(attendance_id, rater_type)
+);
+
+-- 성과 배지 (Achievement Badges / NFT)
+CREATE TABLE IF NOT EXISTS worker_badges (
+    id SERIAL PRIMARY KEY,
+    worker_id INTEGER NOT NULL REFERENCES workers(id),
+    badge_type TEXT NOT NULL,
+    badge_level INTEGER DEFAULT 1,
+    title TEXT NOT NULL,
+    description TEXT,
+    icon TEXT,
+    earned_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    tx_hash TEXT,
+    is_nft BOOLEAN DEFAULT FALSE,
+    metadata JSONB,
+    event_id INTEGER REFERENCES events(id),
+    batch_id INTEGER,
+    template_type TEXT DEFAULT 'minimal',
+    status TEXT DEFAULT 'ACTIVE',
+    revoke_reason TEXT,
+    image_url TEXT,
+    UNIQUE(worker_id, badge_type, badge_level)
+);
+
+-- 프로젝트 NFT 발행 배치
+CREATE TABLE IF NOT EXISTS project_nft_batches (
+    id SERIAL PRIMARY KEY,
+    event_id INTEGER NOT NULL REFERENCES events(id),
+    title TEXT NOT NULL,
+    description TEXT,
+    template_type TEXT DEFAULT 'cert',
+    issued_by INTEGER REFERENCES workers(id),
+    issued_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    total_issued INTEGER DEFAULT 0,
+    metadata JSONB
+);
+
+-- 감사 로그
+CREATE TABLE IF NOT EXISTS audit_logs (
+    id SERIAL PRIMARY KEY,
+    action TEXT NOT NULL,
+    entity_type TEXT NOT NULL,
+    entity_id INTEGER,
+    actor_id INTEGER,
+    actor_type TEXT,
+    details JSONB,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- 알림 발송 큐 (텔레그램 outbox)
+CREATE TABLE IF NOT EXISTS notification_deliveries (
+    id SERIAL PRIMARY KEY,
+    notification_id INTEGER REFERENCES notifications(id) ON DELETE CASCADE,
+    chat_id BIGINT NOT NULL,
+    text TEXT NOT NULL,
+    reference_type TEXT,
+    reference_id INTEGER,
+    status TEXT DEFAULT 'PENDING',
+    attempts INTEGER DEFAULT 0,
+    next_attempt_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    last_error TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    sent_at TIMESTAMP
+);
+
+-- 인덱스 생성
+CREATE INDEX IF NOT EXISTS idx_applications_event ON applications(event_id);
+CREATE INDEX IF NOT EXISTS idx_applications_worker ON applications(worker_id);
+CREATE INDEX IF NOT EXISTS idx_applications_status ON applications(status);
+CREATE INDEX IF NOT EXISTS idx_attendance_event ON attendance(event_id);
+CREATE INDEX IF NOT EXISTS idx_events_short_code ON events(short_code);
+CREATE INDEX IF NOT EXISTS idx_events_status ON events(status);
+CREATE INDEX IF NOT EXISTS idx_credit_history_worker ON credit_history(worker_id);
+CREATE INDEX IF NOT EXISTS idx_email_verifications_email ON email_verifications(email);
+CREATE INDEX IF NOT EXISTS idx_regions_sido ON regions(sido);
+CREATE INDEX IF NOT EXISTS idx_regions_sigungu ON regions(sigungu);
+CREATE INDEX IF NOT EXISTS idx_worker_history_worker ON worker_history(worker_id);
+CREATE INDEX IF NOT EXISTS idx_app_status_history_app ON application_status_history(application_id);
+CREATE INDEX IF NOT EXISTS idx_worker_monthly_stats ON worker_monthly_stats(worker_id, year, month);
+CREATE INDEX IF NOT EXISTS idx_ratings_attendance ON ratings(attendance_id);
+CREATE INDEX IF NOT EXISTS idx_worker_badges_worker ON worker_badges(worker_id);
+CREATE INDEX IF NOT EXISTS idx_worker_badges_type ON worker_badges(badge_type);
+CREATE INDEX IF NOT EXISTS idx_worker_badges_event ON worker_badges(event_id);
+CREATE INDEX IF NOT EXISTS idx_worker_badges_status ON worker_badges(status);
+CREATE INDEX IF NOT EXISTS idx_project_nft_batches_event ON project_nft_batches(event_id);
+CREATE INDEX IF NOT EXISTS idx_audit_logs_entity ON audit_logs(entity_type, entity_id);
+CREATE INDEX IF NOT EXISTS idx_audit_logs_actor ON audit_logs(actor_id);
+CREATE INDEX IF NOT EXISTS idx_notification_deliveries_due ON notification_deliveries(next_attempt_at) WHERE status IN ('PENDING', 'SENDING');
+CREATE INDEX IF NOT EXISTS idx_notifications_worker ON notifications(worker_id, id DESC);
+CREATE INDEX IF NOT EXISTS idx_notifications_unread ON notifications(worker_id) WHERE is_read = FALSE;
+
+-- 카운터 행이 없는 근무자 채우기 (기존 데이터/최초 배포)
+INSERT INTO notification_counters (worker_id, unread_count)
+SELECT worker_id, COUNT(*) FROM notifications WHERE is_read = FALSE GROUP BY worker_id
+ON CONFLICT (worker_id) DO NOTHING;
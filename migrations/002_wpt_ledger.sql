@@ -0,0 +1,53 @@
+-- Migration: Append-only WPT ledger with atomic balance projection
+-- Description: wpt_transactions is the source of truth; worker_metrics.wpt_balance is a
+-- projection updated in the same statement that appends to the ledger (services/wpt_ledger.py)
+
+-- The ledger statement now maintains the balance itself; the row trigger would double count
+DROP TRIGGER IF EXISTS trigger_update_wpt_balance ON wpt_transactions;
+DROP FUNCTION IF EXISTS update_wpt_balance();
+
+-- Idempotency key: one ledger entry per (category, reference_type, reference_id)
+-- e.g. checkin/checkout reward per attendance row. Existing duplicates (double-paid rewards)
+-- stop the migration: a non-unique index would silently drop the idempotency wpt_ledger
+-- relies on. Delete the extra entries, then re-run migrate.py; the projection rebuild below
+-- corrects the balances.
+DO $$
+BEGIN
+    IF EXISTS (
+        SELECT 1 FROM wpt_transactions
+        WHERE reference_type IS NOT NULL AND reference_id IS NOT NULL
+        GROUP BY category, reference_type, reference_id HAVING COUNT(*) > 1
+    ) THEN
+        RAISE EXCEPTION 'wpt_transactions has duplicate (category, reference_type, reference_id) entries'
+            USING HINT = 'List them with: SELECT category, reference_type, reference_id, array_agg(id ORDER BY id) '
+                         'FROM wpt_transactions WHERE reference_type IS NOT NULL AND reference_id IS NOT NULL '
+                         'GROUP BY 1, 2, 3 HAVING COUNT(*) > 1; keep the first id of each, delete the rest '
+                         'and re-run migrate.py.';
+    END IF;
+END $$;
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_wpt_transactions_reference
+    ON wpt_transactions(category, reference_type, reference_id)
+    WHERE reference_type IS NOT NULL AND reference_id IS NOT NULL;
+
+-- Every worker with ledger entries needs a metrics row to hold the projection
+INSERT INTO worker_metrics (worker_id)
+SELECT DISTINCT worker_id FROM wpt_transactions
+WHERE worker_id IS NOT NULL
+ON CONFLICT (worker_id) DO NOTHING;
+
+-- Rebuild the projection from the ledger
+UPDATE worker_metrics wm
+SET wpt_balance = COALESCE(l.balance, 0),
+    total_wpt_earned = COALESCE(l.earned, 0),
+    total_wpt_spent = COALESCE(l.spent, 0)
+FROM (
+    SELECT w.id AS worker_id,
+           SUM(t.amount) AS balance,
+           SUM(CASE WHEN t.amount > 0 THEN t.amount ELSE 0 END) AS earned,
+           SUM(CASE WHEN t.amount < 0 THEN -t.amount ELSE 0 END) AS spent
+    FROM workers w
+    LEFT JOIN wpt_transactions t ON t.worker_id = w.id
+    GROUP BY w.id
+) l
+WHERE wm.worker_id = l.worker_id;
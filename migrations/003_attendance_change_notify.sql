@@ -0,0 +1,36 @@
+-- Migration: Attendance change notifications
+-- Description: Publish attendance INSERT/UPDATE/DELETE deltas on the attendance_changes
+-- channel so live admin views (API SSE, admin bot) update without re-listing the event
+
+CREATE OR REPLACE FUNCTION notify_attendance_change()
+RETURNS TRIGGER AS $$
+DECLARE
+    rec attendance%ROWTYPE;
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        rec := OLD;
+    ELSE
+        rec := NEW;
+    END IF;
+
+    PERFORM pg_notify('attendance_changes', json_build_object(
+        'op', TG_OP,
+        'id', rec.id,
+        'event_id', rec.event_id,
+        'worker_id', rec.worker_id,
+        'application_id', rec.application_id,
+        'worker_name', (SELECT name FROM workers WHERE id = rec.worker_id),
+        'status', rec.status,
+        'check_in_time', rec.check_in_time,
+        'check_out_time', rec.check_out_time,
+        'worked_minutes', rec.worked_minutes
+    )::text);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trigger_notify_attendance_change ON attendance;
+CREATE TRIGGER trigger_notify_attendance_change
+AFTER INSERT OR DELETE OR UPDATE OF status, check_in_time, check_out_time, worked_minutes
+ON attendance
+FOR EACH ROW EXECUTE FUNCTION notify_attendance_change();
@@ -0,0 +1,30 @@
+-- Migration: Latest-position table and location history retention
+-- Description: GPS points are buffered by the API and flushed in batches (services/location_ingest.py).
+-- worker_latest_locations keeps one row per (worker, event); worker_locations keeps a
+-- downsampled history that src/batch/prune_locations.py expires by retention policy
+
+CREATE TABLE IF NOT EXISTS worker_latest_locations (
+    worker_id INTEGER NOT NULL REFERENCES workers(id) ON DELETE CASCADE,
+    event_id INTEGER NOT NULL REFERENCES events(id) ON DELETE CASCADE,
+    latitude DECIMAL(10, 8) NOT NULL,
+    longitude DECIMAL(11, 8) NOT NULL,
+    updated_at TIMESTAMP NOT NULL DEFAULT NOW(),
+    PRIMARY KEY (event_id, worker_id)
+);
+
+CREATE INDEX IF NOT EXISTS idx_worker_latest_locations_worker ON worker_latest_locations(worker_id);
+CREATE INDEX IF NOT EXISTS idx_worker_latest_locations_updated ON worker_latest_locations(updated_at);
+
+-- Backfill from history (latest point per worker/event)
+INSERT INTO worker_latest_locations (worker_id, event_id, latitude, longitude, updated_at)
+SELECT DISTINCT ON (event_id, worker_id) worker_id, event_id, latitude, longitude, updated_at
+FROM worker_locations
+ORDER BY event_id, worker_id, updated_at DESC
+ON CONFLICT (event_id, worker_id) DO NOTHING;
+
+-- History lookups per worker/event over time
+CREATE INDEX IF NOT EXISTS idx_worker_locations_event_worker_time
+    ON worker_locations(event_id, worker_id, created_at);
+
+-- Retention deletes (Database.prune_worker_locations) select expired rows by created_at alone
+CREATE INDEX IF NOT EXISTS idx_worker_locations_created_at ON worker_locations(created_at);
@@ -0,0 +1,39 @@
+-- Migration: Normalized phone columns
+-- Description: Phone lookups (Database.get_worker_by_phone, get_worker_by_user_id) compared
+-- REPLACE(phone, '-', '') and could not use an index. Store the normalized number
+-- (hyphens and spaces removed, same rule as utils.normalize_phone) as a generated
+-- column and index it.
+
+ALTER TABLE workers
+    ADD COLUMN IF NOT EXISTS phone_normalized TEXT
+    GENERATED ALWAYS AS (replace(replace(phone, '-', ''), ' ', '')) STORED;
+
+-- One worker per phone number. Existing duplicates stop the migration (a non-unique
+-- fallback would let new duplicates in); merge them, then re-run migrate.py.
+DO $$
+BEGIN
+    IF EXISTS (
+        SELECT 1 FROM workers
+        WHERE phone_normalized <> ''
+        GROUP BY phone_normalized HAVING COUNT(*) > 1
+    ) THEN
+        RAISE EXCEPTION 'workers has duplicate phone numbers'
+            USING HINT = 'List them with: SELECT phone_normalized, array_agg(id ORDER BY id) FROM workers '
+                         'WHERE phone_normalized <> '''' GROUP BY 1 HAVING COUNT(*) > 1; '
+                         'merge each group into one worker and re-run migrate.py.';
+    END IF;
+END $$;
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_workers_phone_normalized
+    ON workers(phone_normalized) WHERE phone_normalized <> '';
+
+-- users (database/schema.sql) exists only on Work OS installs
+DO $$
+BEGIN
+    IF to_regclass('users') IS NOT NULL THEN
+        ALTER TABLE users
+            ADD COLUMN IF NOT EXISTS phone_normalized TEXT
+            GENERATED ALWAYS AS (replace(replace(phone, '-', ''), ' ', '')) STORED;
+        CREATE INDEX IF NOT EXISTS idx_users_phone_normalized ON users(phone_normalized);
+    END IF;
+END $$;
@@ -0,0 +1,54 @@
+-- Migration: Precomputed daily check-in streaks and month bitmaps
+-- Description: Database.get_streak_days walked the last 30 daily_checkins rows on every call and
+-- check_perfect_attendance fetched the whole month. The daily check-in streak now lives in
+-- worker_streaks next to the attendance streak (separate columns, so the two never reset each
+-- other) and each month of check-ins is one bitmap row (bit N-1 = day N).
+-- Database.create_daily_checkin updates both in the same statement that inserts the check-in.
+
+ALTER TABLE worker_streaks
+    ADD COLUMN IF NOT EXISTS daily_current_streak INTEGER DEFAULT 0,
+    ADD COLUMN IF NOT EXISTS daily_longest_streak INTEGER DEFAULT 0,
+    ADD COLUMN IF NOT EXISTS daily_last_date DATE;
+
+CREATE TABLE IF NOT EXISTS daily_checkin_months (
+    worker_id INTEGER NOT NULL REFERENCES workers(id) ON DELETE CASCADE,
+    month DATE NOT NULL,               -- 해당 월 1일
+    days_bitmap INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (worker_id, month)
+);
+
+-- Backfill month bitmaps from existing check-ins
+INSERT INTO daily_checkin_months (worker_id, month, days_bitmap)
+SELECT worker_id,
+       date_trunc('month', check_date::date)::date,
+       bit_or(1 << (extract(day FROM check_date::date)::int - 1))
+FROM daily_checkins
+GROUP BY worker_id, date_trunc('month', check_date::date)
+ON CONFLICT (worker_id, month) DO UPDATE SET days_bitmap = EXCLUDED.days_bitmap;
+
+-- Backfill streaks: consecutive-day runs per worker (date - row_number is constant within a run)
+WITH days AS (
+    SELECT DISTINCT worker_id, check_date::date AS day FROM daily_checkins
+),
+runs AS (
+    SELECT worker_id, COUNT(*) AS length, MAX(day) AS last_day
+    FROM (
+        SELECT worker_id, day,
+               day - (ROW_NUMBER() OVER (PARTITION BY worker_id ORDER BY day))::int AS run
+        FROM days
+    ) d
+    GROUP BY worker_id, run
+),
+per_worker AS (
+    SELECT worker_id, MAX(length) AS longest, MAX(last_day) AS last_day
+    FROM runs
+    GROUP BY worker_id
+)
+INSERT INTO worker_streaks (worker_id, daily_current_streak, daily_longest_streak, daily_last_date)
+SELECT p.worker_id, r.length, p.longest, p.last_day
+FROM per_worker p
+JOIN runs r ON r.worker_id = p.worker_id AND r.last_day = p.last_day
+ON CONFLICT (worker_id) DO UPDATE SET
+    daily_current_streak = EXCLUDED.daily_current_streak,
+    daily_longest_streak = EXCLUDED.daily_longest_streak,
+    daily_last_date = EXCLUDED.daily_last_date;
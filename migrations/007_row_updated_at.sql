@@ -0,0 +1,33 @@
+-- Migration: Row change timestamps for incremental analytics export
+-- Description: src/analytics_export.py used GREATEST(business timestamps) as its incremental
+-- watermark. Those mix KST-naive application values with server CURRENT_TIMESTAMP defaults
+-- and miss status changes that set no timestamp. Every exported table now has an
+-- updated_at column set from the server clock by a trigger on every INSERT/UPDATE.
+
+CREATE OR REPLACE FUNCTION touch_updated_at()
+RETURNS TRIGGER AS $$
+BEGIN
+    -- 트랜잭션 시작 시각이 아닌 실제 기록 시각
+    NEW.updated_at := clock_timestamp();
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+ALTER TABLE attendance ADD COLUMN IF NOT EXISTS updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP;
+ALTER TABLE applications ADD COLUMN IF NOT EXISTS updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP;
+ALTER TABLE events ADD COLUMN IF NOT EXISTS updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP;
+ALTER TABLE worker_monthly_stats ADD COLUMN IF NOT EXISTS updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP;
+ALTER TABLE ai_matching_logs ADD COLUMN IF NOT EXISTS updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP;
+
+DO $$
+DECLARE
+    t TEXT;
+BEGIN
+    FOREACH t IN ARRAY ARRAY['attendance', 'applications', 'events', 'worker_monthly_stats', 'ai_matching_logs']
+    LOOP
+        EXECUTE format('DROP TRIGGER IF EXISTS trigger_touch_updated_at ON %I', t);
+        EXECUTE format('CREATE TRIGGER trigger_touch_updated_at BEFORE INSERT OR UPDATE ON %I '
+                       'FOR EACH ROW EXECUTE FUNCTION touch_updated_at()', t);
+        EXECUTE format('CREATE INDEX IF NOT EXISTS %I ON %I (updated_at)', 'idx_' || t || '_updated_at', t);
+    END LOOP;
+END $$;
@@ -34,14 +34,7 @@ fi
 
 # 5. DB 초기화
 echo "💾 데이터베이스 초기화 중..."
-python3 << EOF
-from src.db import Database
-import os
-
-db_path = os.getenv('DB_PATH', 'data/workproof.db')
-db = Database(db_path)
-print('✅ 데이터베이스 초기화 완료!')
-EOF
+python3 src/batch/migrate.py && echo '✅ 데이터베이스 초기화 완료!'
 
 # 6. 관리자 등록 (선택)
 echo ""
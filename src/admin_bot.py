@@ -1,6 +1,7 @@
 """
 관리자 봇 메인
 """
+import io
 import os
 import logging
 from dotenv import load_dotenv
@@ -14,12 +15,15 @@ from telegram.ext import (
     ContextTypes, ConversationHandler, filters
 )
 
-from db import Database
+from db import Database, ATTENDANCE_CHANNEL
 from parser import EventParser
 from utils import generate_short_code, generate_deep_link, generate_check_in_code, now_kst_str, now_kst, KST
-from payroll import PayrollExporter
+from payroll import PayrollExporter, workers_from_attendances
 from models import ApplicationStatus, EventStatus
 from chain import polygon_chain
+from notification_dispatcher import TelegramDispatcher
+from live_feed import ChannelHub
+from attendance_live import AttendanceLiveBoard
 
 # 로깅 설정 (한국 시간 UTC+9)
 import time
@@ -46,6 +50,12 @@ payroll_exporter = PayrollExporter(os.getenv('EXPORT_DIR', 'data/exports'))
 # 근무자 봇 인스턴스 (근무자에게 알림 발송용)
 worker_bot = Bot(token=os.getenv('WORKER_BOT_TOKEN'))
 
+# 근무자 알림 발송기 (notification_deliveries 큐를 근무자 봇으로 발송)
+notification_dispatcher = TelegramDispatcher(db, worker_bot)
+
+# 출석 현황 실시간 보드 (attendance_changes 구독)
+attendance_live_board = AttendanceLiveBoard(db, ChannelHub(db, ATTENDANCE_CHANNEL, "event_id"))
+
 # Conversation states
 (EVENT_TITLE, EVENT_DATE, EVENT_START_TIME, EVENT_END_TIME, EVENT_LOCATION, EVENT_PAY,
  EVENT_WORK_TYPE, EVENT_DRESS, EVENT_MANAGER, EVENT_CONFIRM,
@@ -1356,6 +1366,10 @@ async def app_list(update: Update, context: ContextTypes.DEFAULT_TYPE):
             button_text = f"{app['name']} {status_text}"
             keyboard.append([InlineKeyboardButton(button_text, callback_data=f"app_detail_{app['id']}")])
 
+        waiting = len(pending) + len([a for a in apps if a['status'] == 'WAITLIST'])
+        if waiting:
+            keyboard.append([InlineKeyboardButton(f"☑️ 일괄 처리 (대기 {waiting}명)",
+                                                  callback_data=f"app_bulk_{event_id}_0")])
         keyboard.append([InlineKeyboardButton("🔙 돌아가기", callback_data="manage_applications")])
 
     reply_markup = InlineKeyboardMarkup(keyboard)
@@ -1429,6 +1443,22 @@ async def app_detail(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
 
 # ===== 지원자 확정 =====
+def confirm_notification_text(event: dict, check_in_code: str) -> str:
+    """근무 확정 알림 메시지"""
+    return (
+        "✅ 근무 확정\n"
+        "━━━━━━━━━━━━━━━━━━━━\n\n"
+        f"📌 {event['title']}\n\n"
+        f"📅 {event['event_date']}\n"
+        f"⏰ {event['event_time']}\n"
+        f"📍 {event['location']}\n"
+        f"💰 {event['pay_amount']:,}원\n\n"
+        "━━━━━━━━━━━━━━━━━━━━\n\n"
+        f"🔐 출석 코드: {check_in_code}\n\n"
+        "당일 출근 시 위 코드를 입력해주세요."
+    )
+
+
 async def app_confirm(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """지원자 확정 처리"""
     query = update.callback_query
@@ -1453,33 +1483,29 @@ async def app_confirm(update: Update, context: ContextTypes.DEFAULT_TYPE):
         check_in_code=check_in_code
     )
 
-    # 근무자에게 알림 발송
+    # 근무자에게 알림 발송 (큐 등록 후 발송기가 처리)
     try:
         event = db.get_event(app['event_id'])
 
-        notification_text = (
-            "✅ 근무 확정\n"
-            "━━━━━━━━━━━━━━━━━━━━\n\n"
-            f"📌 {event['title']}\n\n"
-            f"📅 {event['event_date']}\n"
-            f"⏰ {event['event_time']}\n"
-            f"📍 {event['location']}\n"
-            f"💰 {event['pay_amount']:,}원\n\n"
-            "━━━━━━━━━━━━━━━━━━━━\n\n"
-            f"🔐 출석 코드: {check_in_code}\n\n"
-            "당일 출근 시 위 코드를 입력해주세요."
-        )
+        notification_text = confirm_notification_text(event, check_in_code)
 
-        await worker_bot.send_message(
+        # 발송 완료 시 applications.notified 표시
+        db.enqueue_notification(
+            worker_id=app['worker_id'],
+            notification_type="APPLICATION_CONFIRMED",
+            title="근무 확정",
+            message=f"'{event['title']}' 근무가 확정되었습니다. 출석 코드: {check_in_code}",
             chat_id=app['worker_telegram_id'],
-            text=notification_text
+            text=notification_text,
+            data=str(app['event_id']),
+            reference_type="application",
+            reference_id=app_id
         )
-
-        db.mark_application_notified(app_id)
-        logger.info(f"Notification sent to worker {app['worker_id']} for app {app_id}")
+        notification_dispatcher.wake()
+        logger.info(f"Notification queued for worker {app['worker_id']} for app {app_id}")
 
     except Exception as e:
-        logger.error(f"Failed to send notification: {e}")
+        logger.error(f"Failed to queue notification: {e}")
 
     keyboard = [[InlineKeyboardButton("← 메인", callback_data="main_menu")]]
     reply_markup = InlineKeyboardMarkup(keyboard)
@@ -1490,7 +1516,7 @@ async def app_confirm(update: Update, context: ContextTypes.DEFAULT_TYPE):
         f"👤 {app['worker_name']}\n"
         f"📌 {app['event_title']}\n"
         f"🔐 {check_in_code}\n\n"
-        "알림이 발송되었습니다.",
+        "근무자 알림이 발송 대기열에 등록되었습니다.",
         reply_markup=reply_markup
     )
 
@@ -1587,13 +1613,19 @@ async def app_unconfirm(update: Update, context: ContextTypes.DEFAULT_TYPE):
 관리자에게 문의하시기 바랍니다.
 """
 
-        await worker_bot.send_message(
+        db.enqueue_notification(
+            worker_id=app['worker_id'],
+            notification_type="APPLICATION_UNCONFIRMED",
+            title="확정 취소",
+            message=f"'{event['title']}' 확정이 취소되었습니다. 관리자에게 문의하시기 바랍니다.",
             chat_id=app['worker_telegram_id'],
-            text=notification_text
+            text=notification_text,
+            data=str(app['event_id'])
         )
-        logger.info(f"Unconfirm notification sent to worker {app['worker_id']} for app {app_id}")
+        notification_dispatcher.wake()
+        logger.info(f"Unconfirm notification queued for worker {app['worker_id']} for app {app_id}")
     except Exception as e:
-        logger.error(f"Failed to send unconfirm notification: {e}")
+        logger.error(f"Failed to queue unconfirm notification: {e}")
 
     keyboard = [
         [InlineKeyboardButton("🔙 지원자 상세", callback_data=f"app_detail_{app_id}")],
@@ -1634,6 +1666,174 @@ async def app_reject(update: Update, context: ContextTypes.DEFAULT_TYPE):
     await query.edit_message_text("❌ 불합격 처리되었습니다.")
 
 
+# ===== 지원자 일괄 처리 =====
+BULK_PAGE_SIZE = 20
+
+
+def _bulk_candidates(event_id: int) -> list:
+    """일괄 처리 대상 (대기/대기명단)"""
+    return [a for a in db.list_applications_by_event(event_id) if a['status'] in ('PENDING', 'WAITLIST')]
+
+
+def _bulk_selection(context: ContextTypes.DEFAULT_TYPE, event_id: int) -> set:
+    """행사별 선택 상태 (다른 행사로 바뀌면 초기화)"""
+    state = context.user_data.get('bulk_apps')
+    if not state or state['event_id'] != event_id:
+        state = {'event_id': event_id, 'selected': set()}
+        context.user_data['bulk_apps'] = state
+    return state['selected']
+
+
+async def _show_bulk_selection(query, context: ContextTypes.DEFAULT_TYPE, event_id: int, page: int):
+    """일괄 처리 선택 화면"""
+    event = db.get_event(event_id)
+    candidates = _bulk_candidates(event_id)
+    selected = _bulk_selection(context, event_id)
+    candidate_ids = {a['id'] for a in candidates}
+    selected &= candidate_ids
+
+    if not event or not candidates:
+        keyboard = [[InlineKeyboardButton("🔙 지원자 목록", callback_data=f"app_list_{event_id}")]]
+        await query.edit_message_text("처리할 대기 지원자가 없습니다.", reply_markup=InlineKeyboardMarkup(keyboard))
+        return
+
+    pages = (len(candidates) - 1) // BULK_PAGE_SIZE + 1
+    page = max(0, min(page, pages - 1))
+
+    text = (
+        f"☑️ {event['title']} ({event['event_date']}) - 일괄 처리\n\n"
+        f"대기 지원자: {len(candidates)}명\n"
+        f"선택: {len(selected)}명\n"
+        f"━━━━━━━━━━━━━━━━\n"
+        f"페이지 {page + 1}/{pages}"
+    )
+
+    keyboard = []
+    for app in candidates[page * BULK_PAGE_SIZE:(page + 1) * BULK_PAGE_SIZE]:
+        mark = "☑" if app['id'] in selected else "☐"
+        waitlist = " (대기명단)" if app['status'] == 'WAITLIST' else ""
+        keyboard.append([InlineKeyboardButton(f"{mark} {app['name']}{waitlist}",
+                                              callback_data=f"app_bulk_toggle_{app['id']}_{page}")])
+
+    nav = []
+    if page > 0:
+        nav.append(InlineKeyboardButton("◀ 이전", callback_data=f"app_bulk_{event_id}_{page - 1}"))
+    if page < pages - 1:
+        nav.append(InlineKeyboardButton("다음 ▶", callback_data=f"app_bulk_{event_id}_{page + 1}"))
+    if nav:
+        keyboard.append(nav)
+
+    keyboard.append([
+        InlineKeyboardButton("전체 선택", callback_data=f"app_bulk_all_{event_id}"),
+        InlineKeyboardButton("선택 해제", callback_data=f"app_bulk_none_{event_id}")
+    ])
+    if selected:
+        keyboard.append([InlineKeyboardButton(f"✅ 선택 확정 ({len(selected)}명)",
+                                              callback_data=f"app_bulk_confirm_{event_id}")])
+        keyboard.append([InlineKeyboardButton(f"❌ 선택 불합격 ({len(selected)}명)",
+                                              callback_data=f"app_bulk_reject_{event_id}")])
+    keyboard.append([InlineKeyboardButton("🔙 지원자 목록", callback_data=f"app_list_{event_id}")])
+
+    await query.edit_message_text(text, reply_markup=InlineKeyboardMarkup(keyboard))
+
+
+async def app_bulk(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """일괄 처리 화면 (페이지 이동)"""
+    query = update.callback_query
+    await query.answer()
+
+    event_id, page = map(int, query.data.replace('app_bulk_', '').split('_'))
+    await _show_bulk_selection(query, context, event_id, page)
+
+
+async def app_bulk_toggle(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """지원자 선택/해제"""
+    query = update.callback_query
+    await query.answer()
+
+    app_id, page = map(int, query.data.replace('app_bulk_toggle_', '').split('_'))
+    state = context.user_data.get('bulk_apps')
+    if not state:
+        app = db.get_application(app_id)
+        if not app:
+            await query.edit_message_text("❌ 지원 정보를 찾을 수 없습니다.")
+            return
+        state = {'event_id': app['event_id'], 'selected': set()}
+        context.user_data['bulk_apps'] = state
+
+    state['selected'] ^= {app_id}
+    await _show_bulk_selection(query, context, state['event_id'], page)
+
+
+async def app_bulk_select_all(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """전체 선택 / 선택 해제"""
+    query = update.callback_query
+    await query.answer()
+
+    select_all = query.data.startswith('app_bulk_all_')
+    event_id = int(query.data.replace('app_bulk_all_', '').replace('app_bulk_none_', ''))
+    selected = _bulk_selection(context, event_id)
+    selected.clear()
+    if select_all:
+        selected.update(a['id'] for a in _bulk_candidates(event_id))
+
+    await _show_bulk_selection(query, context, event_id, 0)
+
+
+async def app_bulk_apply(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """선택한 지원자 일괄 확정/불합격 (단일 트랜잭션)"""
+    query = update.callback_query
+    await query.answer()
+
+    confirm = query.data.startswith('app_bulk_confirm_')
+    event_id = int(query.data.replace('app_bulk_confirm_', '').replace('app_bulk_reject_', ''))
+    selected = _bulk_selection(context, event_id)
+    if not selected:
+        await _show_bulk_selection(query, context, event_id, 0)
+        return
+
+    if confirm:
+        rows = db.bulk_update_application_status(
+            sorted(selected), 'CONFIRMED',
+            changed_by=update.effective_user.id,
+            build_notification=lambda row: {
+                "worker_id": row['worker_id'],
+                "type": "APPLICATION_CONFIRMED",
+                "title": "근무 확정",
+                "message": f"'{row['event_title']}' 근무가 확정되었습니다. 출석 코드: {row['check_in_code']}",
+                "chat_id": row['worker_telegram_id'],
+                "text": confirm_notification_text({
+                    'title': row['event_title'], 'event_date': row['event_date'],
+                    'event_time': row['event_time'], 'location': row['location'],
+                    'pay_amount': row['pay_amount'] or 0
+                }, row['check_in_code']),
+                "data": str(row['event_id']),
+                "reference_type": "application",
+                "reference_id": row['id']
+            }
+        )
+        notification_dispatcher.wake()
+        result_text = f"✅ {len(rows)}명 확정 완료\n\n근무자 알림이 발송 대기열에 등록되었습니다."
+    else:
+        rows = db.bulk_update_application_status(
+            sorted(selected), 'REJECTED',
+            changed_by=update.effective_user.id,
+            rejection_reason='관리자 불합격 처리'
+        )
+        result_text = f"❌ {len(rows)}명 불합격 처리되었습니다."
+
+    logger.info(f"Bulk {'confirm' if confirm else 'reject'} for event {event_id}: "
+                f"{len(rows)}/{len(selected)} by {update.effective_user.id}")
+    context.user_data.pop('bulk_apps', None)
+
+    skipped = len(selected) - len(rows)
+    if skipped:
+        result_text += f"\n(이미 처리된 {skipped}명 제외)"
+
+    keyboard = [[InlineKeyboardButton("🔙 지원자 목록", callback_data=f"app_list_{event_id}")]]
+    await query.edit_message_text(result_text, reply_markup=InlineKeyboardMarkup(keyboard))
+
+
 # ===== 근무자 관리 =====
 async def manage_workers(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """근무자 관리 - 전체 근무자 목록"""
@@ -1812,6 +2012,7 @@ async def attendance_list(update: Update, context: ContextTypes.DEFAULT_TYPE):
             button_text = f"{att['worker_name']} {status_text}"
             keyboard.append([InlineKeyboardButton(button_text, callback_data=f"attendance_detail_{att['id']}")])
 
+        keyboard.append([InlineKeyboardButton("🔴 실시간 보기", callback_data=f"attendance_live_{event_id}")])
         keyboard.append([InlineKeyboardButton("🔙 돌아가기", callback_data="manage_attendance")])
         keyboard.append([InlineKeyboardButton("🏠 메인 메뉴", callback_data="main_menu")])
 
@@ -1823,6 +2024,37 @@ async def attendance_list(update: Update, context: ContextTypes.DEFAULT_TYPE):
     )
 
 
+async def attendance_live(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """출석 현황 실시간 보드 (변경 시 메시지 자동 갱신)"""
+    query = update.callback_query
+    await query.answer()
+
+    event_id = int(query.data.replace('attendance_live_', ''))
+    event = db.get_event(event_id)
+    if not event:
+        await query.edit_message_text("❌ 행사를 찾을 수 없습니다.")
+        return
+
+    message = await context.bot.send_message(
+        chat_id=query.message.chat_id,
+        text=f"🔴 {event['title']} - 실시간 출석 현황\n\n불러오는 중..."
+    )
+    await attendance_live_board.watch(context.bot, event_id, event['title'],
+                                      message.chat_id, message.message_id)
+
+
+async def attendance_live_stop(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """실시간 보드 종료"""
+    query = update.callback_query
+    await query.answer()
+
+    event_id = int(query.data.replace('attendance_live_stop_', ''))
+    attendance_live_board.unwatch(event_id, query.message.chat_id, query.message.message_id)
+
+    keyboard = [[InlineKeyboardButton("🔙 출석 현황", callback_data=f"attendance_list_{event_id}")]]
+    await query.edit_message_reply_markup(reply_markup=InlineKeyboardMarkup(keyboard))
+
+
 async def attendance_detail(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """출석 상세 정보 및 수동 처리"""
     query = update.callback_query
@@ -1938,17 +2170,23 @@ async def manual_checkin(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
     await query.answer("✅ 출석 처리 완료!", show_alert=True)
 
-    # 근무자에게 알림 전송 (근무자 봇으로)
+    # 근무자에게 알림 전송 (근무자 봇 발송 큐)
     try:
-        await worker_bot.send_message(
+        db.enqueue_notification(
+            worker_id=att['worker_id'],
+            notification_type="CHECK_IN",
+            title="출근 완료",
+            message=f"'{event_title}' 출근 처리되었습니다. ({now})",
             chat_id=worker_telegram_id,
             text=f"✅ 출근완료 알림\n\n"
                  f"📋 행사: {event_title}\n"
                  f"⏰ 출근시간: {now}\n\n"
-                 f"근무를 시작해주세요!"
+                 f"근무를 시작해주세요!",
+            data=str(event_id)
         )
+        notification_dispatcher.wake()
     except Exception as e:
-        logger.error(f"Failed to send check-in notification to worker {worker_name}: {e}")
+        logger.error(f"Failed to queue check-in notification to worker {worker_name}: {e}")
 
     # 기존 메시지 삭제
     try:
@@ -2108,19 +2346,25 @@ async def manual_checkout(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
     await query.answer(f"🎉 퇴근 처리 완료!{blockchain_msg}", show_alert=True)
 
-    # 근무자에게 알림 전송 (근무자 봇으로)
+    # 근무자에게 알림 전송 (근무자 봇 발송 큐)
     try:
-        await worker_bot.send_message(
+        db.enqueue_notification(
+            worker_id=worker_id,
+            notification_type="CHECK_OUT",
+            title="퇴근 완료",
+            message=f"'{event_title}' 퇴근 처리되었습니다. 지급예정액: {net_pay:,}원",
             chat_id=worker_telegram_id,
             text=f"🎉 퇴근완료 알림\n\n"
                  f"📋 행사: {event_title}\n"
                  f"⏰ 출근시간: {check_in_time}\n"
                  f"⏰ 퇴근시간: {now}\n"
                  f"💰 지급예정액: {net_pay:,}원 (3.3% 공제 후)\n\n"
-                 f"수고하셨습니다!"
+                 f"수고하셨습니다!",
+            data=str(event_id)
         )
+        notification_dispatcher.wake()
     except Exception as e:
-        logger.error(f"Failed to send check-out notification to worker {worker_name}: {e}")
+        logger.error(f"Failed to queue check-out notification to worker {worker_name}: {e}")
 
     # 기존 메시지 삭제
     try:
@@ -2230,11 +2474,20 @@ async def export_payroll(update: Update, context: ContextTypes.DEFAULT_TYPE):
         # 모든 행사 조회
         events = db.list_events(limit=10)
 
+    # 월 정산 (이번 달 / 지난 달)
+    from datetime import timedelta
+    this_month = now_kst().replace(day=1)
+    last_month = (this_month - timedelta(days=1)).replace(day=1)
+    keyboard = [[
+        InlineKeyboardButton(f"📅 {this_month:%Y-%m} 월 정산", callback_data=f"export_month_{this_month:%Y%m}"),
+        InlineKeyboardButton(f"📅 {last_month:%Y-%m} 월 정산", callback_data=f"export_month_{last_month:%Y%m}"),
+    ]]
+
     if not events:
-        await query.edit_message_text("💰 다운로드할 행사가 없습니다.")
+        keyboard.append([InlineKeyboardButton("🏠 메인 메뉴", callback_data="main_menu")])
+        await query.edit_message_text("💰 다운로드할 행사가 없습니다.", reply_markup=InlineKeyboardMarkup(keyboard))
         return
 
-    keyboard = []
     for event in events:
         button_text = f"{event['short_code']} - {event['title']}"
         keyboard.append([InlineKeyboardButton(button_text, callback_data=f"export_{event['id']}")])
@@ -2242,7 +2495,58 @@ async def export_payroll(update: Update, context: ContextTypes.DEFAULT_TYPE):
     keyboard.append([InlineKeyboardButton("🏠 메인 메뉴", callback_data="main_menu")])
     reply_markup = InlineKeyboardMarkup(keyboard)
 
-    await query.edit_message_text("💰 엑셀 다운로드할 행사를 선택하세요:", reply_markup=reply_markup)
+    await query.edit_message_text("💰 엑셀 다운로드할 행사 또는 월 정산을 선택하세요:", reply_markup=reply_markup)
+
+
+async def export_month_payroll(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """월 급여 정산 엑셀 + 은행 대량이체 파일 전송 (모든 행사, 근무자·계좌별 합계)"""
+    query = update.callback_query
+    await query.answer("정산 파일 생성 중...")
+
+    period = query.data.replace('export_month_', '')
+    year, month = int(period[:4]), int(period[4:])
+    label = f"{year}-{month:02d}"
+    keyboard = [[InlineKeyboardButton("🏠 처음으로", callback_data="main_menu")]]
+    reply_markup = InlineKeyboardMarkup(keyboard)
+
+    try:
+        # 근무자 단위로 집계된 행이라 월 전체도 작음 (엑셀/이체 파일에 같이 사용)
+        rows = list(db.iter_period_payroll(year=year, month=month))
+        if not rows:
+            await query.edit_message_text(f"❌ {label} 퇴근 완료 기록이 없습니다.", reply_markup=reply_markup)
+            return
+
+        excel = io.BytesIO()
+        payroll_exporter.write_period_payroll(excel, label, rows)
+        excel.seek(0)
+        transfer = io.BytesIO()
+        transfer_count, skipped = payroll_exporter.write_bank_transfer(transfer, rows, memo=f"{month}월 급여")
+        transfer.seek(0)
+
+        total_net = sum(row['net_pay'] for row in rows)
+        await context.bot.send_document(
+            chat_id=update.effective_user.id,
+            document=excel,
+            filename=payroll_exporter.period_filename(label),
+            caption=f"💰 {label} 급여 정산\n\n"
+                    f"{len(rows)}명 / 실지급 합계 {total_net:,}원"
+        )
+        await context.bot.send_document(
+            chat_id=update.effective_user.id,
+            document=transfer,
+            filename=payroll_exporter.period_filename(label, "bank"),
+            caption=f"🏦 대량이체 {transfer_count}건"
+        )
+
+        text = f"✅ {label} 정산 파일이 생성되었습니다!\n\n👥 인원: {len(rows)}명\n🏦 이체: {transfer_count}건"
+        if skipped:
+            names = ", ".join(row.get('name') or str(row['worker_id']) for row in skipped[:10])
+            text += f"\n\n⚠️ 계좌 정보 누락으로 이체 제외 {len(skipped)}명: {names}"
+        await query.edit_message_text(text, reply_markup=reply_markup)
+
+    except Exception as e:
+        logger.error(f"Failed to export month payroll: {e}")
+        await query.edit_message_text(f"❌ 정산 파일 생성 실패: {str(e)}", reply_markup=reply_markup)
 
 
 async def export_event_payroll(update: Update, context: ContextTypes.DEFAULT_TYPE):
@@ -2266,33 +2570,24 @@ async def export_event_payroll(update: Update, context: ContextTypes.DEFAULT_TYP
         await query.edit_message_text("❌ 출석 기록이 없습니다.", reply_markup=reply_markup)
         return
 
-    # 근무자 정보 조회 (attendance에 이미 worker 정보가 join되어 있음)
-    workers = {}
-    for att in attendances:
-        workers[att['worker_id']] = {
-            'name': att['worker_name'],
-            'phone': att['phone'],
-            'birth_date': att.get('birth_date'),
-            'bank_name': att.get('bank_name'),
-            'bank_account': att.get('bank_account'),
-            'residence': att.get('residence'),
-            'face_photo_file_id': att.get('face_photo_file_id'),
-            'driver_license': att.get('driver_license'),
-            'security_cert': att.get('security_cert')
-        }
+    # 근무자 정보 (attendance에 이미 worker 정보가 join되어 있음)
+    workers = workers_from_attendances(attendances)
 
     try:
-        # 엑셀 생성
-        filepath = payroll_exporter.generate_event_payroll(event, attendances, workers)
+        # 엑셀 생성 (메모리에 작성 후 바로 전송, 파일 저장 없음)
+        filename = payroll_exporter.payroll_filename(event)
+        buffer = io.BytesIO()
+        payroll_exporter.write_event_payroll(buffer, event, attendances, workers)
+        buffer.seek(0)
 
         # 파일 전송
-        with open(filepath, 'rb') as f:
-            await context.bot.send_document(
-                chat_id=update.effective_user.id,
-                document=f,
-                caption=f"💰 {event['title']} 급여 명세서\n\n"
-                        f"총 {len(attendances)}명"
-            )
+        await context.bot.send_document(
+            chat_id=update.effective_user.id,
+            document=buffer,
+            filename=filename,
+            caption=f"💰 {event['title']} 급여 명세서\n\n"
+                    f"총 {len(attendances)}명"
+        )
 
         # DB에 기록
         # (payroll_exports 테이블에 저장 - 선택 사항)
@@ -2304,7 +2599,7 @@ async def export_event_payroll(update: Update, context: ContextTypes.DEFAULT_TYP
             f"✅ 엑셀 파일이 생성되었습니다!\n\n"
             f"📋 행사: {event['title']}\n"
             f"👥 인원: {len(attendances)}명\n"
-            f"📂 파일: {os.path.basename(filepath)}",
+            f"📂 파일: {filename}",
             reply_markup=reply_markup
         )
 
@@ -2709,8 +3004,11 @@ def main():
         logger.error("ADMIN_BOT_TOKEN not found in environment variables")
         return
 
-    # Application 생성
-    application = Application.builder().token(token).build()
+    # Application 생성 (봇 시작 시 근무자 알림 발송기도 함께 시작)
+    async def start_dispatcher(app: Application):
+        notification_dispatcher.start()
+
+    application = Application.builder().token(token).post_init(start_dispatcher).build()
 
     # Conversation handler: 행사 등록
     event_conv = ConversationHandler(
@@ -2843,16 +3141,23 @@ def main():
     application.add_handler(CallbackQueryHandler(app_waitlist, pattern="^app_waitlist_\d+$"))
     application.add_handler(CallbackQueryHandler(app_reject, pattern="^app_reject_\d+$"))
     application.add_handler(CallbackQueryHandler(app_unconfirm, pattern="^app_unconfirm_\d+$"))
+    application.add_handler(CallbackQueryHandler(app_bulk, pattern="^app_bulk_\d+_\d+$"))
+    application.add_handler(CallbackQueryHandler(app_bulk_toggle, pattern="^app_bulk_toggle_\d+_\d+$"))
+    application.add_handler(CallbackQueryHandler(app_bulk_select_all, pattern="^app_bulk_(all|none)_\d+$"))
+    application.add_handler(CallbackQueryHandler(app_bulk_apply, pattern="^app_bulk_(confirm|reject)_\d+$"))
     application.add_handler(CallbackQueryHandler(manage_workers, pattern="^manage_workers$"))
     application.add_handler(CallbackQueryHandler(worker_detail, pattern="^worker_detail_\d+$"))
     application.add_handler(CallbackQueryHandler(manage_attendance, pattern="^manage_attendance$"))
     application.add_handler(CallbackQueryHandler(attendance_list, pattern="^attendance_list_\d+$"))
+    application.add_handler(CallbackQueryHandler(attendance_live, pattern="^attendance_live_\d+$"))
+    application.add_handler(CallbackQueryHandler(attendance_live_stop, pattern="^attendance_live_stop_\d+$"))
     application.add_handler(CallbackQueryHandler(attendance_detail, pattern="^attendance_detail_\d+$"))
     application.add_handler(CallbackQueryHandler(manual_checkin, pattern="^manual_checkin_\d+$"))
     application.add_handler(CallbackQueryHandler(manual_checkout, pattern="^manual_checkout_\d+$"))
     application.add_handler(CallbackQueryHandler(view_worker_photo, pattern="^view_worker_photo_\d+$"))
     application.add_handler(CallbackQueryHandler(export_payroll, pattern="^export_payroll$"))
     application.add_handler(CallbackQueryHandler(export_event_payroll, pattern="^export_\d+$"))
+    application.add_handler(CallbackQueryHandler(export_month_payroll, pattern="^export_month_\d{6}$"))
 
     # 봇 실행
     logger.info("Admin bot started")
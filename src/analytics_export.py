@@ -0,0 +1,210 @@
+"""
+분석용 대량 내보내기 (CSV / Parquet)
+
+Postgres COPY로 테이블을 그대로 흘려 파일에 기록한다. 행을 파이썬 dict로 만들지 않으므로
+1년치 출석도 메모리 사용이 일정하다.
+- 기간: 생성 시각 기준 date_from ~ date_to
+- 증분: 마지막 내보내기 이후 변경된 행만. 변경 시각은 트리거가 서버 시계로 기록하는
+  updated_at(migrations/007)이고, 워터마크 직전에 시작해 늦게 커밋된 트랜잭션을 놓치지 않도록
+  INCREMENTAL_OVERLAP만큼 겹쳐 읽는다. 겹친 구간과 수정된 행은 여러 파일에 나오므로
+  분석 쪽에서 id 기준 최신 파일(updated_at)을 사용한다. 겹침 시간보다 오래 열린 트랜잭션의 변경은
+  누락될 수 있다.
+- Parquet는 pyarrow가 설치된 경우에만 지원 (COPY CSV를 파이프로 받아 배치 단위 변환)
+"""
+import json
+import logging
+import os
+import threading
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+from psycopg2 import sql
+from psycopg2.extensions import ISOLATION_LEVEL_REPEATABLE_READ
+
+from db import Database
+
+logger = logging.getLogger(__name__)
+
+# 테이블별 생성 시각(기간 필터) / 변경 시각(증분 워터마크, 트리거 관리) 컬럼 표현식
+EXPORT_TABLES = {
+    "attendance": {"created": "created_at", "changed": "updated_at"},
+    "applications": {"created": "applied_at", "changed": "updated_at"},
+    "events": {"created": "created_at", "changed": "updated_at"},
+    "worker_monthly_stats": {"created": "make_date(year, month, 1)", "changed": "updated_at"},
+    "ai_matching_logs": {"created": "created_at", "changed": "updated_at"},
+}
+
+# 증분 내보내기 시 지난 워터마크보다 앞당겨 다시 읽는 시간 (늦게 커밋된 변경 대비)
+INCREMENTAL_OVERLAP = timedelta(minutes=10)
+
+FORMATS = ("csv", "parquet")
+
+STATE_FILE = ".export_state.json"
+
+# Parquet 변환 시 CSV 읽기 블록 크기 (= 대략적인 row group 크기)
+PARQUET_BLOCK_SIZE = 8 * 1024 * 1024
+
+
+def build_query(table: str, date_from: Optional[date] = None, date_to: Optional[date] = None,
+                since: Optional[datetime] = None) -> sql.Composed:
+    """내보낼 SELECT (id 순서), 조건 값은 리터럴로 포함 (COPY는 파라미터를 받지 않음)"""
+    spec = EXPORT_TABLES[table]
+    created, changed = sql.SQL(spec["created"]), sql.SQL(spec["changed"])
+    conditions = []
+    if date_from:
+        conditions.append(sql.SQL("{} >= {}").format(created, sql.Literal(date_from)))
+    if date_to:
+        # date_to 당일 포함
+        conditions.append(sql.SQL("{} < {}::date + 1").format(created, sql.Literal(date_to)))
+    if since:
+        conditions.append(sql.SQL("{} > {}").format(changed, sql.Literal(since)))
+
+    query = sql.SQL("SELECT * FROM {}").format(sql.Identifier(table))
+    if conditions:
+        query += sql.SQL(" WHERE ") + sql.SQL(" AND ").join(conditions)
+    return query + sql.SQL(" ORDER BY id")
+
+
+def _copy_sql(query: sql.Composed) -> sql.Composed:
+    return sql.SQL("COPY ({}) TO STDOUT WITH (FORMAT csv, HEADER true)").format(query)
+
+
+def copy_csv(db: Database, fileobj, table: str, date_from: Optional[date] = None,
+             date_to: Optional[date] = None, since: Optional[datetime] = None):
+    """테이블을 CSV로 fileobj에 기록 (API 스트리밍용, 워터마크 없음)"""
+    with db.get_connection() as conn:
+        conn.set_session(readonly=True)
+        cursor = conn.cursor()
+        cursor.copy_expert(_copy_sql(build_query(table, date_from, date_to, since)).as_string(conn), fileobj)
+
+
+# ===== Parquet =====
+def _arrow_types(cursor, query: sql.Composed) -> Dict:
+    """쿼리 결과 컬럼의 pyarrow 타입 (Postgres 타입 OID 기준, 나머지는 문자열)"""
+    import pyarrow as pa
+
+    by_oid = {
+        16: pa.bool_(),
+        20: pa.int64(), 21: pa.int64(), 23: pa.int64(),
+        700: pa.float64(), 701: pa.float64(), 1700: pa.float64(),
+        1082: pa.date32(),
+        1114: pa.timestamp("us"),
+    }
+    cursor.execute(sql.SQL("SELECT * FROM ({}) t LIMIT 0").format(query))
+    return {col.name: by_oid.get(col.type_code, pa.string()) for col in cursor.description}
+
+
+def _copy_parquet(conn, cursor, query: sql.Composed, path: str) -> int:
+    """COPY CSV를 파이프로 받아 Parquet로 변환, 행 수 반환"""
+    import pyarrow.csv as pacsv
+    import pyarrow.parquet as pq
+
+    column_types = _arrow_types(cursor, query)
+    copy_sql = _copy_sql(query).as_string(conn)
+    read_fd, write_fd = os.pipe()
+    errors: List[BaseException] = []
+
+    def produce():
+        try:
+            with os.fdopen(write_fd, "wb") as out:
+                cursor.copy_expert(copy_sql, out)
+        except BaseException as e:
+            errors.append(e)
+
+    thread = threading.Thread(target=produce, name="analytics-copy", daemon=True)
+    thread.start()
+    rows = 0
+    try:
+        with os.fdopen(read_fd, "rb") as source:
+            reader = pacsv.open_csv(
+                source,
+                read_options=pacsv.ReadOptions(block_size=PARQUET_BLOCK_SIZE),
+                convert_options=pacsv.ConvertOptions(
+                    column_types=column_types,
+                    true_values=["t"], false_values=["f"],
+                    # COPY: NULL은 빈 값, 빈 문자열은 ""
+                    strings_can_be_null=True, quoted_strings_can_be_null=False,
+                ),
+            )
+            with pq.ParquetWriter(path, reader.schema, compression="zstd") as writer:
+                for batch in reader:
+                    writer.write_batch(batch)
+                    rows += batch.num_rows
+    finally:
+        thread.join()
+    if errors:
+        raise errors[0]
+    return rows
+
+
+# ===== 파일 내보내기 (배치) =====
+def _load_state(out_dir: str) -> Dict[str, str]:
+    path = os.path.join(out_dir, STATE_FILE)
+    if not os.path.exists(path):
+        return {}
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _save_state(out_dir: str, state: Dict[str, str]):
+    path = os.path.join(out_dir, STATE_FILE)
+    with open(path + ".tmp", "w", encoding="utf-8") as f:
+        json.dump(state, f, ensure_ascii=False, indent=2)
+    os.replace(path + ".tmp", path)
+
+
+def export_table(db: Database, table: str, out_dir: str, fmt: str = "csv",
+                 date_from: Optional[date] = None, date_to: Optional[date] = None,
+                 incremental: bool = False) -> Tuple[Optional[str], int]:
+    """
+    테이블 하나를 파일로 내보내기
+
+    증분 모드는 워터마크 조회와 COPY를 같은 스냅샷(REPEATABLE READ)에서 실행하고,
+    지난 워터마크 - INCREMENTAL_OVERLAP 이후 변경분을 읽는다 (겹친 행은 중복 출력).
+
+    Returns:
+        tuple: (파일 경로, 행 수) - 증분에서 변경이 없으면 (None, 0)
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"지원하지 않는 형식: {fmt}")
+    os.makedirs(out_dir, exist_ok=True)
+    state = _load_state(out_dir) if incremental else {}
+    last_watermark = datetime.fromisoformat(state[table]) if state.get(table) else None
+    since = last_watermark - INCREMENTAL_OVERLAP if last_watermark else None
+
+    query = build_query(table, date_from, date_to, since)
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    path = os.path.join(out_dir, f"{table}_{timestamp}.{fmt}")
+    partial = path + ".part"
+
+    with db.get_connection() as conn:
+        conn.set_session(isolation_level=ISOLATION_LEVEL_REPEATABLE_READ, readonly=True)
+        cursor = conn.cursor()
+
+        watermark = None
+        if incremental:
+            cursor.execute(sql.SQL("SELECT max({}) FROM ({}) t").format(
+                sql.SQL(EXPORT_TABLES[table]["changed"]), build_query(table, date_from, date_to, since)
+            ))
+            watermark = cursor.fetchone()[0]
+            if watermark is None or (last_watermark and watermark <= last_watermark):
+                return None, 0
+
+        try:
+            if fmt == "parquet":
+                rows = _copy_parquet(conn, cursor, query, partial)
+            else:
+                with open(partial, "wb") as f:
+                    cursor.copy_expert(_copy_sql(query).as_string(conn), f)
+                rows = cursor.rowcount
+        except BaseException:
+            if os.path.exists(partial):
+                os.remove(partial)
+            raise
+
+    os.replace(partial, path)
+    if watermark is not None:
+        state[table] = watermark.isoformat()
+        _save_state(out_dir, state)
+    logger.info(f"Analytics export: {table} -> {path} ({rows} rows)")
+    return path, rows
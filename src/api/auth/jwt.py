@@ -61,7 +61,8 @@ def decode_token(token: str) -> dict:
     return payload
 
 
-def create_access_token(telegram_id: int, username: str = "", role: str = "worker") -> str:
+def create_access_token(telegram_id: int, username: str = "", role: str = "worker",
+                        worker_id: int | None = None) -> str:
     """
     사용자 액세스 토큰 생성
 
@@ -69,13 +70,17 @@ def create_access_token(telegram_id: int, username: str = "", role: str = "worke
         telegram_id: 텔레그램 사용자 ID
         username: 텔레그램 username
         role: 사용자 역할 (worker/admin)
+        worker_id: 근무자 ID (발급 시점에 알면 포함, 요청마다 근무자 조회 생략)
 
     Returns:
         JWT 토큰
     """
-    return create_token({
+    data = {
         "telegram_id": telegram_id,
         "username": username,
         "role": role,
         "type": "access"
-    })
+    }
+    if worker_id:
+        data["worker_id"] = worker_id
+    return create_token(data)
@@ -0,0 +1,100 @@
+"""인증 주체 캐시 (require_worker / require_admin)
+
+토큰 주체별로 근무자 정보와 관리자 여부를 AUTH_CACHE_SECONDS 동안 프로세스 메모리에 보관한다.
+worker_id가 들어 있는 토큰은 ID 조회 1회, 캐시 적중 시에는 DB 조회가 없다.
+근무자 정보/관리자 권한을 바꾸는 API는 invalidate_worker / invalidate_admins를 호출해야 하며,
+봇 등 다른 프로세스에서 바뀐 내용은 TTL 이내에 반영된다.
+"""
+import time
+from typing import Dict, Hashable, Optional, Tuple
+
+from ..config import get_settings
+from db import Database
+
+# 보관할 최대 주체 수 (초과 시 만료 항목부터 정리)
+MAX_ENTRIES = 10000
+
+_workers: Dict[Hashable, Tuple[float, dict]] = {}
+_admins: Dict[Tuple[int, str], Tuple[float, bool]] = {}
+
+
+def _get(cache: dict, key):
+    entry = cache.get(key)
+    if entry and entry[0] > time.monotonic():
+        return entry[1]
+    return None
+
+
+def _put(cache: dict, key, value):
+    now = time.monotonic()
+    if len(cache) >= MAX_ENTRIES:
+        for stale in [k for k, (expires, _) in cache.items() if expires <= now]:
+            cache.pop(stale, None)
+        if len(cache) >= MAX_ENTRIES:
+            cache.clear()
+    cache[key] = (now + get_settings().AUTH_CACHE_SECONDS, value)
+
+
+def _worker_key(user: dict) -> Hashable:
+    """토큰 주체 키 (worker_id가 있으면 그것, 없으면 토큰의 식별 정보 조합)"""
+    if user.get("worker_id"):
+        return user["worker_id"]
+    return ("subject", user.get("telegram_id"), user.get("phone"), user.get("user_id") or user.get("sub"))
+
+
+def _lookup_worker(user: dict, db: Database) -> Optional[dict]:
+    worker_id = user.get("worker_id")
+    if worker_id:
+        return db.get_worker_by_id(worker_id)
+
+    # worker_id가 없는 이전 토큰: telegram_id → phone → user_id 순으로 조회
+    worker = None
+    telegram_id = user.get("telegram_id")
+    if telegram_id:
+        worker = db.get_worker_by_telegram_id(telegram_id)
+    if not worker and user.get("phone"):
+        worker = db.get_worker_by_phone(user["phone"])
+    if not worker:
+        user_id = user.get("user_id") or user.get("sub")
+        if user_id:
+            worker = db.get_worker_by_user_id(user_id)
+    return worker
+
+
+def resolve_worker(user: dict, db: Database) -> Optional[dict]:
+    """토큰 페이로드의 근무자 (캐시, 호출자가 수정해도 되도록 복사본 반환)"""
+    key = _worker_key(user)
+    worker = _get(_workers, key)
+    if worker is None:
+        worker = _lookup_worker(user, db)
+        if worker is None:
+            return None
+        _put(_workers, key, worker)
+    return dict(worker)
+
+
+def resolve_admin(user: dict, db: Database) -> bool:
+    """관리자 여부 (캐시, 환경변수 ADMIN_IDS는 캐시 없이 확인)"""
+    telegram_id = user.get("telegram_id") or 0
+    username = user.get("username") or ""
+    if telegram_id in get_settings().admin_ids:
+        return True
+
+    key = (telegram_id, username)
+    is_admin = _get(_admins, key)
+    if is_admin is None:
+        is_admin = db.is_admin_principal(telegram_id, username)
+        _put(_admins, key, is_admin)
+    return is_admin
+
+
+def invalidate_worker(worker_id: int):
+    """근무자 정보 변경 후 호출 (해당 근무자의 모든 캐시 항목 삭제)"""
+    for key, (_, worker) in list(_workers.items()):
+        if worker.get("id") == worker_id:
+            _workers.pop(key, None)
+
+
+def invalidate_admins():
+    """관리자 권한 변경 후 호출"""
+    _admins.clear()
@@ -23,6 +23,7 @@ class Settings(BaseSettings):
     JWT_SECRET: str = "workproof_jwt_secret_change_in_production"
     JWT_ALGORITHM: str = "HS256"
     JWT_EXPIRE_MINUTES: int = 60 * 24 * 7  # 7일
+    AUTH_CACHE_SECONDS: float = 30.0  # 인증 주체(근무자/관리자 여부) 캐시
 
     # Telegram
     ADMIN_BOT_TOKEN: str = ""
@@ -45,8 +46,27 @@ class Settings(BaseSettings):
     SMTP_USER: str = ""
     SMTP_PASSWORD: str = ""
     SMTP_FROM_NAME: str = "WorkProof"
+    SMTP_FROM_EMAIL: str = ""  # 비어 있으면 SMTP_USER
+    SMTP_STARTTLS: bool = True  # False: 인증/TLS 없는 로컬 SMTP (개발용 mailpit 등)
+    SMTP_TIMEOUT: int = 10
+    SMTP_IDLE_TIMEOUT: int = 60  # 유휴 SMTP 세션 종료 (초)
+    EMAIL_MAX_ATTEMPTS: int = 4
+    EMAIL_BACKEND: str = "smtp"  # smtp | memory (테스트용: 발송 대신 메모리 보관)
     EMAIL_VERIFICATION_EXPIRE_MINUTES: int = 3
 
+    # PDF (증명서/지급명세서)
+    PDF_RENDER_WORKERS: int = 2  # 0이면 프로세스 풀 대신 스레드 풀 사용
+    PDF_CACHE_DIR: str = "data/pdf_cache"
+    PDF_CACHE_RETENTION_DAYS: int = 7  # 캐시 PDF 보존 기간 (batch/prune_pdf_cache.py)
+    BULK_EXPORT_DIR: str = "data/bulk_exports"
+
+    # GPS 위치 수집
+    LOCATION_FLUSH_INTERVAL: float = 2.0  # 버퍼 저장 주기 (초)
+    LOCATION_HISTORY_INTERVAL: int = 120  # 근무자별 이력 샘플 간격 (초)
+    LOCATION_BUFFER_MAX: int = 5000  # 이 이상 쌓이면 주기 전에 저장
+    LOCATION_RETENTION_DAYS: int = 30  # 위치 이력 보존 기간 (batch/prune_locations.py)
+    GPS_BOARD_CACHE_SECONDS: float = 3.0  # 행사 당일 GPS 보드 캐시 (행사별)
+
     # CORS
     CORS_ORIGINS: list[str] = [
         "http://localhost:5173",
@@ -61,6 +81,16 @@ class Settings(BaseSettings):
         """DB 전체 경로 반환"""
         return os.path.join(BASE_DIR, self.DB_PATH)
 
+    @property
+    def pdf_cache_path(self) -> str:
+        """PDF 캐시 디렉토리 전체 경로"""
+        return os.path.join(BASE_DIR, self.PDF_CACHE_DIR)
+
+    @property
+    def bulk_export_path(self) -> str:
+        """일괄 발급 ZIP 디렉토리 전체 경로"""
+        return os.path.join(BASE_DIR, self.BULK_EXPORT_DIR)
+
     @property
     def admin_ids(self) -> list[int]:
         """관리자 ID 목록"""
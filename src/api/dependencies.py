@@ -4,7 +4,7 @@ import os
 from functools import lru_cache
 from typing import Annotated
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Query, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 
 # 프로젝트 src 경로 추가
@@ -12,6 +12,7 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from db import Database
 from .config import get_settings, Settings
+from .auth import principal
 from .auth.jwt import decode_token
 
 security = HTTPBearer(auto_error=False)
@@ -70,48 +71,47 @@ async def require_worker(
     user: dict = Depends(require_auth),
     db: Database = Depends(get_db)
 ) -> dict:
-    """등록된 근무자 필수"""
-    worker = None
-
-    # 1. telegram_id로 찾기
-    telegram_id = user.get("telegram_id")
-    if telegram_id:
-        worker = db.get_worker_by_telegram_id(telegram_id)
-
-    # 2. phone으로 찾기
-    if not worker:
-        phone = user.get("phone")
-        if phone:
-            worker = db.get_worker_by_phone(phone)
-
-    # 3. user_id로 연결된 worker 찾기
-    if not worker:
-        user_id = user.get("user_id") or user.get("sub")
-        if user_id:
-            worker = db.get_worker_by_user_id(user_id)
-
+    """등록된 근무자 필수 (토큰의 worker_id 우선, 결과는 principal 캐시)"""
+    worker = principal.resolve_worker(user, db)
     if not worker:
         raise HTTPException(status_code=403, detail="등록된 근무자가 아닙니다")
 
     return {"user": user, "worker": worker}
 
 
+async def require_worker_stream(
+    credentials: Annotated[HTTPAuthorizationCredentials | None, Depends(security)],
+    token: str | None = Query(None, description="EventSource용 액세스 토큰 (헤더를 보낼 수 없는 경우)"),
+    db: Database = Depends(get_db)
+) -> dict:
+    """등록된 근무자 필수 (Authorization 헤더 또는 ?token=)"""
+    if not credentials and token:
+        credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+    user = await require_auth(credentials)
+    return await require_worker(user, db)
+
+
 async def require_admin(
     user: dict = Depends(require_auth),
     db: Database = Depends(get_db),
     settings: Settings = Depends(get_settings)
 ) -> dict:
     """관리자 권한 필수"""
-    telegram_id = user.get("telegram_id", 0)
-    username = user.get("username", "")
-
-    # DB에서 관리자 확인 또는 환경변수의 관리자 ID 확인 또는 이메일 관리자 확인
-    is_admin = (
-        db.is_admin(telegram_id) or
-        telegram_id in settings.admin_ids or
-        db.is_email_admin(username)
-    )
-    if not is_admin:
+    # DB 관리자, 환경변수의 관리자 ID, 이메일 관리자 확인 (결과는 principal 캐시)
+    if not principal.resolve_admin(user, db):
         raise HTTPException(status_code=403, detail="관리자 권한이 필요합니다")
 
     return user
+
+
+async def require_admin_stream(
+    credentials: Annotated[HTTPAuthorizationCredentials | None, Depends(security)],
+    token: str | None = Query(None, description="EventSource용 액세스 토큰 (헤더를 보낼 수 없는 경우)"),
+    db: Database = Depends(get_db),
+    settings: Settings = Depends(get_settings)
+) -> dict:
+    """관리자 권한 필수 (Authorization 헤더 또는 ?token=)"""
+    if not credentials and token:
+        credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+    user = await require_auth(credentials)
+    return await require_admin(user, db, settings)
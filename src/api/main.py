@@ -51,6 +51,17 @@ app.include_router(gamification.router, prefix="/api/gamification", tags=["Gamif
 app.include_router(ai_matching.router, prefix="/api/ai", tags=["AI Matching"])
 
 
+@app.on_event("shutdown")
+async def shutdown():
+    """PDF 렌더링 프로세스 풀, 알림 LISTEN 연결, 이메일 발송 스레드 정리, 위치 버퍼 저장"""
+    from .services import pdf_service, live_streams, location_ingest
+    from .services.email_service import email_service
+    pdf_service.shutdown_executor()
+    await live_streams.shutdown_hubs()
+    await location_ingest.shutdown_ingestor()
+    email_service.shutdown()
+
+
 @app.get("/", tags=["Root"])
 async def root():
     """API 상태 확인"""
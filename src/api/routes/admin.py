@@ -1,15 +1,18 @@
 """Admin Routes"""
-from fastapi import APIRouter, Depends, HTTPException
-from fastapi.responses import FileResponse
+import asyncio
+import io
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import FileResponse, Response, StreamingResponse
 from datetime import datetime, timedelta
 from urllib.parse import quote
-import os
 from psycopg2.extras import RealDictCursor
 
-from ..dependencies import get_db, require_auth, require_admin
+from ..dependencies import get_db, require_auth, require_admin, require_admin_stream
 from ..config import get_settings, Settings
 from ..schemas.event import EventListResponse, EventResponse
-from ..schemas.attendance import AttendanceListResponse, AttendanceResponse
+from ..schemas.attendance import AttendanceListResponse, AttendanceResponse, DocumentExportRequest
+from ..services import document_export, file_streams, live_streams
 from db import Database
 from utils import now_kst_str
 
@@ -93,22 +96,17 @@ async def get_event_applications(
 
     apps = db.list_applications_by_event(event_id, status=status)
 
-    # 근무자 정보 추가
-    enriched = []
-    for app in apps:
-        with db.get_connection() as conn:
-            cursor = conn.cursor(cursor_factory=RealDictCursor)
-            cursor.execute(
-                "SELECT name, phone, residence, face_photo_file_id FROM workers WHERE id = %s",
-                (app.get("worker_id"),)
-            )
-            worker = cursor.fetchone()
-            if worker:
-                app["worker_name"] = worker["name"]
-                app["worker_phone"] = worker["phone"]
-                app["worker_residence"] = worker["residence"]
-                app["worker_photo"] = worker["face_photo_file_id"]
-        enriched.append(app)
+    # 근무자 정보 (목록 조회에 이미 포함)
+    enriched = [
+        {
+            **app,
+            "worker_name": app.name,
+            "worker_phone": app.phone,
+            "worker_residence": app.residence,
+            "worker_photo": app.face_photo_file_id,
+        }
+        for app in apps
+    ]
 
     return {
         "event": event,
@@ -128,40 +126,74 @@ async def get_event_attendance(
     if not event:
         raise HTTPException(status_code=404, detail="행사를 찾을 수 없습니다")
 
-    attendance_list = db.list_attendance_by_event(event_id)
+    return {"event": event, **_attendance_board(db, event_id)}
+
 
-    # 근무자 정보 추가
-    enriched = []
+def _attendance_board(db: Database, event_id: int) -> dict:
+    """출석 현황 + 통계 (근무자 정보는 목록 쿼리에서 함께 조회)"""
+    attendance_list = db.list_attendance_by_event(event_id)
     for att in attendance_list:
-        with db.get_connection() as conn:
-            cursor = conn.cursor(cursor_factory=RealDictCursor)
-            cursor.execute(
-                "SELECT name, phone FROM workers WHERE id = %s",
-                (att.get("worker_id"),)
-            )
-            worker = cursor.fetchone()
-            if worker:
-                att["worker_name"] = worker["name"]
-                att["worker_phone"] = worker["phone"]
-        enriched.append(att)
+        att["worker_phone"] = att.get("phone")
 
-    # 통계
-    total = len(enriched)
-    checked_in = len([a for a in enriched if a.get("check_in_time")])
-    completed = len([a for a in enriched if a.get("check_out_time")])
+    total = len(attendance_list)
+    checked_in = len([a for a in attendance_list if a.get("check_in_time")])
+    completed = len([a for a in attendance_list if a.get("check_out_time")])
 
     return {
-        "event": event,
         "stats": {
             "total": total,
             "checked_in": checked_in,
             "completed": completed,
             "pending": total - checked_in
         },
-        "attendance": enriched
+        "attendance": attendance_list
     }
 
 
+@router.get("/events/{event_id}/attendance/stream")
+async def stream_event_attendance(
+    event_id: int,
+    request: Request,
+    admin: dict = Depends(require_admin_stream),
+    db: Database = Depends(get_db)
+):
+    """
+    행사 출석 현황 실시간 스트림 (Server-Sent Events)
+
+    이벤트:
+    - snapshot: 전체 현황 (stats, attendance) - 접속 시, 이벤트 유실 가능성이 있을 때(리스너 재연결 등)
+    - attendance: 변경된 출석 1건 (op: INSERT/UPDATE/DELETE, 출석 필드, worker_name)
+    """
+    if not db.get_event(event_id):
+        raise HTTPException(status_code=404, detail="행사를 찾을 수 없습니다")
+
+    hub = live_streams.attendance_hub(db)
+
+    async def event_stream():
+        # 구독을 먼저 시작해 스냅샷 조회 중 발생한 변경도 놓치지 않음
+        queue = hub.subscribe(event_id)
+        try:
+            board = await asyncio.to_thread(_attendance_board, db, event_id)
+            yield live_streams.sse("snapshot", board)
+
+            while not await request.is_disconnected():
+                try:
+                    change = await asyncio.wait_for(queue.get(), timeout=live_streams.HEARTBEAT_SECONDS)
+                except asyncio.TimeoutError:
+                    yield live_streams.HEARTBEAT
+                    continue
+
+                if change.get("event") == "resync":
+                    board = await asyncio.to_thread(_attendance_board, db, event_id)
+                    yield live_streams.sse("snapshot", board)
+                else:
+                    yield live_streams.sse("attendance", change)
+        finally:
+            hub.unsubscribe(event_id, queue)
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream", headers=live_streams.SSE_HEADERS)
+
+
 @router.post("/attendance/{attendance_id}/manual-checkin")
 async def manual_checkin(
     attendance_id: int,
@@ -330,6 +362,17 @@ async def remove_admin_phone(
 
 # ==================== Excel Export ====================
 
+def _xlsx_response(chunks, filename: str) -> StreamingResponse:
+    """작성 중인 엑셀을 그대로 내려보내는 응답 (파일 저장 없음)"""
+    from payroll import XLSX_MEDIA_TYPE
+
+    headers = {
+        "Content-Disposition": f"attachment; filename*=UTF-8''{quote(filename)}",
+        "Access-Control-Expose-Headers": "Content-Disposition"
+    }
+    return StreamingResponse(chunks, media_type=XLSX_MEDIA_TYPE, headers=headers)
+
+
 @router.get("/events/{event_id}/export")
 async def export_event_payroll(
     event_id: int,
@@ -341,44 +384,19 @@ async def export_event_payroll(
     if not event:
         raise HTTPException(status_code=404, detail="행사를 찾을 수 없습니다")
 
-    # 출석 기록 조회
+    # 출석 기록 조회 (근무자 정보 포함)
     attendance_list = db.list_attendance_by_event(event_id)
     if not attendance_list:
         raise HTTPException(status_code=400, detail="출석 기록이 없습니다")
 
-    # 근무자 정보 조회
-    workers = {}
-    for att in attendance_list:
-        worker_id = att.get("worker_id")
-        if worker_id:
-            with db.get_connection() as conn:
-                cursor = conn.cursor(cursor_factory=RealDictCursor)
-                cursor.execute(
-                    "SELECT * FROM workers WHERE id = %s",
-                    (worker_id,)
-                )
-                worker = cursor.fetchone()
-                if worker:
-                    workers[worker_id] = dict(worker)
+    # 엑셀 생성 (write-only 워크북을 응답으로 스트리밍)
+    from payroll import PayrollExporter, workers_from_attendances
 
-    # 엑셀 생성
-    from payroll import PayrollExporter
-
-    export_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))), "exports")
-    exporter = PayrollExporter(export_dir)
-    filepath = exporter.generate_event_payroll(event, attendance_list, workers)
-
-    # 파일 다운로드
-    filename = os.path.basename(filepath)
-    encoded_filename = quote(filename)
-    headers = {
-        "Content-Disposition": f"attachment; filename*=UTF-8''{encoded_filename}",
-        "Access-Control-Expose-Headers": "Content-Disposition"
-    }
-    return FileResponse(
-        filepath,
-        media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-        headers=headers
+    exporter = PayrollExporter()
+    workers = workers_from_attendances(attendance_list)
+    return _xlsx_response(
+        file_streams.iter_file(lambda f: exporter.write_event_payroll(f, event, attendance_list, workers)),
+        exporter.payroll_filename(event)
     )
 
 
@@ -393,24 +411,9 @@ async def export_event_report(
     if not event:
         raise HTTPException(status_code=404, detail="행사를 찾을 수 없습니다")
 
-    # 출석 기록 조회
+    # 출석 기록 조회 (근무자 정보 포함)
     attendance_list = db.list_attendance_by_event(event_id)
 
-    # 근무자 정보 조회
-    workers = {}
-    for att in attendance_list:
-        worker_id = att.get("worker_id")
-        if worker_id:
-            with db.get_connection() as conn:
-                cursor = conn.cursor(cursor_factory=RealDictCursor)
-                cursor.execute(
-                    "SELECT * FROM workers WHERE id = %s",
-                    (worker_id,)
-                )
-                worker = cursor.fetchone()
-                if worker:
-                    workers[worker_id] = dict(worker)
-
     # 청구 내역 (빈 데이터 - 추후 입력 가능)
     billing_items = []
 
@@ -425,24 +428,142 @@ async def export_event_report(
     }
 
     # 엑셀 생성
-    from payroll import PayrollExporter
+    from payroll import PayrollExporter, workers_from_attendances
+
+    exporter = PayrollExporter()
+    workers = workers_from_attendances(attendance_list)
+    return _xlsx_response(
+        file_streams.iter_file(lambda f: exporter.write_event_report(
+            f, event, attendance_list, workers, billing_items, expense_items, report_info
+        )),
+        exporter.report_filename(event)
+    )
+
 
-    export_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))), "exports")
-    exporter = PayrollExporter(export_dir)
-    filepath = exporter.generate_event_report(event, attendance_list, workers, billing_items, expense_items, report_info)
+@router.get("/payroll/period")
+async def export_period_payroll(
+    year: int | None = Query(None),
+    month: int | None = Query(None, ge=1, le=12),
+    event_ids: str | None = Query(None, description="쉼표로 구분한 행사 ID (예: 12,15,18)"),
+    kind: str = Query("xlsx", description="xlsx / csv / bank (은행 대량이체)"),
+    skip_missing: bool = Query(False, description="bank: 계좌 정보가 없는 근무자를 빼고 이체 파일 발급"),
+    admin: dict = Depends(require_admin),
+    db: Database = Depends(get_db)
+):
+    """
+    기간(월)·여러 행사 급여 정산 다운로드 (근무자·계좌별 합계)
+
+    bank: 은행코드/계좌가 없는 근무자가 있으면 409로 목록을 돌려준다.
+    skip_missing=true면 그 근무자를 빼고 발급하고 X-Skipped-Worker-Ids 헤더에 ID를 담는다.
+    """
+    if kind not in ("xlsx", "csv", "bank"):
+        raise HTTPException(status_code=400, detail="kind는 xlsx, csv, bank 중 하나입니다")
+    try:
+        ids = [int(x) for x in event_ids.split(",") if x.strip()] if event_ids else []
+    except ValueError:
+        raise HTTPException(status_code=400, detail="event_ids 형식이 올바르지 않습니다")
+    if not (year and month) and not ids:
+        raise HTTPException(status_code=400, detail="year+month 또는 event_ids가 필요합니다")
+
+    from payroll import PayrollExporter, XLSX_MEDIA_TYPE
+
+    label = f"{year}-{month:02d}" if year and month else f"행사{len(ids)}건"
+    exporter = PayrollExporter()
 
-    # 파일 다운로드
-    filename = os.path.basename(filepath)
-    encoded_filename = quote(filename)
     headers = {
-        "Content-Disposition": f"attachment; filename*=UTF-8''{encoded_filename}",
+        "Content-Disposition": f"attachment; filename*=UTF-8''{quote(exporter.period_filename(label, kind))}",
         "Access-Control-Expose-Headers": "Content-Disposition"
     }
-    return FileResponse(
-        filepath,
-        media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-        headers=headers
-    )
+
+    if kind == "bank":
+        # 이체 파일은 근무자당 한 줄이라 메모리에서 작성하고, 제외된 근무자를 확인한 뒤 응답
+        transfer = io.BytesIO()
+        count, skipped = exporter.write_bank_transfer(
+            transfer, db.iter_period_payroll(year=year, month=month, event_ids=ids), memo=f"{label} 급여"
+        )
+        if skipped and not skip_missing:
+            raise HTTPException(status_code=409, detail={
+                "message": f"계좌 정보 누락으로 이체할 수 없는 근무자가 {len(skipped)}명 있습니다",
+                "workers": [{"worker_id": row["worker_id"], "name": row.get("name")} for row in skipped]
+            })
+        headers["X-Transfer-Count"] = str(count)
+        headers["X-Skipped-Worker-Ids"] = ",".join(str(row["worker_id"]) for row in skipped)
+        headers["Access-Control-Expose-Headers"] += ", X-Transfer-Count, X-Skipped-Worker-Ids"
+        return Response(content=transfer.getvalue(), media_type="text/csv", headers=headers)
+
+    # 집계는 SQL, 결과는 서버 커서에서 바로 작성기로 흘려보냄
+    def write(f):
+        rows = db.iter_period_payroll(year=year, month=month, event_ids=ids)
+        if kind == "xlsx":
+            exporter.write_period_payroll(f, label, rows)
+        else:
+            exporter.write_period_payroll_csv(f, rows)
+
+    media_type = XLSX_MEDIA_TYPE if kind == "xlsx" else "text/csv"
+    return StreamingResponse(file_streams.iter_file(write), media_type=media_type, headers=headers)
+
+
+# ==================== Bulk Documents (지급명세서/근무증명서) ====================
+
+@router.post("/exports/documents")
+async def start_document_export(
+    data: DocumentExportRequest,
+    admin: dict = Depends(require_admin),
+    db: Database = Depends(get_db)
+):
+    """행사 또는 월 단위 지급명세서/근무증명서 일괄 발급 (백그라운드 작업)"""
+    kinds = [k for k in data.kinds if k in document_export.DOCUMENT_FOLDERS]
+    if not kinds:
+        raise HTTPException(status_code=400, detail="발급할 문서 유형을 선택해주세요")
+
+    if data.event_id:
+        if not db.get_event(data.event_id):
+            raise HTTPException(status_code=404, detail="행사를 찾을 수 없습니다")
+        rows = db.list_attendance_for_documents(event_id=data.event_id)
+        scope = f"event:{data.event_id}"
+    elif data.year and data.month:
+        rows = db.list_attendance_for_documents(year=data.year, month=data.month)
+        scope = f"month:{data.year}-{data.month:02d}"
+    else:
+        raise HTTPException(status_code=400, detail="event_id 또는 year/month가 필요합니다")
+
+    if not rows:
+        raise HTTPException(status_code=400, detail="퇴근 완료된 출석 기록이 없습니다")
+
+    job = document_export.start_export(rows, kinds, scope)
+    return job.to_dict()
+
+
+@router.get("/exports/documents/{job_id}")
+async def get_document_export(
+    job_id: str,
+    admin: dict = Depends(require_admin)
+):
+    """일괄 발급 진행 상황"""
+    job = document_export.get_job(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다")
+    return job.to_dict()
+
+
+@router.get("/exports/documents/{job_id}/download")
+async def download_document_export(
+    job_id: str,
+    admin: dict = Depends(require_admin)
+):
+    """일괄 발급 ZIP 다운로드"""
+    job = document_export.get_job(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다")
+    if job.status != "COMPLETED" or not job.file_path:
+        raise HTTPException(status_code=409, detail="아직 완료되지 않은 작업입니다")
+
+    filename = f"서류일괄_{job.scope.replace(':', '_')}.zip"
+    headers = {
+        "Content-Disposition": f"attachment; filename*=UTF-8''{quote(filename)}",
+        "Access-Control-Expose-Headers": "Content-Disposition"
+    }
+    return FileResponse(job.file_path, media_type="application/zip", headers=headers)
 
 
 # ==================== Analytics ====================
@@ -3,7 +3,8 @@ from fastapi import APIRouter, Depends, HTTPException, Query
 
 from ..dependencies import get_db, require_auth, require_admin, require_worker
 from ..schemas.application import (
-    ApplicationCreate, ApplicationStatusUpdate, ApplicationResponse, ApplicationListResponse
+    ApplicationCreate, ApplicationStatusUpdate, ApplicationResponse, ApplicationListResponse,
+    ApplicationBulkStatusUpdate, ApplicationBulkStatusResponse
 )
 from db import Database
 
@@ -156,6 +157,78 @@ async def update_application_status(
     return ApplicationResponse(**_enrich_application(updated, db))
 
 
+def _bulk_status_notification(row: dict, status: str, reason: str | None) -> dict:
+    """일괄 상태 변경 알림 항목 (확정 시 출석 코드를 텔레그램으로도 발송)"""
+    event_title = row.get("event_title") or "행사"
+    if status == "CONFIRMED":
+        return {
+            "worker_id": row["worker_id"],
+            "type": "APPLICATION_CONFIRMED",
+            "title": "지원 확정",
+            "message": f"'{event_title}' 지원이 확정되었습니다. 행사 당일 출근 코드로 출석해주세요.",
+            "chat_id": row.get("worker_telegram_id"),
+            "text": (
+                "✅ 근무 확정\n"
+                "━━━━━━━━━━━━━━━━━━━━\n\n"
+                f"📌 {event_title}\n\n"
+                f"📅 {row.get('event_date')}\n"
+                f"⏰ {row.get('event_time')}\n"
+                f"📍 {row.get('location')}\n"
+                f"💰 {row.get('pay_amount') or 0:,}원\n\n"
+                "━━━━━━━━━━━━━━━━━━━━\n\n"
+                f"🔐 출석 코드: {row.get('check_in_code')}\n\n"
+                "당일 출근 시 위 코드를 입력해주세요."
+            ),
+            "data": str(row["event_id"]),
+            "reference_type": "application",
+            "reference_id": row["id"],
+        }
+    if status == "REJECTED":
+        return {
+            "worker_id": row["worker_id"],
+            "type": "APPLICATION_REJECTED",
+            "title": "지원 결과",
+            "message": f"'{event_title}' 지원이 반려되었습니다. 사유: {reason or '사유 없음'}",
+            "chat_id": None,
+            "data": str(row["event_id"]),
+        }
+    return None
+
+
+@router.post("/bulk-status", response_model=ApplicationBulkStatusResponse)
+async def bulk_update_application_status(
+    data: ApplicationBulkStatusUpdate,
+    admin: dict = Depends(require_admin),
+    db: Database = Depends(get_db)
+):
+    """
+    지원 상태 일괄 변경 (관리자 전용)
+
+    상태 변경, 이력, 출석 레코드, 알림을 한 트랜잭션으로 처리하고
+    텔레그램 발송은 알림 발송기(발송 큐)에 맡긴다.
+    """
+    status = data.status.value
+    app_ids = list(dict.fromkeys(data.application_ids))
+    notify = status in ("CONFIRMED", "REJECTED")
+
+    rows = db.bulk_update_application_status(
+        app_ids,
+        status,
+        changed_by=admin.get("telegram_id"),
+        rejection_reason=data.rejection_reason,
+        build_notification=(lambda row: _bulk_status_notification(row, status, data.rejection_reason))
+        if notify else None
+    )
+
+    return ApplicationBulkStatusResponse(
+        status=status,
+        requested=len(app_ids),
+        updated=len(rows),
+        skipped=len(app_ids) - len(rows),
+        application_ids=[row["id"] for row in rows]
+    )
+
+
 @router.delete("/{app_id}")
 async def cancel_application(
     app_id: int,
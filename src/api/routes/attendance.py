@@ -1,18 +1,16 @@
 """Attendance Routes"""
 from fastapi import APIRouter, Depends, HTTPException, Query
-from fastapi.responses import StreamingResponse
-from io import BytesIO
-from datetime import datetime, date
+from fastapi.responses import FileResponse
+from datetime import datetime
 import logging
-import json
 
 from ..dependencies import get_db, require_auth, require_admin, require_worker
 from ..schemas.attendance import (
     CheckInRequest, AttendanceResponse, AttendanceListResponse, ChainLogResponse
 )
+from ..services import badge_engine, pdf_service, rewards, location_ingest, event_board
 from db import Database
 from wpt_service import wpt_service
-from utils import now_kst
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -21,184 +19,10 @@ logger = logging.getLogger(__name__)
 # Gamification Helper Functions
 # ============================================
 
-def _get_gamification_config(db: Database, key: str):
-    """게임화 설정 조회"""
-    with db.get_connection() as conn:
-        cursor = conn.cursor()
-        cursor.execute("SELECT value FROM gamification_config WHERE key = %s", (key,))
-        result = cursor.fetchone()
-        if result:
-            return json.loads(result[0])
-        return {}
-
-
-def _award_wpt(db: Database, worker_id: int, amount: int, category: str, description: str, reference_type: str = None, reference_id: int = None):
-    """WPT 지급"""
-    with db.get_connection() as conn:
-        cursor = conn.cursor()
-
-        # 현재 잔액 조회
-        cursor.execute("SELECT COALESCE(wpt_balance, 0) FROM worker_metrics WHERE worker_id = %s", (worker_id,))
-        result = cursor.fetchone()
-        balance = result[0] if result else 0
-        new_balance = balance + amount
-
-        # 트랜잭션 기록 (트리거가 자동으로 wpt_balance 업데이트)
-        cursor.execute("""
-            INSERT INTO wpt_transactions (worker_id, type, category, amount, balance_after, reference_type, reference_id, description)
-            VALUES (%s, 'EARN', %s, %s, %s, %s, %s, %s)
-            RETURNING id
-        """, (worker_id, category, amount, new_balance, reference_type, reference_id, description))
-
-        transaction_id = cursor.fetchone()[0]
-        conn.commit()
-
-        logger.info(f"WPT awarded: {amount} to worker {worker_id}, category: {category}")
-
-        return {
-            "transaction_id": transaction_id,
-            "amount": amount,
-            "balance": new_balance,
-            "category": category
-        }
-
-
-def _add_experience(db: Database, worker_id: int, exp: int, reason: str):
-    """경험치 추가 및 레벨업 체크"""
-    with db.get_connection() as conn:
-        cursor = conn.cursor()
-
-        # 현재 레벨/경험치 조회
-        cursor.execute("""
-            SELECT level, experience_points FROM worker_metrics WHERE worker_id = %s
-        """, (worker_id,))
-        result = cursor.fetchone()
-
-        if not result:
-            current_level = 1
-            current_exp = 0
-        else:
-            current_level, current_exp = result
-
-        new_exp = current_exp + exp
-
-        # 레벨업 체크
-        cursor.execute("""
-            SELECT level, required_exp FROM worker_levels
-            WHERE required_exp <= %s
-            ORDER BY level DESC
-            LIMIT 1
-        """, (new_exp,))
-        level_info = cursor.fetchone()
-
-        new_level = level_info[0] if level_info else current_level
-        leveled_up = new_level > current_level
-
-        # 업데이트
-        cursor.execute("""
-            UPDATE worker_metrics
-            SET level = %s, experience_points = %s
-            WHERE worker_id = %s
-        """, (new_level, new_exp, worker_id))
-
-        conn.commit()
-
-        if leveled_up:
-            logger.info(f"Worker {worker_id} leveled up: {current_level} -> {new_level}")
-
-        return {
-            "exp_gained": exp,
-            "total_exp": new_exp,
-            "level": new_level,
-            "leveled_up": leveled_up,
-            "reason": reason
-        }
-
-
 def _process_checkin_reward(db: Database, worker_id: int, attendance_id: int):
-    """출근 보상 처리 (Streak 포함)"""
+    """출근 보상 처리 (Streak 포함, 실패해도 출근 처리에는 영향 없음)"""
     try:
-        # 설정 로드
-        rewards = _get_gamification_config(db, "wpt_rewards")
-        checkin_wpt = rewards.get("checkin", 10)
-
-        # Streak 업데이트
-        with db.get_connection() as conn:
-            cursor = conn.cursor()
-
-            today = date.today()
-
-            cursor.execute("""
-                SELECT current_streak, last_checkin_date, longest_streak
-                FROM worker_streaks
-                WHERE worker_id = %s
-            """, (worker_id,))
-            streak_data = cursor.fetchone()
-
-            if not streak_data:
-                # 첫 출석
-                new_streak = 1
-                longest = 1
-            else:
-                current_streak, last_date, longest = streak_data
-
-                if last_date:
-                    days_diff = (today - last_date).days
-
-                    if days_diff == 1:
-                        # 연속 출석
-                        new_streak = current_streak + 1
-                    elif days_diff == 0:
-                        # 오늘 이미 출석 (보상은 처음 1회만)
-                        return None
-                    else:
-                        # 끊김
-                        new_streak = 1
-                else:
-                    new_streak = 1
-
-                longest = max(longest or 0, new_streak)
-
-            # Streak 업데이트
-            cursor.execute("""
-                INSERT INTO worker_streaks (worker_id, current_streak, longest_streak, last_checkin_date)
-                VALUES (%s, %s, %s, %s)
-                ON CONFLICT (worker_id)
-                DO UPDATE SET
-                    current_streak = EXCLUDED.current_streak,
-                    longest_streak = EXCLUDED.longest_streak,
-                    last_checkin_date = EXCLUDED.last_checkin_date,
-                    updated_at = CURRENT_TIMESTAMP
-            """, (worker_id, new_streak, longest, today))
-
-            conn.commit()
-
-        # Streak 보너스 계산
-        streak_bonus = 0
-        if new_streak >= 3:
-            streak_bonus = rewards.get("streak_bonus", 5) * (new_streak // 3)
-
-        total_wpt = checkin_wpt + streak_bonus
-
-        # WPT 지급
-        transaction = _award_wpt(
-            db, worker_id, total_wpt, "checkin",
-            f"출근 보상 (+{checkin_wpt} WPT) + 연속 출석 보너스 (+{streak_bonus} WPT)",
-            "attendance", attendance_id
-        )
-
-        # 경험치 지급
-        exp_result = _add_experience(db, worker_id, 5, "출근 완료")
-
-        return {
-            "wpt_reward": transaction,
-            "streak": {
-                "current": new_streak,
-                "longest": longest,
-                "bonus_wpt": streak_bonus
-            },
-            "exp": exp_result
-        }
+        return rewards.process_checkin_reward(db, worker_id, attendance_id)
     except Exception as e:
         logger.error(f"Checkin reward failed: {e}", exc_info=True)
         return None
@@ -215,32 +39,7 @@ def _process_checkout_reward(db: Database, worker_id: int, attendance_id: int, c
 
         work_hours = (check_out_time - check_in_time).total_seconds() / 3600
 
-        # 설정 로드
-        rewards = _get_gamification_config(db, "wpt_rewards")
-        checkout_wpt = rewards.get("checkout", 10)
-
-        # 근무 시간 보너스 (시간당 5 WPT)
-        time_bonus = int(work_hours * 5)
-
-        total_wpt = checkout_wpt + time_bonus
-
-        # WPT 지급
-        transaction = _award_wpt(
-            db, worker_id, total_wpt, "checkout",
-            f"퇴근 보상 (+{checkout_wpt} WPT) + 근무시간 보너스 (+{time_bonus} WPT, {work_hours:.1f}h)",
-            "attendance", attendance_id
-        )
-
-        # 경험치 지급
-        exp_bonus = int(work_hours * 2)
-        exp_result = _add_experience(db, worker_id, exp_bonus, f"근무 완료 ({work_hours:.1f}시간)")
-
-        return {
-            "wpt_reward": transaction,
-            "work_hours": round(work_hours, 1),
-            "time_bonus": time_bonus,
-            "exp": exp_result
-        }
+        return rewards.process_checkout_reward(db, worker_id, attendance_id, work_hours)
     except Exception as e:
         logger.error(f"Checkout reward failed: {e}", exc_info=True)
         return None
@@ -429,6 +228,9 @@ async def check_out(
     if reward_result:
         logger.info(f"Check-out reward: {reward_result['wpt_reward']['amount']} WPT, hours: {reward_result['work_hours']}")
 
+    # 배지 조건 평가 (해당 근무자만)
+    badge_engine.award_after_checkout(db, updated["worker_id"])
+
     enriched = _enrich_attendance(updated, db)
 
     # 보상 정보 추가
@@ -516,266 +318,17 @@ async def download_payment_statement(
 
     # PDF 생성
     try:
-        pdf_bytes = generate_payment_statement_pdf(worker, attendance)
-        return StreamingResponse(
-            BytesIO(pdf_bytes),
+        pdf_path = await pdf_service.payment_statement_pdf(worker, attendance)
+        return FileResponse(
+            pdf_path,
             media_type="application/pdf",
-            headers={
-                "Content-Disposition": f"attachment; filename=payment_statement_{attendance_id}.pdf"
-            }
+            filename=f"payment_statement_{attendance_id}.pdf"
         )
     except Exception as e:
         logger.error(f"Payment statement PDF generation failed: {str(e)}", exc_info=True)
         raise HTTPException(status_code=500, detail=f"지급명세서 생성 실패: {str(e)}")
 
 
-def generate_payment_statement_pdf(worker: dict, attendance: dict) -> bytes:
-    """프리랜서 지급명세서 PDF 생성 - 네이비/블루 테마, 한 페이지"""
-    from reportlab.lib.pagesizes import A4
-    from reportlab.lib.units import mm
-    from reportlab.pdfgen import canvas
-    from reportlab.pdfbase import pdfmetrics
-    from reportlab.pdfbase.ttfonts import TTFont
-    from reportlab.lib.colors import HexColor
-    import os
-
-    # 색상 정의 (네이비/블루 테마)
-    NAVY = "#191F28"
-    BLUE = "#3182F6"
-    LIGHT_BLUE = "#E8F3FF"
-    GRAY = "#6B7280"
-    DARK_GRAY = "#374151"
-    TEXT = "#111827"
-    BORDER = "#E5E7EB"
-    GREEN = "#059669"
-    RED = "#DC2626"
-
-    # 회사 정보 (고정값)
-    company_info = {
-        "name": "(주)엘케이프라이빗",
-        "business_number": "635-86-01148",
-        "ceo_name": "김재영",
-    }
-
-    # 급여 계산 (프리랜서 3.3% 공제)
-    gross_pay = attendance.get("pay_amount", 0) or 0
-    income_tax = int(gross_pay * 0.03)  # 소득세 3%
-    local_tax = int(gross_pay * 0.003)  # 지방소득세 0.3%
-    total_deduction = income_tax + local_tax
-    net_pay = gross_pay - total_deduction
-
-    # 폰트 등록 (나눔고딕 사용)
-    font_path = "/usr/share/fonts/truetype/nanum/NanumGothic.ttf"
-    bold_font_path = "/usr/share/fonts/truetype/nanum/NanumGothicBold.ttf"
-
-    if os.path.exists(font_path):
-        pdfmetrics.registerFont(TTFont("NanumGothic", font_path))
-        if os.path.exists(bold_font_path):
-            pdfmetrics.registerFont(TTFont("NanumGothicBold", bold_font_path))
-        else:
-            pdfmetrics.registerFont(TTFont("NanumGothicBold", font_path))
-        font_name = "NanumGothic"
-        bold_font = "NanumGothicBold"
-    else:
-        font_name = "Helvetica"
-        bold_font = "Helvetica-Bold"
-
-    buffer = BytesIO()
-    c = canvas.Canvas(buffer, pagesize=A4)
-    width, height = A4
-
-    # 배경
-    c.setFillColor(HexColor("#FFFFFF"))
-    c.rect(0, 0, width, height, fill=1)
-
-    # 테두리 (네이비)
-    c.setStrokeColor(HexColor(NAVY))
-    c.setLineWidth(2)
-    c.rect(15*mm, 15*mm, width-30*mm, height-30*mm)
-
-    # 헤더 (네이비)
-    c.setFillColor(HexColor(NAVY))
-    c.setFont(bold_font, 22)
-    c.drawCentredString(width/2, height - 40*mm, "프리랜서 지급명세서")
-
-    c.setFont(font_name, 9)
-    c.setFillColor(HexColor(GRAY))
-    c.drawCentredString(width/2, height - 48*mm, "Freelancer Payment Statement")
-
-    # 구분선
-    c.setStrokeColor(HexColor(BORDER))
-    c.setLineWidth(1)
-    c.line(25*mm, height - 55*mm, width - 25*mm, height - 55*mm)
-
-    # 내용 시작 (간격 축소)
-    y = height - 65*mm
-    line_height = 8*mm
-    section_gap = 3*mm
-
-    # 근무자 정보 섹션
-    c.setFillColor(HexColor(DARK_GRAY))
-    c.setFont(bold_font, 11)
-    c.drawString(30*mm, y, "근무자 정보")
-    y -= line_height
-
-    # 생년월일 포맷
-    birth_date = worker.get("birth_date", "-") or "-"
-    if birth_date and birth_date != "-":
-        birth_date = birth_date.replace("-", "")[-6:]
-
-    items = [
-        ("이름", worker.get("name", "-")),
-        ("생년월일", birth_date),
-        ("연락처", worker.get("phone", "-")),
-    ]
-
-    for label, value in items:
-        c.setFont(bold_font, 9)
-        c.setFillColor(HexColor(GRAY))
-        c.drawString(35*mm, y, label)
-        c.setFont(font_name, 10)
-        c.setFillColor(HexColor(TEXT))
-        c.drawString(65*mm, y, str(value))
-        y -= 6*mm
-
-    y -= section_gap
-
-    # 회사 정보 섹션
-    c.setFillColor(HexColor(DARK_GRAY))
-    c.setFont(bold_font, 11)
-    c.drawString(30*mm, y, "회사 정보")
-    y -= line_height
-
-    items = [
-        ("회사명", company_info["name"]),
-        ("사업자등록번호", company_info["business_number"]),
-        ("대표자명", company_info["ceo_name"]),
-    ]
-
-    for label, value in items:
-        c.setFont(bold_font, 9)
-        c.setFillColor(HexColor(GRAY))
-        c.drawString(35*mm, y, label)
-        c.setFont(font_name, 10)
-        c.setFillColor(HexColor(TEXT))
-        c.drawString(65*mm, y, str(value))
-        y -= 6*mm
-
-    y -= section_gap
-
-    # 지급 정보 섹션
-    c.setStrokeColor(HexColor(BORDER))
-    c.line(25*mm, y + 2*mm, width - 25*mm, y + 2*mm)
-    y -= section_gap
-
-    c.setFillColor(HexColor(DARK_GRAY))
-    c.setFont(bold_font, 11)
-    c.drawString(30*mm, y, "지급 정보")
-    y -= line_height
-
-    items = [
-        ("지급일", "차주 수요일"),
-        ("용역 제공 기간", f"{attendance.get('event_date', '-')} {attendance.get('event_title', '')}"),
-    ]
-
-    for label, value in items:
-        c.setFont(bold_font, 9)
-        c.setFillColor(HexColor(GRAY))
-        c.drawString(35*mm, y, label)
-        c.setFont(font_name, 10)
-        c.setFillColor(HexColor(TEXT))
-        c.drawString(65*mm, y, str(value))
-        y -= 6*mm
-
-    y -= section_gap
-
-    # 지급 금액 섹션
-    c.setStrokeColor(HexColor(BORDER))
-    c.line(25*mm, y + 2*mm, width - 25*mm, y + 2*mm)
-    y -= section_gap
-
-    c.setFillColor(HexColor(DARK_GRAY))
-    c.setFont(bold_font, 11)
-    c.drawString(30*mm, y, "지급 금액")
-    y -= line_height
-
-    items = [
-        ("지급총액", f"{gross_pay:,}원"),
-        ("소득세(3%)", f"-{income_tax:,}원"),
-        ("지방소득세(0.3%)", f"-{local_tax:,}원"),
-        ("공제합계", f"-{total_deduction:,}원"),
-    ]
-
-    for label, value in items:
-        c.setFont(bold_font, 9)
-        c.setFillColor(HexColor(GRAY))
-        c.drawString(35*mm, y, label)
-        c.setFont(font_name, 10)
-        if value.startswith("-"):
-            c.setFillColor(HexColor(RED))
-        else:
-            c.setFillColor(HexColor(TEXT))
-        c.drawString(95*mm, y, str(value))
-        y -= 6*mm
-
-    # 실지급액 (강조 - 블루)
-    y -= 6*mm
-    c.setFillColor(HexColor(LIGHT_BLUE))
-    c.rect(30*mm, y - 2*mm, width - 60*mm, 12*mm, fill=1, stroke=0)
-
-    c.setFont(bold_font, 11)
-    c.setFillColor(HexColor(BLUE))
-    c.drawString(35*mm, y + 1*mm, "실지급액")
-    c.setFont(bold_font, 14)
-    c.drawRightString(width - 35*mm, y + 1*mm, f"{net_pay:,}원")
-    y -= 14*mm
-
-    # 근무 상태 섹션
-    c.setStrokeColor(HexColor(BORDER))
-    c.line(25*mm, y + 2*mm, width - 25*mm, y + 2*mm)
-    y -= section_gap
-
-    c.setFillColor(HexColor(DARK_GRAY))
-    c.setFont(bold_font, 11)
-    c.drawString(30*mm, y, "업무 정보")
-    y -= line_height
-
-    check_in = attendance.get("check_in_time", "-")
-    check_out = attendance.get("check_out_time", "-")
-    if check_in and check_in != "-":
-        check_in = str(check_in).split(".")[0]  # 밀리초 제거
-    if check_out and check_out != "-":
-        check_out = str(check_out).split(".")[0]
-
-    items = [
-        ("상태", "업무 종료"),
-        ("업무시작", str(check_in)),
-        ("업무종료", str(check_out)),
-    ]
-
-    for label, value in items:
-        c.setFont(bold_font, 9)
-        c.setFillColor(HexColor(GRAY))
-        c.drawString(35*mm, y, label)
-        c.setFont(font_name, 10)
-        if label == "상태":
-            c.setFillColor(HexColor(GREEN))
-        else:
-            c.setFillColor(HexColor(TEXT))
-        c.drawString(65*mm, y, str(value))
-        y -= 6*mm
-
-    # 발급일 (하단 고정)
-    c.setFillColor(HexColor(GRAY))
-    c.setFont(font_name, 9)
-    today = now_kst().strftime("%Y년 %m월 %d일")
-    c.drawCentredString(width/2, 25*mm, f"발급일: {today}")
-
-    c.save()
-    buffer.seek(0)
-    return buffer.read()
-
-
 # ==================== GPS & QR Based Attendance Routes ====================
 
 @router.post("/location")
@@ -786,11 +339,10 @@ async def update_worker_location(
     auth: dict = Depends(require_worker),
     db: Database = Depends(get_db)
 ):
-    """근무자 GPS 위치 업데이트"""
+    """근무자 GPS 위치 업데이트 (버퍼에 기록, 주기적으로 일괄 저장)"""
     worker = auth["worker"]
 
-    # 위치 정보 저장
-    db.save_worker_location(
+    location_ingest.get_ingestor(db).add(
         worker_id=worker["id"],
         event_id=event_id,
         latitude=latitude,
@@ -812,6 +364,8 @@ async def get_nearby_workers(
         raise HTTPException(status_code=404, detail="행사를 찾을 수 없습니다")
 
     workers = db.get_nearby_workers(event_id)
+    inside = [w["worker_id"] for w in workers if w["within_range"]]
+    outside = [w["worker_id"] for w in workers if not w["within_range"]]
 
     return {
         "event_id": event_id,
@@ -821,7 +375,9 @@ async def get_nearby_workers(
             "longitude": float(event.get("location_lng")) if event.get("location_lng") else None,
             "radius": event.get("location_radius", 100)
         },
-        "workers": workers
+        "workers": workers,
+        "in_range_worker_ids": inside,
+        "out_of_range_worker_ids": outside
     }
 
 
@@ -847,7 +403,7 @@ async def request_attendance_approval(
             raise HTTPException(status_code=400, detail="행사에 위치 정보가 설정되지 않았습니다")
 
         # 근무자 최근 위치 가져오기
-        worker_location = db.get_worker_location(worker["id"], event_id)
+        worker_location = location_ingest.get_latest_location(db, worker["id"], event_id)
         if not worker_location:
             raise HTTPException(status_code=400, detail="GPS 위치 정보를 먼저 업데이트해주세요")
 
@@ -983,78 +539,10 @@ async def get_confirmed_workers_with_gps(
     db: Database = Depends(get_db)
 ):
     """확정된 근무자 목록 + GPS 상태 (관리자 전용)"""
-    event = db.get_event(event_id)
-    if not event:
+    board = event_board.get_confirmed_board(db, event_id)
+    if board is None:
         raise HTTPException(status_code=404, detail="행사를 찾을 수 없습니다")
-
-    # 확정된 지원자 목록 가져오기
-    applications = db.list_applications_by_event(event_id)
-    confirmed_workers = []
-
-    for app in applications:
-        if app.get("status") != "CONFIRMED":
-            continue
-
-        worker_id = app["worker_id"]
-
-        # 근무자 정보
-        worker = db.get_worker_by_id(worker_id)
-        if not worker:
-            continue
-
-        # GPS 위치 정보
-        location = db.get_worker_location(worker_id, event_id)
-
-        # 거리 계산
-        distance_meters = None
-        in_range = False
-        if location and event.get("location_lat") and event.get("location_lng"):
-            distance_meters = int(db.calculate_distance(
-                float(event["location_lat"]), float(event["location_lng"]),
-                float(location["latitude"]), float(location["longitude"])
-            ))
-            radius = event.get("location_radius", 100)
-            in_range = distance_meters <= radius
-
-        # 출퇴근 상태 확인
-        attendance = db.get_attendance_by_application(app["id"])
-        check_in_time = None
-        check_out_time = None
-        attendance_id = None
-
-        if attendance:
-            attendance_id = attendance["id"]
-            check_in_time = attendance.get("check_in_time").isoformat() if attendance.get("check_in_time") else None
-            check_out_time = attendance.get("check_out_time").isoformat() if attendance.get("check_out_time") else None
-
-        confirmed_workers.append({
-            "worker_id": worker_id,
-            "worker_name": worker["name"],
-            "worker_phone": worker.get("phone"),
-            "application_id": app["id"],
-            "attendance_id": attendance_id,
-            "gps_location": {
-                "latitude": float(location["latitude"]) if location else None,
-                "longitude": float(location["longitude"]) if location else None,
-                "updated_at": location["updated_at"].isoformat() if location and location.get("updated_at") else None,
-            } if location else None,
-            "distance_meters": distance_meters,
-            "within_range": in_range,
-            "check_in_time": check_in_time,
-            "check_out_time": check_out_time,
-        })
-
-    return {
-        "event_id": event_id,
-        "event_title": event.get("title"),
-        "event_location": {
-            "address": event.get("location_address"),
-            "latitude": float(event.get("location_lat")) if event.get("location_lat") else None,
-            "longitude": float(event.get("location_lng")) if event.get("location_lng") else None,
-            "radius": event.get("location_radius", 100)
-        },
-        "workers": confirmed_workers
-    }
+    return board
 
 
 @router.post("/admin/check-in/{application_id}")
@@ -1112,7 +600,7 @@ async def admin_check_in_worker(
             """, (latitude, longitude, attendance_id))
     elif not manual:
         # GPS 기반이지만 좌표가 없으면 최근 위치 사용
-        location = db.get_worker_location(worker_id, event_id)
+        location = location_ingest.get_latest_location(db, worker_id, event_id)
         if location:
             with db.get_connection() as conn:
                 cursor = conn.cursor()
@@ -1124,6 +612,7 @@ async def admin_check_in_worker(
 
     # 출근 처리
     db.check_in(attendance_id)
+    event_board.invalidate(event_id)
 
     # WPT 출근 보상 지급
     reward_result = _process_checkin_reward(db, worker_id, attendance_id)
@@ -1172,7 +661,7 @@ async def admin_check_out_worker(
             """, (latitude, longitude, attendance_id))
     elif not manual:
         # GPS 기반이지만 좌표가 없으면 최근 위치 사용
-        location = db.get_worker_location(attendance["worker_id"], attendance["event_id"])
+        location = location_ingest.get_latest_location(db, attendance["worker_id"], attendance["event_id"])
         if location:
             with db.get_connection() as conn:
                 cursor = conn.cursor()
@@ -1184,6 +673,7 @@ async def admin_check_out_worker(
 
     # 퇴근 처리
     db.check_out(attendance_id, admin_user["id"])
+    event_board.invalidate(attendance["event_id"])
 
     # 업데이트된 출석 정보 재조회
     updated_attendance = db.get_attendance(attendance_id)
@@ -1199,6 +689,8 @@ async def admin_check_out_worker(
     if reward_result:
         logger.info(f"Admin check-out reward: {reward_result['wpt_reward']['amount']} WPT, hours: {reward_result['work_hours']}")
 
+    badge_engine.award_after_checkout(db, updated_attendance["worker_id"])
+
     return {
         "message": "퇴근 처리가 완료되었습니다",
         "attendance_id": attendance_id,
@@ -7,6 +7,7 @@ import threading
 from ..config import get_settings, Settings
 from ..dependencies import get_db, get_current_user
 from ..auth.telegram import verify_telegram_init_data
+from ..auth import principal
 from ..auth.jwt import create_access_token
 from ..auth.password import hash_password, verify_password
 from ..schemas.auth import TelegramAuthRequest, TokenResponse, UserInfo
@@ -31,6 +32,7 @@ def _give_registration_bonus_sync(worker_id: int):
         # 지갑 주소 생성
         wallet_address = wpt_service.get_deterministic_address(worker_id)
         db.set_worker_wallet_address(worker_id, wallet_address)
+        principal.invalidate_worker(worker_id)
 
         tx_hash = None
         reason = "신규 가입 환영 보너스"
@@ -110,7 +112,8 @@ async def telegram_auth(
             telegram_id = int(parts[1])
             username = parts[2] if len(parts) > 2 else ""
             role = "admin" if db.is_admin(telegram_id) or telegram_id in settings.admin_ids else "worker"
-            token = create_access_token(telegram_id, username, role)
+            worker = db.get_worker_by_telegram_id(telegram_id)
+            token = create_access_token(telegram_id, username, role, worker["id"] if worker else None)
             return TokenResponse(
                 access_token=token,
                 telegram_id=telegram_id,
@@ -135,8 +138,9 @@ async def telegram_auth(
     # 역할 확인
     role = "admin" if db.is_admin(telegram_id) or telegram_id in settings.admin_ids else "worker"
 
-    # JWT 토큰 발급
-    token = create_access_token(telegram_id, username, role)
+    # JWT 토큰 발급 (등록된 근무자면 worker_id 포함)
+    worker = db.get_worker_by_telegram_id(telegram_id)
+    token = create_access_token(telegram_id, username, role, worker["id"] if worker else None)
 
     return TokenResponse(
         access_token=token,
@@ -218,7 +222,8 @@ async def email_register(
     token = create_access_token(
         telegram_id=actual_telegram_id,
         username=request.email,
-        role="worker"
+        role="worker",
+        worker_id=worker_id
     )
 
     return TokenResponse(
@@ -255,7 +260,8 @@ async def email_login(
     token = create_access_token(
         telegram_id=worker.get('telegram_id', 0),
         username=request.email,
-        role=role
+        role=role,
+        worker_id=worker["id"]
     )
 
     return TokenResponse(
@@ -300,6 +306,7 @@ async def change_password(
             "UPDATE workers SET password_hash = %s WHERE email = %s",
             (new_hash, email)
         )
+    principal.invalidate_worker(worker["id"])
 
     return {"success": True, "message": "비밀번호가 변경되었습니다"}
 
@@ -322,20 +329,13 @@ async def set_admin(
         raise HTTPException(status_code=401, detail="인증이 필요합니다")
 
     # 요청자가 관리자인지 확인
-    telegram_id = user.get("telegram_id", 0)
-    requester_email = user.get("username", "")
-
-    is_requester_admin = (
-        db.is_admin(telegram_id) or
-        telegram_id in settings.admin_ids or
-        db.is_email_admin(requester_email)
-    )
-
-    if not is_requester_admin:
+    if not principal.resolve_admin(user, db):
         raise HTTPException(status_code=403, detail="관리자만 권한을 변경할 수 있습니다")
 
     # 관리자 권한 설정
     db.set_worker_admin(worker_id, is_admin)
+    principal.invalidate_worker(worker_id)
+    principal.invalidate_admins()
 
     return {
         "success": True,
@@ -356,16 +356,7 @@ async def list_workers(
         raise HTTPException(status_code=401, detail="인증이 필요합니다")
 
     # 요청자가 관리자인지 확인
-    telegram_id = user.get("telegram_id", 0)
-    requester_email = user.get("username", "")
-
-    is_requester_admin = (
-        db.is_admin(telegram_id) or
-        telegram_id in settings.admin_ids or
-        db.is_email_admin(requester_email)
-    )
-
-    if not is_requester_admin:
+    if not principal.resolve_admin(user, db):
         raise HTTPException(status_code=403, detail="관리자만 조회할 수 있습니다")
 
     workers = db.get_all_workers()
@@ -2,48 +2,18 @@
 from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel
 from typing import Optional, List
+from datetime import timedelta
 import logging
 
 from ..dependencies import get_db, require_auth, require_admin
-from db import Database
+from ..services import badge_engine
+from ..services.badge_engine import BADGE_DEFINITIONS
+from db import Database, now_kst_naive
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
 
-# ===== 배지 정의 =====
-# 프리미엄 원형 아이콘 스타일 (이모지 대신 심플한 기하학적 심볼)
-BADGE_DEFINITIONS = {
-    # 근무 횟수 배지
-    "WORK_COUNT": {
-        1: {"title": "첫 근무 완료", "description": "첫 번째 근무를 완료했습니다", "icon": "●", "threshold": 1},
-        2: {"title": "10회 근무 달성", "description": "10번의 근무를 완료했습니다", "icon": "★", "threshold": 10},
-        3: {"title": "50회 근무 달성", "description": "50번의 근무를 완료했습니다", "icon": "✦", "threshold": 50},
-        4: {"title": "100회 근무 달성", "description": "100번의 근무를 완료했습니다", "icon": "✴", "threshold": 100},
-    },
-    # 신뢰도 배지
-    "TRUST": {
-        1: {"title": "신뢰할 수 있는 근무자", "description": "노쇼 없이 10회 근무 완료", "icon": "✓", "threshold": 10},
-        2: {"title": "믿음직한 프로", "description": "노쇼 없이 30회 근무 완료", "icon": "⬡", "threshold": 30},
-        3: {"title": "최고 신뢰 등급", "description": "노쇼 없이 50회 근무 완료", "icon": "♔", "threshold": 50},
-    },
-    # 블록체인 기록 배지
-    "BLOCKCHAIN": {
-        1: {"title": "블록체인 데뷔", "description": "첫 블록체인 근무 기록", "icon": "◇", "threshold": 1},
-        2: {"title": "블록체인 프로", "description": "10회 블록체인 기록", "icon": "⬢", "threshold": 10},
-        3: {"title": "블록체인 마스터", "description": "30회 블록체인 기록", "icon": "◈", "threshold": 30},
-    },
-    # 프로필 완성 배지
-    "PROFILE": {
-        1: {"title": "프로필 완성", "description": "모든 프로필 정보 입력 완료", "icon": "◆", "threshold": 1},
-    },
-    # 사진 등록 배지
-    "PHOTO": {
-        1: {"title": "얼굴 등록 완료", "description": "프로필 사진 등록 완료", "icon": "◉", "threshold": 1},
-    },
-}
-
-
 class BadgeResponse(BaseModel):
     """배지 응답"""
     id: int
@@ -67,89 +37,10 @@ def check_and_award_badges(worker_id: int, db: Database) -> List[dict]:
     근무자의 통계를 확인하고 조건에 맞는 배지를 자동 발급
     Returns: 새로 발급된 배지 목록
     """
-    awarded = []
-    stats = db.get_worker_stats_for_badges(worker_id)
-    worker = db.get_worker_by_id(worker_id)
-
-    if not worker:
-        return awarded
-
-    # 1. 근무 횟수 배지
-    for level, info in BADGE_DEFINITIONS["WORK_COUNT"].items():
-        if stats["total_work_count"] >= info["threshold"]:
-            badge_id = db.award_badge(
-                worker_id=worker_id,
-                badge_type="WORK_COUNT",
-                badge_level=level,
-                title=info["title"],
-                description=info["description"],
-                icon=info["icon"]
-            )
-            if badge_id:
-                awarded.append({"type": "WORK_COUNT", "level": level, **info})
-
-    # 2. 신뢰도 배지 (노쇼 없이 완료)
-    for level, info in BADGE_DEFINITIONS["TRUST"].items():
-        if stats["perfect_attendance"] >= info["threshold"]:
-            badge_id = db.award_badge(
-                worker_id=worker_id,
-                badge_type="TRUST",
-                badge_level=level,
-                title=info["title"],
-                description=info["description"],
-                icon=info["icon"]
-            )
-            if badge_id:
-                awarded.append({"type": "TRUST", "level": level, **info})
-
-    # 3. 블록체인 기록 배지
-    for level, info in BADGE_DEFINITIONS["BLOCKCHAIN"].items():
-        if stats["blockchain_records"] >= info["threshold"]:
-            badge_id = db.award_badge(
-                worker_id=worker_id,
-                badge_type="BLOCKCHAIN",
-                badge_level=level,
-                title=info["title"],
-                description=info["description"],
-                icon=info["icon"]
-            )
-            if badge_id:
-                awarded.append({"type": "BLOCKCHAIN", "level": level, **info})
-
-    # 4. 프로필 완성 배지
-    profile_complete = all([
-        worker.get("name"),
-        worker.get("phone"),
-        worker.get("birth_date"),
-        worker.get("bank_name"),
-        worker.get("bank_account"),
-    ])
-    if profile_complete:
-        badge_id = db.award_badge(
-            worker_id=worker_id,
-            badge_type="PROFILE",
-            badge_level=1,
-            title=BADGE_DEFINITIONS["PROFILE"][1]["title"],
-            description=BADGE_DEFINITIONS["PROFILE"][1]["description"],
-            icon=BADGE_DEFINITIONS["PROFILE"][1]["icon"]
-        )
-        if badge_id:
-            awarded.append({"type": "PROFILE", "level": 1, **BADGE_DEFINITIONS["PROFILE"][1]})
-
-    # 5. 사진 등록 배지
-    if worker.get("face_photo_file_id"):
-        badge_id = db.award_badge(
-            worker_id=worker_id,
-            badge_type="PHOTO",
-            badge_level=1,
-            title=BADGE_DEFINITIONS["PHOTO"][1]["title"],
-            description=BADGE_DEFINITIONS["PHOTO"][1]["description"],
-            icon=BADGE_DEFINITIONS["PHOTO"][1]["icon"]
-        )
-        if badge_id:
-            awarded.append({"type": "PHOTO", "level": 1, **BADGE_DEFINITIONS["PHOTO"][1]})
-
-    return awarded
+    return [
+        {k: v for k, v in badge.items() if k != "worker_id"}
+        for badge in badge_engine.award_new_badges(db, [worker_id])
+    ]
 
 
 @router.get("/me", response_model=BadgeSummaryResponse)
@@ -191,6 +82,26 @@ async def get_badge_definitions():
     return {"definitions": BADGE_DEFINITIONS}
 
 
+@router.post("/evaluate")
+async def evaluate_all_badges(
+    since_hours: Optional[int] = None,
+    admin: dict = Depends(require_admin),
+    db: Database = Depends(get_db)
+):
+    """전체 근무자 배지 일괄 평가 (since_hours 지정 시 최근 변경된 근무자만, 관리자 전용)"""
+    if since_hours:
+        since = now_kst_naive() - timedelta(hours=since_hours)
+        awarded = badge_engine.award_badges_since(db, since)
+    else:
+        awarded = badge_engine.award_new_badges(db)
+
+    return {
+        "awarded_count": len(awarded),
+        "worker_count": len({b["worker_id"] for b in awarded}),
+        "awarded_badges": awarded
+    }
+
+
 @router.get("/{worker_id}", response_model=BadgeSummaryResponse)
 async def get_worker_badges(
     worker_id: int,
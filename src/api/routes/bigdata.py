@@ -1,9 +1,11 @@
 """빅데이터 분석 API Routes"""
 from fastapi import APIRouter, Depends, HTTPException, Query
-from datetime import datetime
+from fastapi.responses import StreamingResponse
+from datetime import date, datetime
 from typing import List, Optional
 
 from ..dependencies import get_db, require_auth, require_admin
+from ..services import file_streams
 from db import Database
 
 router = APIRouter(prefix="/bigdata", tags=["bigdata"])
@@ -429,6 +431,34 @@ async def get_worker_analytics(
     return analytics
 
 
+# ==================== 분석용 내보내기 ====================
+
+@router.get("/export/{table}.csv")
+async def export_analytics_csv(
+    table: str,
+    date_from: Optional[date] = None,
+    date_to: Optional[date] = None,
+    since: Optional[datetime] = Query(None, description="이 시각 이후 변경된 행만"),
+    admin: dict = Depends(require_admin),
+    db: Database = Depends(get_db)
+):
+    """분석용 테이블 CSV 다운로드 (COPY 스트리밍, 대용량/Parquet는 batch/export_analytics.py)"""
+    from analytics_export import EXPORT_TABLES, copy_csv
+
+    if table not in EXPORT_TABLES:
+        raise HTTPException(status_code=404, detail=f"내보낼 수 없는 테이블입니다 ({', '.join(EXPORT_TABLES)})")
+
+    filename = f"{table}_{datetime.now():%Y%m%d_%H%M%S}.csv"
+    return StreamingResponse(
+        file_streams.iter_file(lambda f: copy_csv(db, f, table, date_from, date_to, since)),
+        media_type="text/csv",
+        headers={
+            "Content-Disposition": f'attachment; filename="{filename}"',
+            "Access-Control-Expose-Headers": "Content-Disposition"
+        }
+    )
+
+
 # ==================== 배치 작업 ====================
 
 @router.post("/batch/calculate-all-stats")
@@ -441,11 +471,10 @@ async def batch_calculate_all_stats(
     year = data.get('year', datetime.now().year)
     month = data.get('month', datetime.now().month)
 
-    # 모든 근무자 조회
-    workers = db.list_workers(limit=10000)
+    # 모든 근무자 순회 (서버 커서)
     calculated = 0
 
-    for worker in workers:
+    for worker in db.iter_worker_refs():
         try:
             db.calculate_worker_monthly_stats(worker['id'], year, month)
             db.update_worker_cumulative_stats(worker['id'])
@@ -462,10 +491,9 @@ async def batch_update_cumulative_stats(
     db: Database = Depends(get_db)
 ):
     """전체 근무자 누적 통계 업데이트 (관리자)"""
-    workers = db.list_workers(limit=10000)
     updated = 0
 
-    for worker in workers:
+    for worker in db.iter_worker_refs():
         try:
             db.update_worker_cumulative_stats(worker['id'])
             updated += 1
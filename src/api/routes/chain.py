@@ -1,13 +1,12 @@
 """Blockchain Routes"""
 from fastapi import APIRouter, Depends, HTTPException
-from fastapi.responses import StreamingResponse
-from io import BytesIO
-from datetime import datetime
+from fastapi.responses import FileResponse
 
 from ..dependencies import get_db, require_auth, require_worker, require_admin
+from ..auth import principal
 from ..schemas.attendance import ChainLogResponse
+from ..services import pdf_service
 from db import Database
-from utils import now_kst
 
 router = APIRouter()
 
@@ -69,6 +68,7 @@ async def get_my_tokens(
     if not wallet_address:
         wallet_address = wpt_service.get_deterministic_address(worker["id"])
         db.set_worker_wallet_address(worker["id"], wallet_address)
+        principal.invalidate_worker(worker["id"])
 
     # WPT 잔액 조회
     if wpt_service.enabled:
@@ -102,6 +102,7 @@ async def download_certificate(
     if not wallet_address:
         wallet_address = wpt_service.get_deterministic_address(worker["id"])
         db.set_worker_wallet_address(worker["id"], wallet_address)
+        principal.invalidate_worker(worker["id"])
 
     # WPT 크레딧 차감
     tx_hash = None
@@ -150,13 +151,11 @@ async def download_certificate(
 
     # PDF 생성
     try:
-        pdf_bytes = generate_certificate_pdf(worker, log)
-        return StreamingResponse(
-            BytesIO(pdf_bytes),
+        pdf_path = await pdf_service.certificate_pdf(worker, log)
+        return FileResponse(
+            pdf_path,
             media_type="application/pdf",
-            headers={
-                "Content-Disposition": f"attachment; filename=certificate_{log_id}.pdf"
-            }
+            filename=f"certificate_{log_id}.pdf"
         )
     except Exception as e:
         # 실패 시 크레딧 복구 (WPT는 이미 소각되어 복구 불가, 관리자에게 문의 안내)
@@ -184,289 +183,16 @@ async def admin_download_certificate(
 
     # PDF 생성
     try:
-        pdf_bytes = generate_certificate_pdf(worker, log)
-        return StreamingResponse(
-            BytesIO(pdf_bytes),
+        pdf_path = await pdf_service.certificate_pdf(worker, log)
+        return FileResponse(
+            pdf_path,
             media_type="application/pdf",
-            headers={
-                "Content-Disposition": f"attachment; filename=certificate_{log_id}.pdf"
-            }
+            filename=f"certificate_{log_id}.pdf"
         )
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"증명서 생성 실패: {str(e)}")
 
 
-def generate_certificate_pdf(worker: dict, log: dict) -> bytes:
-    """블록체인 업무증명서 PDF 생성"""
-    from reportlab.lib.pagesizes import A4
-    from reportlab.lib.units import mm
-    from reportlab.pdfgen import canvas
-    from reportlab.pdfbase import pdfmetrics
-    from reportlab.pdfbase.ttfonts import TTFont
-    from reportlab.lib.colors import HexColor
-    import os
-    import qrcode
-    import hashlib
-
-    # 폰트 등록
-    font_path = "/usr/share/fonts/truetype/nanum/NanumGothic.ttf"
-    bold_font_path = "/usr/share/fonts/truetype/nanum/NanumGothicBold.ttf"
-
-    if os.path.exists(font_path):
-        try:
-            pdfmetrics.registerFont(TTFont("NanumGothic", font_path))
-        except:
-            pass
-        if os.path.exists(bold_font_path):
-            try:
-                pdfmetrics.registerFont(TTFont("NanumGothicBold", bold_font_path))
-            except:
-                pass
-        else:
-            try:
-                pdfmetrics.registerFont(TTFont("NanumGothicBold", font_path))
-            except:
-                pass
-        font_name = "NanumGothic"
-        bold_font = "NanumGothicBold"
-    else:
-        font_name = "Helvetica"
-        bold_font = "Helvetica-Bold"
-
-    buffer = BytesIO()
-    c = canvas.Canvas(buffer, pagesize=A4)
-    width, height = A4
-
-    # 색상 정의 (네이비, 그레이, 블랙, 화이트 톤)
-    NAVY = "#1E3A5F"
-    NAVY_DARK = "#152A45"
-    BLACK = "#1F2937"
-    DARK_GRAY = "#374151"
-    GRAY = "#6B7280"
-    LIGHT_GRAY = "#9CA3AF"
-    WHITE = "#FFFFFF"
-    BG_LIGHT = "#F3F4F6"
-
-    # 마진 설정
-    margin_x = 20 * mm
-    margin_y = 12 * mm
-    content_width = width - 2 * margin_x
-
-    # 문서번호 생성
-    tx_hash = log.get("tx_hash", "")
-    if tx_hash:
-        doc_number = f"WPC-{tx_hash[-8:].upper()}"
-    else:
-        doc_number = f"WPC-{hashlib.md5(str(log.get('id', 0)).encode()).hexdigest()[:8].upper()}"
-
-    # ==================== 상단 헤더 ====================
-    header_height = 38 * mm
-    c.setFillColor(HexColor(NAVY))
-    c.rect(0, height - header_height, width, header_height, stroke=0, fill=1)
-
-    # 헤더 하단 장식선
-    c.setFillColor(HexColor(NAVY_DARK))
-    c.rect(0, height - header_height, width, 2*mm, stroke=0, fill=1)
-
-    # 제목
-    y = height - 15 * mm
-    c.setFillColor(HexColor(WHITE))
-    c.setFont(bold_font, 22)
-    c.drawCentredString(width / 2, y, "블록체인 업무증명서")
-
-    y -= 7 * mm
-    c.setFont(font_name, 9)
-    c.setFillColor(HexColor("#D1D5DB"))
-    c.drawCentredString(width / 2, y, "Blockchain Work Certificate")
-
-    y -= 6 * mm
-    c.setFont(font_name, 8)
-    c.drawCentredString(width / 2, y, f"문서번호: {doc_number}")
-
-    # ==================== 본문 ====================
-    y = height - header_height - 8 * mm
-    row_height = 7 * mm
-    label_width = 28 * mm
-
-    def draw_section(y_pos, title, color):
-        c.setFillColor(HexColor(color))
-        c.roundRect(margin_x, y_pos - 5*mm, 3*mm, 5*mm, 1*mm, stroke=0, fill=1)
-        c.setFillColor(HexColor(BLACK))
-        c.setFont(bold_font, 10)
-        c.drawString(margin_x + 5*mm, y_pos - 4*mm, title)
-        return y_pos - 9 * mm
-
-    def draw_row(y_pos, label, value):
-        c.setStrokeColor(HexColor("#E5E7EB"))
-        c.setLineWidth(0.5)
-        # 라벨
-        c.setFillColor(HexColor(BG_LIGHT))
-        c.rect(margin_x, y_pos - row_height, label_width, row_height, stroke=1, fill=1)
-        # 값
-        c.setFillColor(HexColor(WHITE))
-        c.rect(margin_x + label_width, y_pos - row_height, content_width - label_width, row_height, stroke=1, fill=1)
-        # 텍스트
-        c.setFillColor(HexColor(DARK_GRAY))
-        c.setFont(bold_font, 8)
-        c.drawString(margin_x + 2*mm, y_pos - 5*mm, label)
-        c.setFillColor(HexColor(BLACK))
-        c.setFont(font_name, 8)
-        c.drawString(margin_x + label_width + 3*mm, y_pos - 5*mm, str(value) if value else "-")
-        return y_pos - row_height
-
-    # 인적사항
-    y = draw_section(y, "인적사항", NAVY)
-    y = draw_row(y, "성명", worker.get("name", "-"))
-    y = draw_row(y, "생년월일", worker.get("birth_date", "-") or "-")
-    y = draw_row(y, "연락처", worker.get("phone", "-"))
-
-    # 근무내용
-    y -= 5 * mm
-    y = draw_section(y, "근무내용", DARK_GRAY)
-
-    from datetime import datetime as dt
-
-    def format_time(time_val):
-        """시간 값을 HH:MM 형식으로 변환"""
-        if not time_val:
-            return "-"
-        # datetime 객체인 경우
-        if isinstance(time_val, dt):
-            return time_val.strftime("%H:%M")
-        # 문자열인 경우
-        if isinstance(time_val, str):
-            if "T" in time_val:
-                return time_val.split("T")[1][:5]
-            elif " " in time_val:
-                return time_val.split(" ")[1][:5]
-            elif ":" in time_val:
-                return time_val[:5]
-        return "-"
-
-    check_in = log.get("check_in_time")
-    check_out = log.get("check_out_time")
-    check_in_time = format_time(check_in)
-    check_out_time = format_time(check_out)
-
-    worked_minutes = log.get("worked_minutes", 0) or 0
-    hours = worked_minutes // 60
-    mins = worked_minutes % 60
-
-    y = draw_row(y, "행사명", log.get("event_title", "-"))
-    y = draw_row(y, "근무지", log.get("location", "-") or "-")
-    y = draw_row(y, "근무일", log.get("event_date", "-"))
-    y = draw_row(y, "근무시간", f"{check_in_time} ~ {check_out_time} ({hours}시간 {mins}분)")
-
-    # 급여내역
-    y -= 5 * mm
-    y = draw_section(y, "급여내역", GRAY)
-
-    # 행사 등록 금액 그대로 사용
-    gross_pay = log.get("pay_amount", 0) or 0
-    tax_amount = int(gross_pay * 0.033)
-    net_pay = gross_pay - tax_amount
-
-    y = draw_row(y, "총급여", f"{gross_pay:,}원 (세전)")
-    y = draw_row(y, "공제액", f"{tax_amount:,}원 (3.3%)")
-
-    # 실수령액 강조
-    c.setStrokeColor(HexColor("#E5E7EB"))
-    c.setFillColor(HexColor(BG_LIGHT))
-    c.rect(margin_x, y - row_height, label_width, row_height, stroke=1, fill=1)
-    c.setFillColor(HexColor("#E5E7EB"))
-    c.rect(margin_x + label_width, y - row_height, content_width - label_width, row_height, stroke=1, fill=1)
-    c.setFillColor(HexColor(DARK_GRAY))
-    c.setFont(bold_font, 8)
-    c.drawString(margin_x + 2*mm, y - 5*mm, "실수령액")
-    c.setFillColor(HexColor(BLACK))
-    c.setFont(bold_font, 9)
-    c.drawString(margin_x + label_width + 3*mm, y - 5*mm, f"{net_pay:,}원")
-    y -= row_height
-
-    # 블록체인 검증
-    y -= 5 * mm
-    y = draw_section(y, "블록체인 검증", NAVY_DARK)
-
-    block_num = log.get("block_number", "-")
-    y = draw_row(y, "네트워크", "Polygon Amoy Testnet")
-    y = draw_row(y, "블록번호", str(block_num))
-
-    # TX Hash
-    c.setStrokeColor(HexColor("#E5E7EB"))
-    c.setFillColor(HexColor(BG_LIGHT))
-    c.rect(margin_x, y - row_height, label_width, row_height, stroke=1, fill=1)
-    c.setFillColor(HexColor(WHITE))
-    c.rect(margin_x + label_width, y - row_height, content_width - label_width, row_height, stroke=1, fill=1)
-    c.setFillColor(HexColor(DARK_GRAY))
-    c.setFont(bold_font, 8)
-    c.drawString(margin_x + 2*mm, y - 5*mm, "TX Hash")
-    c.setFillColor(HexColor(NAVY))
-    c.setFont(font_name, 6)
-    if tx_hash:
-        display_hash = f"{tx_hash[:30]}...{tx_hash[-12:]}" if len(tx_hash) > 45 else tx_hash
-        c.drawString(margin_x + label_width + 3*mm, y - 5*mm, display_hash)
-    else:
-        c.setFillColor(HexColor(LIGHT_GRAY))
-        c.drawString(margin_x + label_width + 3*mm, y - 5*mm, "Pending")
-    y -= row_height
-
-    # ==================== 증명 문구 ====================
-    y -= 10 * mm
-    c.setFillColor(HexColor(BLACK))
-    c.setFont(font_name, 10)
-    c.drawCentredString(width / 2, y, "위 내용이 사실임을 블록체인 기록으로 증명합니다.")
-
-    # ==================== 발급정보 ====================
-    y -= 12 * mm
-    today = now_kst().strftime("%Y년 %m월 %d일")
-    c.setFont(font_name, 10)
-    c.drawCentredString(width / 2, y, today)
-
-    y -= 10 * mm
-    c.setFillColor(HexColor(NAVY))
-    c.setFont(bold_font, 13)
-    c.drawCentredString(width / 2, y, "WorkProof Chain")
-
-    y -= 5 * mm
-    c.setFont(font_name, 8)
-    c.setFillColor(HexColor(GRAY))
-    c.drawCentredString(width / 2, y, "블록체인 기반 업무이력 증명 시스템")
-
-    # ==================== QR 코드 ====================
-    if tx_hash:
-        qr_url = f"https://amoy.polygonscan.com/tx/{tx_hash}"
-        qr = qrcode.QRCode(version=1, box_size=6, border=2)
-        qr.add_data(qr_url)
-        qr.make(fit=True)
-        qr_img = qr.make_image(fill_color="#1E3A5F", back_color="white")
-
-        qr_buffer = BytesIO()
-        qr_img.save(qr_buffer, format='PNG')
-        qr_buffer.seek(0)
-
-        from reportlab.lib.utils import ImageReader
-        qr_image = ImageReader(qr_buffer)
-
-        qr_size = 18 * mm
-        qr_x = width - margin_x - qr_size - 3*mm
-        qr_y = margin_y + 6*mm
-        c.drawImage(qr_image, qr_x, qr_y, width=qr_size, height=qr_size)
-
-        c.setFont(font_name, 6)
-        c.setFillColor(HexColor(GRAY))
-        c.drawCentredString(qr_x + qr_size/2, qr_y - 2*mm, "QR 스캔 검증")
-
-    # ==================== 하단 고지 ====================
-    c.setFillColor(HexColor(LIGHT_GRAY))
-    c.setFont(font_name, 6)
-    c.drawString(margin_x, margin_y + 6*mm, "※ 본 증명서는 블록체인에 기록된 업무 내역을 바탕으로 자동 발급되었습니다.")
-    c.drawString(margin_x, margin_y + 2*mm, "※ QR코드 또는 TX Hash로 Polygonscan에서 원본 기록 검증이 가능합니다.")
-
-    c.save()
-    buffer.seek(0)
-    return buffer.read()
-
-
 @router.post("/verify")
 async def verify_log(
     data: dict,
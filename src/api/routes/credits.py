@@ -6,6 +6,7 @@ from datetime import datetime
 import logging
 
 from ..dependencies import get_db, require_auth, require_admin
+from ..auth import principal
 from db import Database
 from wpt_service import wpt_service
 from utils import now_kst
@@ -157,6 +158,7 @@ async def get_my_credits(
     if not wallet_address:
         wallet_address = wpt_service.get_deterministic_address(worker["id"])
         db.set_worker_wallet_address(worker["id"], wallet_address)
+        principal.invalidate_worker(worker["id"])
 
     # WPT 서비스가 활성화되어 있으면 블록체인에서 조회
     if wpt_service.enabled:
@@ -220,6 +222,7 @@ async def mint_credits(
     if not wallet_address:
         wallet_address = wpt_service.get_deterministic_address(worker["id"])
         db.set_worker_wallet_address(worker["id"], wallet_address)
+        principal.invalidate_worker(worker["id"])
 
     if not wpt_service.enabled:
         # WPT 비활성화 시 DB 토큰만 추가
@@ -288,6 +291,7 @@ async def burn_my_credits(
     if not wallet_address:
         wallet_address = wpt_service.get_deterministic_address(worker["id"])
         db.set_worker_wallet_address(worker["id"], wallet_address)
+        principal.invalidate_worker(worker["id"])
 
     if not wpt_service.enabled:
         # WPT 비활성화 시 DB 토큰만 사용
@@ -373,6 +377,7 @@ async def get_worker_credits(
     if not wallet_address:
         wallet_address = wpt_service.get_deterministic_address(worker["id"])
         db.set_worker_wallet_address(worker["id"], wallet_address)
+        principal.invalidate_worker(worker["id"])
 
     if wpt_service.enabled:
         balance = wpt_service.get_balance(wallet_address)
@@ -465,38 +470,31 @@ async def daily_checkin(
     if today_checkin:
         raise HTTPException(status_code=400, detail="오늘은 이미 출석체크를 했습니다")
 
-    # 연속 출석일 계산 (체크인 전)
-    current_streak = db.get_streak_days(worker["id"])
-
-    # 연속 출석 보너스: 7일마다 +1 크레딧
-    base_reward = 1
-    bonus = current_streak // 7
-    reward_amount = base_reward + bonus
-
     wallet_address = worker.get("wallet_address")
     if not wallet_address:
         wallet_address = wpt_service.get_deterministic_address(worker["id"])
         db.set_worker_wallet_address(worker["id"], wallet_address)
+        principal.invalidate_worker(worker["id"])
 
-    tx_hash = None
-
-    if wpt_service.enabled:
-        # WPT 토큰 발행
-        result = wpt_service.mint_credits(
-            wallet_address,
-            reward_amount,
-            f"일일 출석체크 (연속 {current_streak + 1}일)"
-        )
-        if result["success"]:
-            tx_hash = result.get("tx_hash")
-        else:
-            raise HTTPException(status_code=500, detail="크레딧 발행에 실패했습니다")
-
-    # DB 토큰 추가
-    db.add_tokens(worker["id"], reward_amount)
+    # 출석 기록 + 연속 출석 + 토큰 적립(한 문장)의 결과로 보상을 정해 발행
+    # 발행 실패 시 전부 롤백, 동시 요청은 기록 단계에서 None
+    # 연속 출석 보너스: 7일마다 +1 크레딧
+    with db.daily_checkin(worker["id"], base_reward=1, bonus_days=7) as checkin:
+        if not checkin:
+            raise HTTPException(status_code=400, detail="오늘은 이미 출석체크를 했습니다")
+        reward_amount = checkin["reward_amount"]
 
-    # 출석체크 기록 생성
-    checkin = db.create_daily_checkin(worker["id"], reward_amount, tx_hash)
+        if wpt_service.enabled:
+            # WPT 토큰 발행
+            result = wpt_service.mint_credits(
+                wallet_address,
+                reward_amount,
+                f"일일 출석체크 (연속 {checkin['streak_days']}일)"
+            )
+            if not result["success"]:
+                raise HTTPException(status_code=500, detail="크레딧 발행에 실패했습니다")
+            checkin["tx_hash"] = result.get("tx_hash")
+    tx_hash = checkin["tx_hash"]
 
     # 새 잔액 조회
     if wpt_service.enabled:
@@ -5,7 +5,7 @@ import logging
 from ..dependencies import get_db
 from ..schemas.email import (
     SendCodeRequest, SendCodeResponse,
-    VerifyCodeRequest, VerifyCodeResponse
+    VerifyCodeRequest, VerifyCodeResponse, EmailStatusResponse
 )
 from ..services.email_service import email_service
 from db import Database
@@ -22,19 +22,20 @@ async def send_verification_code(
     """
     이메일 인증번호 발송
 
-    - 6자리 인증번호를 이메일로 발송
+    - 6자리 인증번호를 이메일로 발송 (발송 큐 등록 후 즉시 응답)
     - 인증번호는 3분간 유효
     """
     try:
-        # 인증번호 생성 및 발송
-        code, expires_at = email_service.send_verification_code(request.email)
+        # 인증번호 생성 및 발송 큐 등록
+        code, expires_at, message_id = email_service.send_verification_code(request.email)
 
         # DB에 저장
         db.create_email_verification(request.email, code, expires_at)
 
         return SendCodeResponse(
             success=True,
-            message="인증번호가 발송되었습니다"
+            message="인증번호가 발송되었습니다",
+            message_id=message_id
         )
 
     except Exception as e:
@@ -42,6 +43,15 @@ async def send_verification_code(
         raise HTTPException(status_code=500, detail="인증번호 발송에 실패했습니다")
 
 
+@router.get("/status/{message_id}", response_model=EmailStatusResponse)
+async def get_email_status(message_id: str):
+    """이메일 발송 상태 조회 (이 API 프로세스에서 등록한 최근 메시지)"""
+    status = email_service.get_status(message_id)
+    if not status:
+        raise HTTPException(status_code=404, detail="발송 기록을 찾을 수 없습니다")
+    return EmailStatusResponse(**status)
+
+
 @router.post("/verify-code", response_model=VerifyCodeResponse)
 async def verify_code(
     request: VerifyCodeRequest,
@@ -1,10 +1,10 @@
 """Gamification & WPT Rewards Routes"""
 from fastapi import APIRouter, Depends, HTTPException
-from datetime import date, datetime, timedelta
+from datetime import datetime, timedelta
 from typing import Optional
-import json
 
 from ..dependencies import get_db, require_worker, require_admin
+from ..services import rewards, wpt_ledger
 from db import Database
 
 router = APIRouter()
@@ -14,125 +14,17 @@ router = APIRouter()
 # Helper Functions
 # ============================================
 
-def get_config(db: Database, key: str):
-    """설정 값 가져오기"""
-    with db.get_connection() as conn:
-        cursor = conn.cursor()
-        cursor.execute("SELECT value FROM gamification_config WHERE key = %s", (key,))
-        result = cursor.fetchone()
-        if result:
-            return json.loads(result[0])
-        return {}
-
-
 def award_wpt(db: Database, worker_id: int, amount: int, category: str, description: str, reference_type: str = None, reference_id: int = None):
-    """WPT 지급"""
-    with db.get_connection() as conn:
-        cursor = conn.cursor()
+    """WPT 지급 (같은 참조로 다시 호출하면 기존 거래 반환)"""
+    return wpt_ledger.credit(db, worker_id, amount, category, description, reference_type, reference_id)
 
-        # 현재 잔액 조회
-        cursor.execute("SELECT COALESCE(wpt_balance, 0) FROM worker_metrics WHERE worker_id = %s", (worker_id,))
-        result = cursor.fetchone()
-        balance = result[0] if result else 0
-        new_balance = balance + amount
 
-        # 트랜잭션 기록
-        cursor.execute("""
-            INSERT INTO wpt_transactions (worker_id, type, category, amount, balance_after, reference_type, reference_id, description)
-            VALUES (%s, 'EARN', %s, %s, %s, %s, %s, %s)
-            RETURNING id
-        """, (worker_id, category, amount, new_balance, reference_type, reference_id, description))
-
-        transaction_id = cursor.fetchone()[0]
-        conn.commit()
-
-        return {
-            "transaction_id": transaction_id,
-            "amount": amount,
-            "balance": new_balance,
-            "category": category
-        }
-
-
-def spend_wpt(db: Database, worker_id: int, amount: int, category: str, description: str):
+def spend_wpt(db: Database, worker_id: int, amount: int, category: str, description: str, reference_type: str = None, reference_id: int = None):
     """WPT 차감"""
-    with db.get_connection() as conn:
-        cursor = conn.cursor()
-
-        # 잔액 확인
-        cursor.execute("SELECT COALESCE(wpt_balance, 0) FROM worker_metrics WHERE worker_id = %s", (worker_id,))
-        result = cursor.fetchone()
-        balance = result[0] if result else 0
-
-        if balance < amount:
-            raise HTTPException(status_code=400, detail="WPT 잔액이 부족합니다")
-
-        new_balance = balance - amount
-
-        # 트랜잭션 기록
-        cursor.execute("""
-            INSERT INTO wpt_transactions (worker_id, type, category, amount, balance_after, description)
-            VALUES (%s, 'SPEND', %s, %s, %s, %s)
-            RETURNING id
-        """, (worker_id, category, -amount, new_balance, description))
-
-        transaction_id = cursor.fetchone()[0]
-        conn.commit()
-
-        return {
-            "transaction_id": transaction_id,
-            "amount": -amount,
-            "balance": new_balance
-        }
-
-
-def add_experience(db: Database, worker_id: int, exp: int, reason: str):
-    """경험치 추가 및 레벨업 체크"""
-    with db.get_connection() as conn:
-        cursor = conn.cursor()
-
-        # 현재 레벨/경험치 조회
-        cursor.execute("""
-            SELECT level, experience_points FROM worker_metrics WHERE worker_id = %s
-        """, (worker_id,))
-        result = cursor.fetchone()
-
-        if not result:
-            current_level = 1
-            current_exp = 0
-        else:
-            current_level, current_exp = result
-
-        new_exp = current_exp + exp
-
-        # 레벨업 체크
-        cursor.execute("""
-            SELECT level, required_exp FROM worker_levels
-            WHERE required_exp <= %s
-            ORDER BY level DESC
-            LIMIT 1
-        """, (new_exp,))
-        level_info = cursor.fetchone()
-
-        new_level = level_info[0] if level_info else current_level
-        leveled_up = new_level > current_level
-
-        # 업데이트
-        cursor.execute("""
-            UPDATE worker_metrics
-            SET level = %s, experience_points = %s
-            WHERE worker_id = %s
-        """, (new_level, new_exp, worker_id))
-
-        conn.commit()
-
-        return {
-            "exp_gained": exp,
-            "total_exp": new_exp,
-            "level": new_level,
-            "leveled_up": leveled_up,
-            "reason": reason
-        }
+    try:
+        return wpt_ledger.debit(db, worker_id, amount, category, description, reference_type, reference_id)
+    except wpt_ledger.InsufficientBalance:
+        raise HTTPException(status_code=400, detail="WPT 잔액이 부족합니다")
 
 
 # ============================================
@@ -211,87 +103,12 @@ async def checkin_reward(
         if cursor.fetchone():
             raise HTTPException(status_code=400, detail="이미 출근 보상을 받았습니다")
 
-    # 설정 로드
-    rewards = get_config(db, "wpt_rewards")
-    checkin_wpt = rewards.get("checkin", 10)
-
-    # Streak 업데이트
-    with db.get_connection() as conn:
-        cursor = conn.cursor()
-
-        today = date.today()
-
-        cursor.execute("""
-            SELECT current_streak, last_checkin_date, longest_streak
-            FROM worker_streaks
-            WHERE worker_id = %s
-        """, (worker_id,))
-        streak_data = cursor.fetchone()
+    # Streak + WPT + 경험치 (단일 트랜잭션)
+    result = rewards.process_checkin_reward(db, worker_id, attendance_id)
+    if not result:
+        raise HTTPException(status_code=400, detail="오늘 이미 출근 보상을 받았습니다")
 
-        if not streak_data:
-            # 첫 출석
-            new_streak = 1
-            longest = 1
-        else:
-            current_streak, last_date, longest = streak_data
-
-            if last_date:
-                days_diff = (today - last_date).days
-
-                if days_diff == 1:
-                    # 연속 출석
-                    new_streak = current_streak + 1
-                elif days_diff == 0:
-                    # 오늘 이미 출석 (중복 방지)
-                    new_streak = current_streak
-                else:
-                    # 끊김
-                    new_streak = 1
-            else:
-                new_streak = 1
-
-            longest = max(longest or 0, new_streak)
-
-        # Streak 업데이트
-        cursor.execute("""
-            INSERT INTO worker_streaks (worker_id, current_streak, longest_streak, last_checkin_date)
-            VALUES (%s, %s, %s, %s)
-            ON CONFLICT (worker_id)
-            DO UPDATE SET
-                current_streak = EXCLUDED.current_streak,
-                longest_streak = EXCLUDED.longest_streak,
-                last_checkin_date = EXCLUDED.last_checkin_date,
-                updated_at = CURRENT_TIMESTAMP
-        """, (worker_id, new_streak, longest, today))
-
-        conn.commit()
-
-    # Streak 보너스 계산
-    streak_bonus = 0
-    if new_streak >= 3:
-        streak_bonus = rewards.get("streak_bonus", 5) * (new_streak // 3)
-
-    total_wpt = checkin_wpt + streak_bonus
-
-    # WPT 지급
-    transaction = award_wpt(
-        db, worker_id, total_wpt, "checkin",
-        f"출근 보상 (+{checkin_wpt} WPT) + 연속 출석 보너스 (+{streak_bonus} WPT)",
-        "attendance", attendance_id
-    )
-
-    # 경험치 지급
-    exp_result = add_experience(db, worker_id, 5, "출근 완료")
-
-    return {
-        "wpt_reward": transaction,
-        "streak": {
-            "current": new_streak,
-            "longest": longest,
-            "bonus_wpt": streak_bonus
-        },
-        "exp": exp_result
-    }
+    return result
 
 
 @router.post("/checkout-reward")
@@ -343,32 +160,8 @@ async def checkout_reward(
 
         work_hours = (check_out - check_in).total_seconds() / 3600
 
-    # 설정 로드
-    rewards = get_config(db, "wpt_rewards")
-    checkout_wpt = rewards.get("checkout", 10)
-
-    # 근무 시간 보너스 (시간당 5 WPT)
-    time_bonus = int(work_hours * 5)
-
-    total_wpt = checkout_wpt + time_bonus
-
-    # WPT 지급
-    transaction = award_wpt(
-        db, worker_id, total_wpt, "checkout",
-        f"퇴근 보상 (+{checkout_wpt} WPT) + 근무시간 보너스 (+{time_bonus} WPT, {work_hours:.1f}h)",
-        "attendance", attendance_id
-    )
-
-    # 경험치 지급
-    exp_bonus = int(work_hours * 2)
-    exp_result = add_experience(db, worker_id, exp_bonus, f"근무 완료 ({work_hours:.1f}시간)")
-
-    return {
-        "wpt_reward": transaction,
-        "work_hours": round(work_hours, 1),
-        "time_bonus": time_bonus,
-        "exp": exp_result
-    }
+    # WPT + 경험치 (단일 트랜잭션)
+    return rewards.process_checkout_reward(db, worker_id, attendance_id, work_hours)
 
 
 @router.get("/leaderboard")
@@ -448,31 +241,14 @@ async def admin_grant_wpt(
     admin: dict = Depends(require_admin),
     db: Database = Depends(get_db)
 ):
-    """관리자: WPT 지급"""
-    with db.get_connection() as conn:
-        cursor = conn.cursor()
-
-        # 현재 잔액 조회
-        cursor.execute("SELECT COALESCE(wpt_balance, 0) FROM worker_metrics WHERE worker_id = %s", (worker_id,))
-        result = cursor.fetchone()
-        balance = result[0] if result else 0
-        new_balance = balance + amount
-
-        # 트랜잭션 기록
-        cursor.execute("""
-            INSERT INTO wpt_transactions (worker_id, type, category, amount, balance_after, description)
-            VALUES (%s, 'ADMIN_GRANT', 'admin', %s, %s, %s)
-            RETURNING id
-        """, (worker_id, amount, new_balance, reason))
-
-        transaction_id = cursor.fetchone()[0]
-        conn.commit()
-
-        return {
-            "transaction_id": transaction_id,
-            "amount": amount,
-            "balance": new_balance
-        }
+    """관리자: WPT 지급 (음수면 차감)"""
+    if amount >= 0:
+        return wpt_ledger.credit(db, worker_id, amount, "admin", reason, tx_type="ADMIN_GRANT")
+
+    try:
+        return wpt_ledger.debit(db, worker_id, -amount, "admin", reason, tx_type="ADMIN_GRANT")
+    except wpt_ledger.InsufficientBalance:
+        raise HTTPException(status_code=400, detail="WPT 잔액이 부족합니다")
 
 
 @router.get("/admin/analytics")
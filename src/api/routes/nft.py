@@ -1,5 +1,5 @@
 """NFT Badge Image Routes"""
-from fastapi import APIRouter, Depends, HTTPException, Response
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
 from fastapi.responses import JSONResponse
 from pydantic import BaseModel
 from typing import Optional, List
@@ -8,7 +8,8 @@ import logging
 
 from ..dependencies import get_db, require_auth, require_admin
 from ..services.nft_service import (
-    render_badge_svg,
+    prepare_badge,
+    RenderedBadge,
     render_project_badge_svg,
     generate_nft_metadata,
     get_badge_grade,
@@ -182,87 +183,91 @@ async def get_my_badge_detail(
 
 # ===== Render Endpoints =====
 
-@router.get("/render/{badge_id}")
-async def render_badge_image(
-    badge_id: int,
-    template: Optional[str] = None,
-    user: dict = Depends(require_auth),
-    db: Database = Depends(get_db)
-):
-    """배지 SVG 이미지 렌더링 (본인 배지만)"""
-    telegram_id = user.get("telegram_id")
-    worker = db.get_worker_by_telegram_id(telegram_id)
+# 발급된 배지 이미지는 내용이 바뀌면 ETag가 바뀌므로 재검증 전제로 길게 캐시
+BADGE_CACHE_CONTROL = "private, max-age=86400, must-revalidate"
+PREVIEW_CACHE_CONTROL = "public, max-age=3600"
 
-    if not worker:
-        raise HTTPException(status_code=404, detail="근무자 정보가 없습니다")
+IMAGE_FORMATS = ("svg", "png")
 
-    badge = db.get_badge_by_id(badge_id)
-    if not badge:
-        raise HTTPException(status_code=404, detail="배지를 찾을 수 없습니다")
 
-    if badge["worker_id"] != worker["id"]:
-        raise HTTPException(status_code=403, detail="본인의 배지만 조회할 수 있습니다")
+def _badge_image_response(
+    request: Request,
+    rendered: RenderedBadge,
+    image_format: str = "svg",
+    cache_control: str = BADGE_CACHE_CONTROL
+) -> Response:
+    """ETag/Cache-Control 헤더를 붙인 배지 이미지 응답 (If-None-Match 일치 시 304)"""
+    if image_format not in IMAGE_FORMATS:
+        raise HTTPException(status_code=400, detail=f"지원하지 않는 형식입니다. 사용 가능: {list(IMAGE_FORMATS)}")
 
-    # 이벤트명 조회 (프로젝트 배지인 경우)
-    event_name = None
-    if badge.get("event_id"):
-        event = db.get_event(badge["event_id"])
-        event_name = event.get("title") if event else None
+    etag = f'"{rendered.etag}-{image_format}"'
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+
+    if_none_match = request.headers.get("if-none-match", "")
+    if etag in [tag.strip() for tag in if_none_match.split(",")]:
+        return Response(status_code=304, headers=headers)
+
+    if image_format == "png":
+        try:
+            return Response(content=rendered.png(), media_type="image/png", headers=headers)
+        except ImportError:
+            raise HTTPException(status_code=501, detail="PNG 변환을 지원하지 않는 서버입니다")
 
-    template_type = template or badge.get("template_type", "minimal")
+    return Response(content=rendered.svg, media_type="image/svg+xml", headers=headers)
 
-    svg = render_badge_svg(
+
+def _prepare_stored_badge(badge: dict, template: Optional[str] = None) -> RenderedBadge:
+    """get_badge_for_render 결과로 렌더링 준비"""
+    return prepare_badge(
         badge_type=badge["badge_type"],
         badge_level=badge["badge_level"],
         title=badge["title"],
         description=badge.get("description", ""),
         icon=badge.get("icon", "🏅"),
         earned_at=badge["earned_at"],
-        worker_id=worker["id"],
-        worker_name=worker.get("name"),
-        template_type=template_type,
-        event_name=event_name
+        worker_id=badge["worker_id"],
+        worker_name=badge.get("worker_name"),
+        template_type=template or badge.get("template_type") or "minimal",
+        event_name=badge.get("event_name")
     )
 
-    return Response(content=svg, media_type="image/svg+xml")
 
-
-@router.get("/render/admin/{badge_id}")
-async def render_badge_image_admin(
+@router.get("/render/{badge_id}")
+async def render_badge_image(
     badge_id: int,
+    request: Request,
     template: Optional[str] = None,
-    admin: dict = Depends(require_admin),
+    format: str = "svg",
+    user: dict = Depends(require_auth),
     db: Database = Depends(get_db)
 ):
-    """배지 SVG 이미지 렌더링 (관리자용, 모든 배지)"""
-    badge = db.get_badge_by_id(badge_id)
+    """배지 SVG/PNG 이미지 렌더링 (본인 배지만)"""
+    badge = db.get_badge_for_render(badge_id)
     if not badge:
         raise HTTPException(status_code=404, detail="배지를 찾을 수 없습니다")
 
-    worker = db.get_worker_by_id(badge["worker_id"])
-    worker_name = worker.get("name") if worker else None
+    telegram_id = user.get("telegram_id")
+    if not telegram_id or badge["worker_telegram_id"] != telegram_id:
+        raise HTTPException(status_code=403, detail="본인의 배지만 조회할 수 있습니다")
 
-    event_name = None
-    if badge.get("event_id"):
-        event = db.get_event(badge["event_id"])
-        event_name = event.get("title") if event else None
+    return _badge_image_response(request, _prepare_stored_badge(badge, template), format)
 
-    template_type = template or badge.get("template_type", "minimal")
 
-    svg = render_badge_svg(
-        badge_type=badge["badge_type"],
-        badge_level=badge["badge_level"],
-        title=badge["title"],
-        description=badge.get("description", ""),
-        icon=badge.get("icon", "🏅"),
-        earned_at=badge["earned_at"],
-        worker_id=badge["worker_id"],
-        worker_name=worker_name,
-        template_type=template_type,
-        event_name=event_name
-    )
+@router.get("/render/admin/{badge_id}")
+async def render_badge_image_admin(
+    badge_id: int,
+    request: Request,
+    template: Optional[str] = None,
+    format: str = "svg",
+    admin: dict = Depends(require_admin),
+    db: Database = Depends(get_db)
+):
+    """배지 SVG/PNG 이미지 렌더링 (관리자용, 모든 배지)"""
+    badge = db.get_badge_for_render(badge_id)
+    if not badge:
+        raise HTTPException(status_code=404, detail="배지를 찾을 수 없습니다")
 
-    return Response(content=svg, media_type="image/svg+xml")
+    return _badge_image_response(request, _prepare_stored_badge(badge, template), format)
 
 
 @router.post("/render")
@@ -300,7 +305,7 @@ async def render_custom_badge(request: RenderRequest):
     else:
         earned_at = datetime.now()
 
-    svg = render_badge_svg(
+    rendered = prepare_badge(
         badge_type="PROJECT",
         badge_level=1,
         title=request.title,
@@ -313,7 +318,7 @@ async def render_custom_badge(request: RenderRequest):
         grade_override=request.grade
     )
 
-    return Response(content=svg, media_type="image/svg+xml")
+    return Response(content=rendered.svg, media_type="image/svg+xml")
 
 
 # ===== Preview & Info =====
@@ -322,7 +327,9 @@ async def render_custom_badge(request: RenderRequest):
 async def preview_badge(
     badge_type: str,
     badge_level: int,
-    template: str = "minimal"
+    request: Request,
+    template: str = "minimal",
+    format: str = "svg"
 ):
     """배지 미리보기 (인증 불필요)"""
     from .badges import BADGE_DEFINITIONS
@@ -335,7 +342,7 @@ async def preview_badge(
 
     badge_def = BADGE_DEFINITIONS[badge_type][badge_level]
 
-    svg = render_badge_svg(
+    rendered = prepare_badge(
         badge_type=badge_type,
         badge_level=badge_level,
         title=badge_def["title"],
@@ -347,7 +354,7 @@ async def preview_badge(
         template_type=template
     )
 
-    return Response(content=svg, media_type="image/svg+xml")
+    return _badge_image_response(request, rendered, format, PREVIEW_CACHE_CONTROL)
 
 
 @router.get("/metadata/{badge_id}")
@@ -518,63 +525,22 @@ async def issue_project_badges(
     admin_worker = db.get_worker_by_telegram_id(admin_telegram_id)
     admin_id = admin_worker["id"] if admin_worker else None
 
-    # 배치 생성
-    batch_id = db.create_nft_batch(
+    # 배치 생성 + 대상 확인 + 발급 + 감사 로그 + 수량 갱신 (단일 트랜잭션)
+    result = db.issue_project_badges(
         event_id=event_id,
+        worker_ids=request.worker_ids,
         title=request.title,
         description=request.description,
+        icon=request.icon,
         template_type=request.template,
         issued_by=admin_id,
-        metadata={"grade": request.grade, "icon": request.icon}
+        batch_metadata={"grade": request.grade, "icon": request.icon}
     )
+    batch_id = result["batch_id"]
+    issued_badges = result["issued"]
 
-    # 배지 발급
-    issued_badges = []
-    skipped = 0
-
-    for worker_id in request.worker_ids:
-        # 해당 이벤트에 출근한 근무자인지 확인
-        eligible_workers = db.get_event_eligible_workers(event_id)
-        eligible_ids = [w["id"] for w in eligible_workers]
-
-        if worker_id not in eligible_ids:
-            skipped += 1
-            continue
-
-        badge_id = db.award_project_badge(
-            worker_id=worker_id,
-            event_id=event_id,
-            batch_id=batch_id,
-            title=request.title,
-            description=request.description,
-            icon=request.icon,
-            template_type=request.template
-        )
-
-        if badge_id:
-            issued_badges.append({
-                "badge_id": badge_id,
-                "worker_id": worker_id
-            })
-
-            # 감사 로그
-            db.create_audit_log(
-                action="BADGE_ISSUED",
-                entity_type="worker_badges",
-                entity_id=badge_id,
-                actor_id=admin_id,
-                actor_type="ADMIN",
-                details={
-                    "event_id": event_id,
-                    "batch_id": batch_id,
-                    "title": request.title
-                }
-            )
-        else:
-            skipped += 1  # 이미 발급됨
-
-    # 배치 수량 업데이트
-    db.update_batch_count(batch_id, len(issued_badges))
+    # 발급 대상이 아니거나 이미 발급된 근무자
+    skipped = len(request.worker_ids) - len(issued_badges)
 
     return {
         "batch_id": batch_id,
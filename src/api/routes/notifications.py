@@ -1,9 +1,13 @@
 """Notifications Routes"""
-from fastapi import APIRouter, Depends, HTTPException
+import asyncio
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from typing import List, Optional
 
-from ..dependencies import get_db, require_worker
+from ..dependencies import get_db, require_worker, require_worker_stream
+from ..services import live_streams
 from db import Database
 
 router = APIRouter()
@@ -26,22 +30,26 @@ class NotificationListResponse(BaseModel):
     total: int
     unread_count: int
     notifications: List[NotificationResponse]
+    next_before_id: Optional[int] = None  # 다음 페이지 조회용 (없으면 마지막 페이지)
 
 
 @router.get("", response_model=NotificationListResponse)
 async def get_my_notifications(
+    limit: int = Query(50, ge=1, le=100),
+    before_id: Optional[int] = Query(None, description="이 ID보다 오래된 알림부터 조회 (이전 응답의 next_before_id)"),
     auth: dict = Depends(require_worker),
     db: Database = Depends(get_db)
 ):
-    """내 알림 목록"""
+    """내 알림 목록 (최신순, 커서 페이지네이션)"""
     worker = auth["worker"]
-    notifications = db.get_notifications(worker["id"])
+    notifications = db.get_notifications(worker["id"], limit=limit, before_id=before_id)
     unread_count = db.get_unread_notification_count(worker["id"])
 
     return NotificationListResponse(
         total=len(notifications),
         unread_count=unread_count,
-        notifications=[NotificationResponse(**n) for n in notifications]
+        notifications=[NotificationResponse(**n) for n in notifications],
+        next_before_id=notifications[-1]["id"] if len(notifications) == limit else None
     )
 
 
@@ -56,6 +64,53 @@ async def get_unread_count(
     return {"unread_count": count}
 
 
+@router.get("/stream")
+async def stream_notifications(
+    request: Request,
+    auth: dict = Depends(require_worker_stream),
+    db: Database = Depends(get_db)
+):
+    """
+    알림 실시간 스트림 (Server-Sent Events)
+
+    이벤트:
+    - notification: 새 알림
+    - unread_count: 읽지 않은 알림 수 (접속 시, 알림 생성/읽음 시)
+    - resync: 이벤트 유실 가능성 - 목록을 다시 조회
+    """
+    worker_id = auth["worker"]["id"]
+    hub = live_streams.notification_hub(db)
+
+    async def event_stream():
+        queue = hub.subscribe(worker_id)
+        try:
+            count = await asyncio.to_thread(db.get_unread_notification_count, worker_id)
+            yield live_streams.sse("unread_count", {"unread_count": count})
+
+            while not await request.is_disconnected():
+                try:
+                    event = await asyncio.wait_for(queue.get(), timeout=live_streams.HEARTBEAT_SECONDS)
+                except asyncio.TimeoutError:
+                    yield live_streams.HEARTBEAT
+                    continue
+
+                if event["event"] == "notification":
+                    yield live_streams.sse("notification", event["notification"])
+                elif event["event"] == "resync":
+                    yield live_streams.sse("resync", {})
+
+                count = await asyncio.to_thread(db.get_unread_notification_count, worker_id)
+                yield live_streams.sse("unread_count", {"unread_count": count})
+        finally:
+            hub.unsubscribe(worker_id, queue)
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers=live_streams.SSE_HEADERS
+    )
+
+
 @router.post("/{notification_id}/read")
 async def mark_as_read(
     notification_id: int,
@@ -63,7 +118,8 @@ async def mark_as_read(
     db: Database = Depends(get_db)
 ):
     """알림 읽음 처리"""
-    db.mark_notification_read(notification_id)
+    if not db.mark_notification_read(notification_id, worker_id=auth["worker"]["id"]):
+        raise HTTPException(status_code=404, detail="알림을 찾을 수 없습니다")
     return {"message": "읽음 처리 완료"}
 
 
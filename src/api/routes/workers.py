@@ -8,6 +8,7 @@ import mimetypes
 from datetime import datetime
 
 from ..dependencies import get_db, require_auth, require_admin
+from ..auth import principal
 from ..schemas.worker import (
     WorkerCreate, WorkerUpdate, WorkerResponse, WorkerListResponse
 )
@@ -68,6 +69,7 @@ def _give_profile_completion_bonus(worker_id: int, db: Database) -> bool:
     if not wallet_address:
         wallet_address = wpt_service.get_deterministic_address(worker_id)
         db.set_worker_wallet_address(worker_id, wallet_address)
+        principal.invalidate_worker(worker_id)
 
     tx_hash = None
     reason = "프로필 완성 보너스"
@@ -111,6 +113,7 @@ def _give_registration_bonus(worker_id: int, db: Database):
     # 지갑 주소 생성
     wallet_address = wpt_service.get_deterministic_address(worker_id)
     db.set_worker_wallet_address(worker_id, wallet_address)
+    principal.invalidate_worker(worker_id)
 
     tx_hash = None
     reason = "신규 가입 환영 보너스"
@@ -227,6 +230,7 @@ async def update_my_info(
 
     if update_data:
         db.update_worker(worker["id"], **update_data)
+        principal.invalidate_worker(worker["id"])
 
     updated = db.get_worker_by_telegram_id(telegram_id)
 
@@ -280,6 +284,7 @@ async def upload_my_photo(
 
     # DB 업데이트
     db.update_worker(worker["id"], face_photo_file_id=filepath)
+    principal.invalidate_worker(worker["id"])
 
     # 프로필 완성 확인 및 보너스 지급
     bonus_given = False
@@ -373,6 +378,7 @@ async def delete_my_account(
         # 근무자 삭제
         cursor.execute("DELETE FROM workers WHERE id = %s", (worker_id,))
         conn.commit()
+    principal.invalidate_worker(worker_id)
 
     logger.info(f"Worker {worker_id} ({worker_name}) withdrew from service. Burned {burned_amount} WPT.")
 
@@ -387,9 +393,7 @@ async def list_workers(
     db: Database = Depends(get_db)
 ):
     """근무자 목록 (관리자 전용)"""
-    workers = db.list_workers(limit=limit)
-    # offset 적용
-    workers = workers[offset:offset + limit]
+    workers = db.list_workers(limit=limit, offset=offset)
 
     return WorkerListResponse(
         total=len(workers),
@@ -468,6 +472,7 @@ async def admin_update_worker(
 
     if update_data:
         db.update_worker(worker_id, **update_data)
+        principal.invalidate_worker(worker_id)
 
     with db.get_connection() as conn:
         from psycopg2.extras import RealDictCursor
@@ -536,6 +541,7 @@ async def admin_delete_worker(
         # 근무자 삭제
         cursor.execute("DELETE FROM workers WHERE id = %s", (worker_id,))
         conn.commit()
+    principal.invalidate_worker(worker_id)
 
     logger.info(f"Worker {worker_id} ({worker_name}) deleted by admin. Burned {burned_amount} WPT.")
 
@@ -1,5 +1,5 @@
 """Application Schemas"""
-from pydantic import BaseModel, field_serializer
+from pydantic import BaseModel, Field, field_serializer
 from datetime import datetime, timezone, timedelta
 from enum import Enum
 
@@ -23,6 +23,22 @@ class ApplicationStatusUpdate(BaseModel):
     rejection_reason: str | None = None
 
 
+class ApplicationBulkStatusUpdate(BaseModel):
+    """지원 상태 일괄 변경"""
+    application_ids: list[int] = Field(..., min_length=1, max_length=1000)
+    status: ApplicationStatus
+    rejection_reason: str | None = None
+
+
+class ApplicationBulkStatusResponse(BaseModel):
+    """지원 상태 일괄 변경 결과"""
+    status: str
+    requested: int
+    updated: int
+    skipped: int  # 이미 같은 상태이거나 존재하지 않는 지원
+    application_ids: list[int]
+
+
 class ApplicationResponse(BaseModel):
     """지원 정보 응답"""
     id: int
@@ -1,5 +1,5 @@
 """Attendance Schemas"""
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from enum import Enum
 from typing import Any
 
@@ -80,3 +80,11 @@ class ChainLogResponse(BaseModel):
 
     class Config:
         from_attributes = True
+
+
+class DocumentExportRequest(BaseModel):
+    """지급명세서/근무증명서 일괄 발급 요청 (event_id 또는 year+month)"""
+    event_id: int | None = None
+    year: int | None = Field(None, ge=2000, le=2100)
+    month: int | None = Field(None, ge=1, le=12)
+    kinds: list[str] = ["payment_statement", "certificate"]
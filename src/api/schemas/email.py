@@ -1,4 +1,5 @@
 """Email verification and auth schemas"""
+from datetime import datetime
 from typing import Optional
 from pydantic import BaseModel, EmailStr, Field
 
@@ -12,6 +13,17 @@ class SendCodeResponse(BaseModel):
     """인증번호 발송 응답"""
     success: bool
     message: str
+    message_id: Optional[str] = None  # 발송 상태 조회용 (/api/email/status/{message_id})
+
+
+class EmailStatusResponse(BaseModel):
+    """이메일 발송 상태"""
+    message_id: str
+    status: str  # QUEUED | SENDING | RETRYING | SENT | FAILED
+    attempts: int
+    error: Optional[str] = None
+    queued_at: Optional[datetime] = None
+    sent_at: Optional[datetime] = None
 
 
 class VerifyCodeRequest(BaseModel):
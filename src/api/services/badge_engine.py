@@ -0,0 +1,118 @@
+"""Badge Evaluation Engine (배지 자동 발급)
+
+근무자별 배지 조건 카운터를 그룹 쿼리로 한 번에 계산하고, 보유 배지와 비교해
+새로 달성한 배지만 다중 행 INSERT로 발급한다.
+퇴근 직후(해당 근무자만)와 야간 배치(전체 또는 변경된 근무자) 양쪽에서 사용
+"""
+import logging
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+
+from db import Database
+
+logger = logging.getLogger(__name__)
+
+
+# ===== 배지 정의 =====
+# 프리미엄 원형 아이콘 스타일 (이모지 대신 심플한 기하학적 심볼)
+BADGE_DEFINITIONS = {
+    # 근무 횟수 배지
+    "WORK_COUNT": {
+        1: {"title": "첫 근무 완료", "description": "첫 번째 근무를 완료했습니다", "icon": "●", "threshold": 1},
+        2: {"title": "10회 근무 달성", "description": "10번의 근무를 완료했습니다", "icon": "★", "threshold": 10},
+        3: {"title": "50회 근무 달성", "description": "50번의 근무를 완료했습니다", "icon": "✦", "threshold": 50},
+        4: {"title": "100회 근무 달성", "description": "100번의 근무를 완료했습니다", "icon": "✴", "threshold": 100},
+    },
+    # 신뢰도 배지
+    "TRUST": {
+        1: {"title": "신뢰할 수 있는 근무자", "description": "노쇼 없이 10회 근무 완료", "icon": "✓", "threshold": 10},
+        2: {"title": "믿음직한 프로", "description": "노쇼 없이 30회 근무 완료", "icon": "⬡", "threshold": 30},
+        3: {"title": "최고 신뢰 등급", "description": "노쇼 없이 50회 근무 완료", "icon": "♔", "threshold": 50},
+    },
+    # 블록체인 기록 배지
+    "BLOCKCHAIN": {
+        1: {"title": "블록체인 데뷔", "description": "첫 블록체인 근무 기록", "icon": "◇", "threshold": 1},
+        2: {"title": "블록체인 프로", "description": "10회 블록체인 기록", "icon": "⬢", "threshold": 10},
+        3: {"title": "블록체인 마스터", "description": "30회 블록체인 기록", "icon": "◈", "threshold": 30},
+    },
+    # 프로필 완성 배지
+    "PROFILE": {
+        1: {"title": "프로필 완성", "description": "모든 프로필 정보 입력 완료", "icon": "◆", "threshold": 1},
+    },
+    # 사진 등록 배지
+    "PHOTO": {
+        1: {"title": "얼굴 등록 완료", "description": "프로필 사진 등록 완료", "icon": "◉", "threshold": 1},
+    },
+}
+
+# 배지 유형 -> Database.get_badge_counters 카운터 키
+BADGE_COUNTERS = {
+    "WORK_COUNT": "total_work_count",
+    "TRUST": "perfect_attendance",
+    "BLOCKCHAIN": "blockchain_records",
+    "PROFILE": "profile_complete",
+    "PHOTO": "has_photo",
+}
+
+
+def evaluate(counters: Dict[int, Dict], earned: set) -> List[tuple]:
+    """
+    카운터와 보유 배지를 비교해 새로 발급할 배지 목록 계산
+
+    Returns:
+        [(worker_id, badge_type, badge_level, title, description, icon), ...]
+    """
+    awards = []
+    for worker_id, stats in counters.items():
+        for badge_type, counter in BADGE_COUNTERS.items():
+            value = stats.get(counter, 0)
+            for level, info in BADGE_DEFINITIONS[badge_type].items():
+                if value >= info["threshold"] and (worker_id, badge_type, level) not in earned:
+                    awards.append((worker_id, badge_type, level,
+                                   info["title"], info["description"], info["icon"]))
+    return awards
+
+
+def award_new_badges(db: Database, worker_ids: Optional[Iterable[int]] = None) -> List[dict]:
+    """
+    대상 근무자의 배지 조건을 평가하고 새 배지 일괄 발급
+
+    Args:
+        db: Database
+        worker_ids: 대상 근무자 ID (None이면 전체 근무자)
+
+    Returns:
+        새로 발급된 배지 목록 [{"worker_id", "type", "level", "title", "description", "icon", "threshold"}]
+    """
+    if worker_ids is not None:
+        worker_ids = list(worker_ids)
+        if not worker_ids:
+            return []
+
+    counters = db.get_badge_counters(worker_ids)
+    earned = db.get_earned_badge_keys(worker_ids)
+    inserted = db.award_badges_bulk(evaluate(counters, earned))
+
+    return [{
+        "worker_id": row["worker_id"],
+        "type": row["badge_type"],
+        "level": row["badge_level"],
+        **BADGE_DEFINITIONS[row["badge_type"]][row["badge_level"]]
+    } for row in inserted]
+
+
+def award_badges_since(db: Database, since: datetime) -> List[dict]:
+    """since 이후 퇴근/블록체인 기록/프로필 변경이 있는 근무자만 평가"""
+    return award_new_badges(db, db.get_badge_candidate_workers(since))
+
+
+def award_after_checkout(db: Database, worker_id: int) -> List[dict]:
+    """퇴근 직후 배지 평가 (실패해도 퇴근 처리에는 영향 없음)"""
+    try:
+        awarded = award_new_badges(db, [worker_id])
+        if awarded:
+            logger.info(f"Badges awarded to worker {worker_id}: {[(b['type'], b['level']) for b in awarded]}")
+        return awarded
+    except Exception as e:
+        logger.error(f"Badge evaluation failed for worker {worker_id}: {e}", exc_info=True)
+        return []
@@ -0,0 +1,172 @@
+"""Bulk Document Export Service (지급명세서/근무증명서 일괄 발급)
+
+행사 단위 또는 월 단위로 퇴근 완료된 출석 전체의 PDF를 병렬 렌더링하여
+하나의 ZIP 파일로 묶는 백그라운드 작업
+"""
+import asyncio
+import logging
+import os
+import re
+import uuid
+import zipfile
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from ..config import get_settings
+from . import pdf_service
+from utils import now_kst
+
+logger = logging.getLogger(__name__)
+
+# 문서 유형 -> ZIP 내부 폴더명
+DOCUMENT_FOLDERS = {
+    "payment_statement": "지급명세서",
+    "certificate": "근무증명서",
+}
+
+# 동시에 렌더링 큐에 넣을 최대 문서 수 (프로세스 풀 앞단 버퍼)
+MAX_PENDING_RENDERS = 16
+
+# 보관할 최대 작업 수 (오래된 작업부터 정리)
+MAX_JOBS = 50
+
+
+@dataclass
+class ExportJob:
+    """일괄 발급 작업 상태"""
+    id: str
+    scope: str
+    kinds: List[str]
+    status: str = "PENDING"  # PENDING, RUNNING, COMPLETED, FAILED
+    total: int = 0
+    done: int = 0
+    failed: int = 0
+    file_path: Optional[str] = None
+    error: Optional[str] = None
+    created_at: datetime = field(default_factory=now_kst)
+    finished_at: Optional[datetime] = None
+
+    def to_dict(self) -> dict:
+        return {
+            "job_id": self.id,
+            "scope": self.scope,
+            "kinds": self.kinds,
+            "status": self.status,
+            "total": self.total,
+            "done": self.done,
+            "failed": self.failed,
+            "progress": int(self.done / self.total * 100) if self.total else 0,
+            "error": self.error,
+            "created_at": self.created_at.isoformat(),
+            "finished_at": self.finished_at.isoformat() if self.finished_at else None,
+        }
+
+
+_jobs: Dict[str, ExportJob] = {}
+_tasks: set = set()  # 실행 중인 asyncio 태스크 참조 유지 (GC 방지)
+
+
+def get_job(job_id: str) -> Optional[ExportJob]:
+    """작업 조회"""
+    return _jobs.get(job_id)
+
+
+def _safe_name(value) -> str:
+    """ZIP 내부 파일명에 쓸 수 없는 문자 제거"""
+    return re.sub(r'[\\/:*?"<>|\s]+', "_", str(value or "")).strip("_") or "-"
+
+
+def _archive_name(kind: str, row: dict) -> str:
+    return (f"{DOCUMENT_FOLDERS[kind]}/{_safe_name(row.get('event_date'))}_"
+            f"{_safe_name(row.get('event_title'))}/{_safe_name(row.get('name'))}_{row['id']}.pdf")
+
+
+def _document_tasks(rows: List[dict], kinds: List[str]) -> List[tuple]:
+    """(문서 유형, 근무자 정보, 레코드) 목록 생성"""
+    tasks = []
+    for row in rows:
+        worker = {"name": row.get("name"), "birth_date": row.get("birth_date"), "phone": row.get("phone")}
+        if "payment_statement" in kinds:
+            tasks.append(("payment_statement", worker, row))
+        if "certificate" in kinds and row.get("chain_log_id"):
+            # 증명서 문서번호는 체인 로그 ID 기준
+            tasks.append(("certificate", worker, {**row, "id": row["chain_log_id"]}))
+    return tasks
+
+
+async def _run(job: ExportJob, rows: List[dict]):
+    job.status = "RUNNING"
+    tasks = _document_tasks(rows, job.kinds)
+    job.total = len(tasks)
+
+    export_dir = Path(get_settings().bulk_export_path)
+    export_dir.mkdir(parents=True, exist_ok=True)
+    zip_path = export_dir / f"{job.id}.zip"
+
+    semaphore = asyncio.Semaphore(MAX_PENDING_RENDERS)
+
+    async def render(kind: str, worker: dict, record: dict):
+        async with semaphore:
+            try:
+                path = await pdf_service.render_pdf(kind, worker, record)
+                return kind, record, path
+            except Exception as e:
+                logger.error(f"Bulk export render failed ({kind}, {record.get('id')}): {e}")
+                job.failed += 1
+                return kind, record, None
+
+    try:
+        # PDF는 이미 압축되어 있으므로 ZIP_STORED
+        with zipfile.ZipFile(zip_path, "w", compression=zipfile.ZIP_STORED) as zf:
+            for coro in asyncio.as_completed([render(*task) for task in tasks]):
+                kind, record, path = await coro
+                if path:
+                    zf.write(path, _archive_name(kind, record))
+                job.done += 1
+
+        job.file_path = str(zip_path)
+        job.status = "COMPLETED"
+    except Exception as e:
+        logger.error(f"Bulk export job {job.id} failed: {e}", exc_info=True)
+        job.status = "FAILED"
+        job.error = str(e)
+        if zip_path.exists():
+            os.remove(zip_path)
+    finally:
+        job.finished_at = now_kst()
+
+
+def _prune_jobs():
+    """오래된 완료 작업과 파일 정리"""
+    finished = sorted(
+        (job for job in _jobs.values() if job.status in ("COMPLETED", "FAILED")),
+        key=lambda job: job.created_at,
+    )
+    while len(_jobs) > MAX_JOBS and finished:
+        job = finished.pop(0)
+        _jobs.pop(job.id, None)
+        if job.file_path and os.path.exists(job.file_path):
+            os.remove(job.file_path)
+
+
+def start_export(rows: List[dict], kinds: List[str], scope: str) -> ExportJob:
+    """
+    일괄 발급 작업 시작 (이벤트 루프에서 백그라운드 실행)
+
+    Args:
+        rows: Database.list_attendance_for_documents 결과
+        kinds: 발급할 문서 유형 목록 (payment_statement, certificate)
+        scope: 작업 범위 설명 (예: "event:12", "month:2026-01")
+
+    Returns:
+        생성된 작업
+    """
+    _prune_jobs()
+    job = ExportJob(id=uuid.uuid4().hex, scope=scope, kinds=kinds)
+    _jobs[job.id] = job
+    task = asyncio.get_running_loop().create_task(_run(job, rows))
+    _tasks.add(task)
+    task.add_done_callback(_tasks.discard)
+    return job
@@ -1,62 +1,238 @@
-"""Email Service for verification codes"""
-import smtplib
-import random
+"""Email Service for verification codes
+
+- 발송은 백그라운드 스레드의 큐에서 처리 (요청은 큐 등록 후 즉시 반환)
+- 인증(STARTTLS/로그인)된 SMTP 세션을 유지해 재사용, 유휴 시간이 지나면 종료
+- 실패 시 지수 백오프로 재시도, 메시지별 발송 상태 조회 가능
+- EMAIL_BACKEND=memory 이면 실제 발송 대신 메모리에 보관 (테스트용)
+"""
 import logging
+import queue
+import random
+import smtplib
+import threading
+import time
+import uuid
+from collections import OrderedDict
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from datetime import datetime, timedelta
+from typing import Dict, List, Optional
 
 from ..config import get_settings
 
 logger = logging.getLogger(__name__)
 
+# 발송 상태
+QUEUED = "QUEUED"
+SENDING = "SENDING"
+RETRYING = "RETRYING"
+SENT = "SENT"
+FAILED = "FAILED"
+
+# 상태를 보관할 최근 메시지 수
+STATUS_HISTORY_SIZE = 5000
+
+
+class SMTPTransport:
+    """인증된 SMTP 세션을 유지하며 재사용 (발송 스레드 전용)"""
+
+    def __init__(self, settings):
+        self.settings = settings
+        self._server: Optional[smtplib.SMTP] = None
+        self._last_used = 0.0
+
+    def _connect(self) -> smtplib.SMTP:
+        server = smtplib.SMTP(self.settings.SMTP_HOST, self.settings.SMTP_PORT, timeout=self.settings.SMTP_TIMEOUT)
+        if self.settings.SMTP_STARTTLS:
+            server.starttls()
+        if self.settings.SMTP_USER:
+            server.login(self.settings.SMTP_USER, self.settings.SMTP_PASSWORD)
+        logger.info(f"SMTP session opened: {self.settings.SMTP_HOST}:{self.settings.SMTP_PORT}")
+        return server
+
+    def send(self, msg: MIMEMultipart):
+        if self._server is not None and time.monotonic() - self._last_used > self.settings.SMTP_IDLE_TIMEOUT:
+            self.close()
+        if self._server is None:
+            self._server = self._connect()
+
+        try:
+            self._server.send_message(msg)
+        except smtplib.SMTPServerDisconnected:
+            # 서버가 유휴 세션을 먼저 끊은 경우: 한 번 재연결 후 재전송
+            self._server = self._connect()
+            self._server.send_message(msg)
+        except (smtplib.SMTPException, OSError):
+            self.close()
+            raise
+        self._last_used = time.monotonic()
+
+    def close_if_idle(self):
+        if self._server is not None and time.monotonic() - self._last_used > self.settings.SMTP_IDLE_TIMEOUT:
+            self.close()
+
+    def close(self):
+        if self._server is not None:
+            try:
+                self._server.quit()
+            except Exception:
+                pass
+            self._server = None
+
+
+class MemoryTransport:
+    """로컬 테스트용 SMTP 대체 (발송된 메시지를 메모리에 보관)"""
+
+    def __init__(self, settings=None):
+        self.outbox: List[MIMEMultipart] = []
+
+    def send(self, msg: MIMEMultipart):
+        self.outbox.append(msg)
+        logger.info(f"[MEMORY] Email to {msg['To']}: {msg['Subject']}")
+
+    def close_if_idle(self):
+        pass
+
+    def close(self):
+        pass
+
 
 class EmailService:
     """이메일 발송 서비스"""
 
     def __init__(self):
         self.settings = get_settings()
+        self.transport = (MemoryTransport(self.settings) if self.settings.EMAIL_BACKEND == "memory"
+                          else SMTPTransport(self.settings))
+        self._queue: "queue.Queue[Optional[str]]" = queue.Queue()
+        self._jobs: "OrderedDict[str, dict]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
 
     @property
     def enabled(self) -> bool:
         """이메일 서비스 활성화 여부"""
-        return bool(self.settings.SMTP_USER and self.settings.SMTP_PASSWORD)
+        if self.settings.EMAIL_BACKEND == "memory":
+            return True
+        return bool(self.settings.SMTP_USER and self.settings.SMTP_PASSWORD) or not self.settings.SMTP_STARTTLS
 
     def _generate_code(self, length: int = 6) -> str:
         """인증번호 생성 (6자리 숫자)"""
         return ''.join(random.choices('0123456789', k=length))
 
-    def send_email(self, to_email: str, subject: str, body: str) -> bool:
-        """이메일 발송"""
+    def _build_message(self, to_email: str, subject: str, body: str) -> MIMEMultipart:
+        from_email = self.settings.SMTP_FROM_EMAIL or self.settings.SMTP_USER
+        msg = MIMEMultipart()
+        msg['From'] = f"{self.settings.SMTP_FROM_NAME} <{from_email}>"
+        msg['To'] = to_email
+        msg['Subject'] = subject
+        msg.attach(MIMEText(body, 'html', 'utf-8'))
+        return msg
+
+    # ===== 큐 =====
+    def enqueue(self, to_email: str, subject: str, body: str) -> Optional[str]:
+        """발송 큐에 등록 (즉시 반환)
+
+        Returns:
+            메시지 ID (상태 조회용), 서비스 비활성 시 None
+        """
         if not self.enabled:
             logger.warning("Email service not configured. Skipping email send.")
-            return False
+            return None
 
-        try:
-            msg = MIMEMultipart()
-            msg['From'] = f"{self.settings.SMTP_FROM_NAME} <{self.settings.SMTP_USER}>"
-            msg['To'] = to_email
-            msg['Subject'] = subject
+        message_id = uuid.uuid4().hex
+        with self._lock:
+            self._jobs[message_id] = {
+                "to_email": to_email, "subject": subject, "body": body,
+                "status": QUEUED, "attempts": 0, "error": None,
+                "queued_at": datetime.now(), "sent_at": None,
+            }
+            while len(self._jobs) > STATUS_HISTORY_SIZE:
+                self._jobs.popitem(last=False)
+            self._ensure_worker()
+        self._queue.put(message_id)
+        return message_id
 
-            msg.attach(MIMEText(body, 'html', 'utf-8'))
+    def get_status(self, message_id: str) -> Optional[Dict]:
+        """발송 상태 조회"""
+        with self._lock:
+            job = self._jobs.get(message_id)
+            if not job:
+                return None
+            return {
+                "message_id": message_id,
+                "status": job["status"],
+                "attempts": job["attempts"],
+                "error": job["error"],
+                "queued_at": job["queued_at"],
+                "sent_at": job["sent_at"],
+            }
 
-            with smtplib.SMTP(self.settings.SMTP_HOST, self.settings.SMTP_PORT) as server:
-                server.starttls()
-                server.login(self.settings.SMTP_USER, self.settings.SMTP_PASSWORD)
-                server.send_message(msg)
+    def _ensure_worker(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name="email-sender", daemon=True)
+            self._thread.start()
 
-            logger.info(f"Email sent to {to_email}")
-            return True
+    def _run(self):
+        while True:
+            try:
+                message_id = self._queue.get(timeout=self.settings.SMTP_IDLE_TIMEOUT)
+            except queue.Empty:
+                self.transport.close_if_idle()
+                continue
+            if message_id is None:
+                break
+            self._deliver(message_id)
+        self.transport.close()
 
+    def _deliver(self, message_id: str):
+        with self._lock:
+            job = self._jobs.get(message_id)
+            if not job:
+                return
+            job["status"] = SENDING
+            job["attempts"] += 1
+
+        try:
+            self.transport.send(self._build_message(job["to_email"], job["subject"], job["body"]))
         except Exception as e:
-            logger.error(f"Failed to send email to {to_email}: {e}")
-            return False
+            with self._lock:
+                job["error"] = str(e)
+                if job["attempts"] >= self.settings.EMAIL_MAX_ATTEMPTS:
+                    job["status"] = FAILED
+                    logger.error(f"Failed to send email to {job['to_email']} after {job['attempts']} attempts: {e}")
+                    return
+                job["status"] = RETRYING
+            delay = min(300, 2 ** job["attempts"])
+            logger.warning(f"Email to {job['to_email']} failed (attempt {job['attempts']}), retry in {delay}s: {e}")
+            timer = threading.Timer(delay, self._queue.put, args=(message_id,))
+            timer.daemon = True
+            timer.start()
+            return
+
+        with self._lock:
+            job["status"] = SENT
+            job["error"] = None
+            job["sent_at"] = datetime.now()
+        logger.info(f"Email sent to {job['to_email']}")
+
+    def shutdown(self, timeout: float = 5.0):
+        """발송 스레드 종료 (남은 큐 처리 후 SMTP 세션 종료)"""
+        if self._thread is not None and self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join(timeout)
+        self._thread = None
+
+    # ===== 발송 =====
+    def send_email(self, to_email: str, subject: str, body: str) -> bool:
+        """이메일 발송 (큐 등록, 실제 발송은 백그라운드)"""
+        return self.enqueue(to_email, subject, body) is not None
 
-    def send_verification_code(self, email: str) -> tuple[str, datetime]:
-        """인증번호 생성 및 이메일 발송
+    def send_verification_code(self, email: str) -> tuple[str, datetime, Optional[str]]:
+        """인증번호 생성 및 이메일 발송 (큐 등록)
 
         Returns:
-            tuple: (인증번호, 만료시간)
+            tuple: (인증번호, 만료시간, 메시지 ID)
         """
         code = self._generate_code()
         expires_at = datetime.now() + timedelta(minutes=self.settings.EMAIL_VERIFICATION_EXPIRE_MINUTES)
@@ -83,13 +259,14 @@ class EmailService:
         </html>
         """
 
+        message_id = None
         if self.enabled:
-            self.send_email(email, subject, body)
+            message_id = self.enqueue(email, subject, body)
         else:
             # 개발 모드: 로그에 인증번호 출력
             logger.info(f"[DEV MODE] Verification code for {email}: {code}")
 
-        return code, expires_at
+        return code, expires_at, message_id
 
 
 # 싱글톤 인스턴스
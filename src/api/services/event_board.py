@@ -0,0 +1,116 @@
+"""Event-day GPS Board (행사 당일 확정 근무자 GPS 현황)
+
+관리자 화면이 수시로 새로고침하는 보드를 Database.get_event_gps_board 한 번의 쿼리로 만들고,
+GPS_BOARD_CACHE_SECONDS 동안 행사별로 캐시한다. 관리자 출퇴근 처리 후에는 해당 행사 캐시를 비운다.
+아직 저장되지 않은 위치(수집 버퍼)는 응답 직전에 덮어써 캐시 중에도 최신 좌표를 보여준다.
+"""
+import time
+from typing import Dict, Optional, Tuple
+
+from ..config import get_settings
+from . import location_ingest
+from db import Database
+
+# event_id -> (만료 시각, 보드)
+_boards: Dict[int, Tuple[float, dict]] = {}
+
+
+def _isoformat(value) -> Optional[str]:
+    return value.isoformat() if value else None
+
+
+def _build(db: Database, event_id: int) -> Optional[dict]:
+    rows = db.get_event_gps_board(event_id)
+    if not rows:
+        return None
+
+    event = rows[0]
+    has_location = event["event_lat"] is not None and event["event_lng"] is not None
+    workers = []
+    for row in rows:
+        if row["application_id"] is None:
+            continue
+        location = None
+        if row["latitude"] is not None:
+            location = {
+                "latitude": float(row["latitude"]),
+                "longitude": float(row["longitude"]),
+                "updated_at": _isoformat(row["location_updated_at"]),
+            }
+        distance_meters = row["distance_meters"] if has_location else None
+        workers.append({
+            "worker_id": row["worker_id"],
+            "worker_name": row["worker_name"],
+            "worker_phone": row["worker_phone"],
+            "application_id": row["application_id"],
+            "attendance_id": row["attendance_id"],
+            "gps_location": location,
+            "distance_meters": distance_meters,
+            "within_range": distance_meters is not None and distance_meters <= event["event_radius"],
+            "check_in_time": _isoformat(row["check_in_time"]),
+            "check_out_time": _isoformat(row["check_out_time"]),
+        })
+
+    return {
+        "event_id": event_id,
+        "event_title": event["event_title"],
+        "event_location": {
+            "address": event["event_address"],
+            "latitude": float(event["event_lat"]) if event["event_lat"] is not None else None,
+            "longitude": float(event["event_lng"]) if event["event_lng"] is not None else None,
+            "radius": event["event_radius"],
+        },
+        "workers": workers,
+    }
+
+
+def _with_buffered_locations(db: Database, board: dict) -> dict:
+    """수집 버퍼에 있는 더 새로운 위치 반영 (해당 근무자만 거리 재계산)"""
+    event_location = board["event_location"]
+    workers = None
+    for index, worker in enumerate(board["workers"]):
+        point = location_ingest.get_buffered_location(worker["worker_id"], board["event_id"])
+        if not point:
+            continue
+        if workers is None:
+            workers = list(board["workers"])
+
+        distance_meters = None
+        if event_location["latitude"] is not None and event_location["longitude"] is not None:
+            distance_meters = int(db.calculate_distance(
+                event_location["latitude"], event_location["longitude"],
+                float(point["latitude"]), float(point["longitude"])
+            ))
+        workers[index] = {
+            **worker,
+            "gps_location": {
+                "latitude": float(point["latitude"]),
+                "longitude": float(point["longitude"]),
+                "updated_at": _isoformat(point["updated_at"]),
+            },
+            "distance_meters": distance_meters,
+            "within_range": distance_meters is not None and distance_meters <= event_location["radius"],
+        }
+    return board if workers is None else {**board, "workers": workers}
+
+
+def get_confirmed_board(db: Database, event_id: int) -> Optional[dict]:
+    """확정 근무자 GPS 보드 (캐시), 행사가 없으면 None"""
+    now = time.monotonic()
+    cached = _boards.get(event_id)
+    if cached and cached[0] > now:
+        board = cached[1]
+    else:
+        board = _build(db, event_id)
+        if board is None:
+            return None
+        _boards[event_id] = (now + get_settings().GPS_BOARD_CACHE_SECONDS, board)
+        # 만료된 행사 보드 정리
+        for key in [key for key, (expires, _) in _boards.items() if expires <= now]:
+            _boards.pop(key, None)
+    return _with_buffered_locations(db, board)
+
+
+def invalidate(event_id: int):
+    """행사 보드 캐시 삭제 (출퇴근 처리 후)"""
+    _boards.pop(event_id, None)
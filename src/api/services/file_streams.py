@@ -0,0 +1,95 @@
+"""File Streams (파일 스트리밍 응답)
+
+write(fileobj) 형태로 파일을 작성하는 함수(엑셀/CSV 작성기, COPY 등)의 출력을
+임시 파일 없이 청크 단위로 StreamingResponse에 넘긴다.
+"""
+import logging
+import queue
+import threading
+from typing import Callable, Iterator
+
+logger = logging.getLogger(__name__)
+
+# 청크 크기 / 작성 스레드가 앞서갈 수 있는 청크 수
+STREAM_CHUNK_SIZE = 64 * 1024
+STREAM_MAX_PENDING = 8
+
+
+class StreamCancelled(Exception):
+    """스트리밍 중 수신 측이 연결을 끊음"""
+
+
+class _ChunkPipe:
+    """작성 스레드 → 응답 제너레이터 청크 전달 (seek 불가 스트림, zipfile이 순차 기록)"""
+
+    def __init__(self, chunks: queue.Queue, cancelled: threading.Event, chunk_size: int):
+        self.chunks = chunks
+        self.cancelled = cancelled
+        self.chunk_size = chunk_size
+        self.buffer = bytearray()
+
+    def put(self, item):
+        while not self.cancelled.is_set():
+            try:
+                self.chunks.put(item, timeout=1)
+                return
+            except queue.Full:
+                continue
+        raise StreamCancelled()
+
+    def write(self, data) -> int:
+        self.buffer += data
+        if len(self.buffer) >= self.chunk_size:
+            self.put(bytes(self.buffer))
+            self.buffer.clear()
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def close(self):
+        if self.buffer:
+            self.put(bytes(self.buffer))
+            self.buffer.clear()
+
+
+_DONE = object()
+
+
+def iter_file(write: Callable, chunk_size: int = STREAM_CHUNK_SIZE) -> Iterator[bytes]:
+    """
+    write(fileobj)가 작성하는 파일(xlsx/csv)을 청크 단위로 반환 (임시 파일 없음)
+
+    작성은 별도 스레드에서 진행되고 대기 청크 수가 제한되므로, 느린 수신 측에 맞춰 작성도 멈춘다.
+    StreamingResponse에 그대로 넘길 수 있다.
+    """
+    chunks: queue.Queue = queue.Queue(maxsize=STREAM_MAX_PENDING)
+    cancelled = threading.Event()
+    pipe = _ChunkPipe(chunks, cancelled, chunk_size)
+
+    def run():
+        try:
+            write(pipe)
+            pipe.close()
+            pipe.put(_DONE)
+        except StreamCancelled:
+            pass
+        except BaseException as e:
+            logger.error(f"File stream failed: {e}", exc_info=True)
+            try:
+                pipe.put(e)
+            except StreamCancelled:
+                pass
+
+    thread = threading.Thread(target=run, name="file-stream", daemon=True)
+    thread.start()
+    try:
+        while True:
+            item = chunks.get()
+            if item is _DONE:
+                return
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+    finally:
+        cancelled.set()
@@ -0,0 +1,45 @@
+"""Live Streams (SSE 실시간 푸시)
+
+API 프로세스 단위 LISTEN 허브와 Server-Sent Events 포맷 헬퍼
+"""
+import json
+from typing import Dict, Tuple
+
+from db import Database, NOTIFICATION_CHANNEL, ATTENDANCE_CHANNEL
+from live_feed import ChannelHub
+
+# 연결 유지용 주석 이벤트 간격 (프록시 유휴 타임아웃보다 짧게)
+HEARTBEAT_SECONDS = 25
+HEARTBEAT = ": keep-alive\n\n"
+
+SSE_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+
+_hubs: Dict[Tuple[str, str], ChannelHub] = {}
+
+
+def get_hub(db: Database, channel: str, key: str) -> ChannelHub:
+    """채널별 허브 (프로세스 단위 싱글톤)"""
+    hub = _hubs.get((channel, key))
+    if hub is None:
+        hub = _hubs[(channel, key)] = ChannelHub(db, channel, key)
+    return hub
+
+
+def notification_hub(db: Database) -> ChannelHub:
+    """근무자별 알림 이벤트"""
+    return get_hub(db, NOTIFICATION_CHANNEL, "worker_id")
+
+
+def attendance_hub(db: Database) -> ChannelHub:
+    """행사별 출석 변경 이벤트"""
+    return get_hub(db, ATTENDANCE_CHANNEL, "event_id")
+
+
+def sse(event: str, data: dict) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False, default=str)}\n\n"
+
+
+async def shutdown_hubs():
+    for hub in _hubs.values():
+        await hub.stop()
+    _hubs.clear()
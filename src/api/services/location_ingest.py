@@ -0,0 +1,134 @@
+"""GPS Location Ingestion (근무자 위치 수집)
+
+/api/attendance/location 요청은 메모리 버퍼에만 기록하고, 백그라운드 태스크가
+LOCATION_FLUSH_INTERVAL마다 한 트랜잭션으로 저장한다.
+- 최신 위치: (근무자, 행사)당 마지막 점만 upsert (worker_latest_locations)
+- 이력: 근무자별 LOCATION_HISTORY_INTERVAL당 1개로 다운샘플링해 COPY (worker_locations)
+근무자 수와 무관하게 DB 쓰기는 flush 주기당 1회, 이력 크기는 보존 기간 × 샘플 간격으로 제한된다.
+"""
+import asyncio
+import logging
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from ..config import get_settings
+from db import Database
+
+logger = logging.getLogger(__name__)
+
+Key = Tuple[int, int]  # (worker_id, event_id)
+
+
+class LocationIngestor:
+    """위치 버퍼 + 주기적 일괄 저장"""
+
+    def __init__(self, db: Database):
+        settings = get_settings()
+        self.db = db
+        self.flush_interval = settings.LOCATION_FLUSH_INTERVAL
+        self.history_interval = settings.LOCATION_HISTORY_INTERVAL
+        self.max_buffer = settings.LOCATION_BUFFER_MAX
+        self._latest: Dict[Key, tuple] = {}
+        self._history: List[tuple] = []
+        self._last_history_at: Dict[Key, datetime] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._flush_now = asyncio.Event()
+
+    def add(self, worker_id: int, event_id: int, latitude: float, longitude: float):
+        """위치 기록 (버퍼에만 추가, 즉시 반환)"""
+        now = datetime.now()
+        key = (worker_id, event_id)
+        point = (worker_id, event_id, latitude, longitude, now)
+        self._latest[key] = point
+
+        last = self._last_history_at.get(key)
+        if last is None or (now - last).total_seconds() >= self.history_interval:
+            self._history.append(point)
+            self._last_history_at[key] = now
+
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+        if len(self._latest) + len(self._history) >= self.max_buffer:
+            self._flush_now.set()
+
+    def peek(self, worker_id: int, event_id: int) -> Optional[Dict]:
+        """아직 저장되지 않은 최신 위치 (같은 프로세스에서 바로 조회할 때)"""
+        point = self._latest.get((worker_id, event_id))
+        if not point:
+            return None
+        return {
+            "worker_id": point[0], "event_id": point[1],
+            "latitude": point[2], "longitude": point[3], "updated_at": point[4],
+        }
+
+    async def _run(self):
+        while True:
+            try:
+                await asyncio.wait_for(self._flush_now.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._flush_now.clear()
+            await self.flush()
+
+    async def flush(self):
+        if not self._latest and not self._history:
+            return
+        latest, history = list(self._latest.values()), self._history
+        self._latest, self._history = {}, []
+
+        try:
+            await asyncio.to_thread(self.db.save_worker_locations, latest, history)
+        except Exception as e:
+            logger.error(f"Location flush failed ({len(latest)} latest, {len(history)} history): {e}")
+            # 다음 주기에 재시도 (그사이 들어온 더 새로운 위치가 우선)
+            for point in latest:
+                self._latest.setdefault((point[0], point[1]), point)
+            self._history = history[-self.max_buffer:] + self._history
+            return
+
+        # 다운샘플링 기준 시각은 오래된 키만 정리 (메모리 상한)
+        if len(self._last_history_at) > self.max_buffer * 4:
+            cutoff = datetime.now()
+            self._last_history_at = {
+                key: at for key, at in self._last_history_at.items()
+                if (cutoff - at).total_seconds() < self.history_interval
+            }
+
+    async def stop(self):
+        """종료 시 남은 위치 저장"""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+
+
+_ingestor: Optional[LocationIngestor] = None
+
+
+def get_ingestor(db: Database) -> LocationIngestor:
+    """프로세스 단위 수집기 (싱글톤)"""
+    global _ingestor
+    if _ingestor is None:
+        _ingestor = LocationIngestor(db)
+    return _ingestor
+
+
+def get_buffered_location(worker_id: int, event_id: int) -> Optional[Dict]:
+    """아직 저장되지 않은 최신 위치 (없으면 None)"""
+    if _ingestor is None:
+        return None
+    return _ingestor.peek(worker_id, event_id)
+
+
+def get_latest_location(db: Database, worker_id: int, event_id: int) -> Optional[Dict]:
+    """최신 위치 (버퍼 우선, 없으면 DB)"""
+    return get_buffered_location(worker_id, event_id) or db.get_worker_location(worker_id, event_id)
+
+
+async def shutdown_ingestor():
+    if _ingestor is not None:
+        await _ingestor.stop()
@@ -1,5 +1,9 @@
 """NFT Badge Image Generation Service"""
-import os
+import hashlib
+import json
+import re
+from collections import OrderedDict
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 from datetime import datetime
@@ -79,21 +83,104 @@ def get_grade_colors(grade: str) -> dict:
     return GRADE_COLORS.get(grade, GRADE_COLORS["COMMON"])
 
 
+TEMPLATE_DIR = Path(__file__).parent.parent / "templates"
+
+# {{name}} 형태의 치환 변수
+PLACEHOLDER_PATTERN = re.compile(r"\{\{(\w+)\}\}")
+
+# 렌더링 결과 캐시 크기 (콘텐츠 해시 기준)
+RENDER_CACHE_SIZE = 1024
+
+
+@lru_cache(maxsize=None)
 def load_svg_template(template_type: str = 'minimal') -> str:
-    """SVG 템플릿 파일 로드"""
+    """SVG 템플릿 파일 로드 (프로세스당 1회)"""
     if template_type not in TEMPLATE_TYPES:
         template_type = 'minimal'
 
-    template_path = Path(__file__).parent.parent / "templates" / f"badge_{template_type}.svg"
+    template_path = TEMPLATE_DIR / f"badge_{template_type}.svg"
     if not template_path.exists():
         # 폴백: badge_card.svg 사용
-        template_path = Path(__file__).parent.parent / "templates" / "badge_card.svg"
+        template_path = TEMPLATE_DIR / "badge_card.svg"
 
     with open(template_path, "r", encoding="utf-8") as f:
         return f.read()
 
 
-def render_badge_svg(
+@lru_cache(maxsize=None)
+def compile_svg_template(template_type: str = 'minimal') -> tuple:
+    """
+    템플릿을 고정 문자열/변수명 조각으로 미리 분할
+
+    짝수 인덱스는 고정 문자열, 홀수 인덱스는 변수명
+    """
+    return tuple(PLACEHOLDER_PATTERN.split(load_svg_template(template_type)))
+
+
+def fill_svg_template(template_type: str, values: dict) -> str:
+    """미리 분할된 템플릿에 값을 한 번에 채워 넣기 (알 수 없는 변수는 그대로 유지)"""
+    parts = list(compile_svg_template(template_type))
+    for i in range(1, len(parts), 2):
+        name = parts[i]
+        parts[i] = str(values[name]) if name in values else "{{" + name + "}}"
+    return "".join(parts)
+
+
+class RenderedBadge:
+    """렌더링 입력값과 콘텐츠 해시 (SVG/PNG는 필요할 때 생성 후 캐시)"""
+    __slots__ = ("template_type", "values", "etag")
+
+    def __init__(self, template_type: str, values: dict):
+        self.template_type = template_type if template_type in TEMPLATE_TYPES else 'minimal'
+        self.values = values
+        payload = json.dumps([self.template_type, values], sort_keys=True, ensure_ascii=False)
+        self.etag = hashlib.sha256(payload.encode("utf-8")).hexdigest()[:32]
+
+    @property
+    def svg(self) -> str:
+        return _render_cached(self.etag, self.template_type, self.values)
+
+    def png(self) -> bytes:
+        """PNG 래스터화 (cairosvg 필요)"""
+        return _rasterize_cached(self.etag, self.svg)
+
+
+_svg_cache: "OrderedDict[str, str]" = OrderedDict()
+_png_cache: "OrderedDict[str, bytes]" = OrderedDict()
+
+
+def _cache_get(cache: OrderedDict, key: str):
+    value = cache.get(key)
+    if value is not None:
+        cache.move_to_end(key)
+    return value
+
+
+def _cache_put(cache: OrderedDict, key: str, value):
+    cache[key] = value
+    cache.move_to_end(key)
+    while len(cache) > RENDER_CACHE_SIZE:
+        cache.popitem(last=False)
+
+
+def _render_cached(etag: str, template_type: str, values: dict) -> str:
+    svg = _cache_get(_svg_cache, etag)
+    if svg is None:
+        svg = fill_svg_template(template_type, values)
+        _cache_put(_svg_cache, etag, svg)
+    return svg
+
+
+def _rasterize_cached(etag: str, svg: str) -> bytes:
+    png = _cache_get(_png_cache, etag)
+    if png is None:
+        import cairosvg  # 선택 의존성
+        png = cairosvg.svg2png(bytestring=svg.encode("utf-8"))
+        _cache_put(_png_cache, etag, png)
+    return png
+
+
+def prepare_badge(
     badge_type: str,
     badge_level: int,
     title: str,
@@ -105,9 +192,9 @@ def render_badge_svg(
     template_type: str = 'minimal',
     event_name: Optional[str] = None,
     grade_override: Optional[str] = None
-) -> str:
+) -> RenderedBadge:
     """
-    배지 데이터로 SVG 이미지 생성
+    배지 데이터로 템플릿 치환 값 계산 (SVG 렌더링 전에 ETag 확인 가능)
 
     Args:
         badge_type: 배지 유형 (WORK_COUNT, TRUST, BLOCKCHAIN, PROJECT 등)
@@ -123,45 +210,56 @@ def render_badge_svg(
         grade_override: 등급 강제 지정
 
     Returns:
-        렌더링된 SVG 문자열
+        RenderedBadge (etag, svg, png())
     """
     # 등급 및 색상 가져오기
     grade = get_badge_grade(badge_type, badge_level, grade_override)
     colors = get_grade_colors(grade)
 
-    # 템플릿 로드
-    template = load_svg_template(template_type)
-
     # 날짜 포맷
     if isinstance(earned_at, datetime):
         date_str = earned_at.strftime("%Y년 %m월 %d일")
     else:
         date_str = str(earned_at)[:10] if earned_at else ""
 
-    # SVG 아이콘 가져오기
-    icon_svg = get_badge_icon_svg(badge_type, badge_level)
-
-    # 변수 치환
-    replacements = {
-        "{{icon}}": icon or "🏅",
-        "{{icon_svg}}": icon_svg,
-        "{{title}}": title or "",
-        "{{description}}": description or "",
-        "{{grade_label}}": colors["label"],
-        "{{grade_color_start}}": colors["start"],
-        "{{grade_color_end}}": colors["end"],
-        "{{grade_badge_color}}": colors["badge"],
-        "{{earned_date}}": date_str,
-        "{{worker_id}}": f"WP-{worker_id:05d}" if worker_id else "",
-        "{{worker_name}}": worker_name or "",
-        "{{event_name}}": event_name or "",
+    values = {
+        "icon": icon or "🏅",
+        "icon_svg": get_badge_icon_svg(badge_type, badge_level),
+        "title": title or "",
+        "description": description or "",
+        "grade_label": colors["label"],
+        "grade_color_start": colors["start"],
+        "grade_color_end": colors["end"],
+        "grade_badge_color": colors["badge"],
+        "earned_date": date_str,
+        "worker_id": f"WP-{worker_id:05d}" if worker_id else "",
+        "worker_name": worker_name or "",
+        "event_name": event_name or "",
     }
+    return RenderedBadge(template_type, values)
 
-    svg = template
-    for key, value in replacements.items():
-        svg = svg.replace(key, str(value))
 
-    return svg
+def render_badge_svg(
+    badge_type: str,
+    badge_level: int,
+    title: str,
+    description: str,
+    icon: str,
+    earned_at: datetime,
+    worker_id: int,
+    worker_name: Optional[str] = None,
+    template_type: str = 'minimal',
+    event_name: Optional[str] = None,
+    grade_override: Optional[str] = None
+) -> str:
+    """배지 데이터로 SVG 이미지 생성 (인자는 prepare_badge와 동일)"""
+    return prepare_badge(
+        badge_type, badge_level, title, description, icon, earned_at, worker_id,
+        worker_name=worker_name,
+        template_type=template_type,
+        event_name=event_name,
+        grade_override=grade_override
+    ).svg
 
 
 def render_project_badge_svg(
@@ -0,0 +1,620 @@
+"""PDF Rendering Service (근무증명서 / 지급명세서)
+
+- 폰트 등록은 프로세스당 1회
+- ReportLab 렌더링은 프로세스 풀에서 실행 (이벤트 루프 블로킹 방지)
+- 생성된 PDF는 내용 해시 기반으로 디스크에 저장하여 재다운로드 시 재사용
+"""
+import asyncio
+import hashlib
+import json
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from functools import lru_cache
+from io import BytesIO
+from pathlib import Path
+from typing import Callable, Dict, Optional
+
+from ..config import get_settings
+from utils import now_kst
+
+logger = logging.getLogger(__name__)
+
+# 나눔고딕 폰트 경로
+FONT_PATH = "/usr/share/fonts/truetype/nanum/NanumGothic.ttf"
+BOLD_FONT_PATH = "/usr/share/fonts/truetype/nanum/NanumGothicBold.ttf"
+
+# PDF에 실제로 사용되는 필드만 렌더러로 전달 (캐시 키 + 프로세스 간 전송량 최소화)
+WORKER_FIELDS = ("name", "birth_date", "phone")
+CERTIFICATE_FIELDS = (
+    "id", "tx_hash", "block_number", "event_title", "location", "event_date",
+    "check_in_time", "check_out_time", "worked_minutes", "pay_amount",
+)
+PAYMENT_STATEMENT_FIELDS = (
+    "id", "event_title", "event_date", "pay_amount", "check_in_time", "check_out_time",
+)
+
+# 회사 정보 (고정값)
+COMPANY_INFO = {
+    "name": "(주)엘케이프라이빗",
+    "business_number": "635-86-01148",
+    "ceo_name": "김재영",
+}
+
+
+# ============================================
+# 프로세스 단위 캐시 (폰트, 색상, QR)
+# ============================================
+
+@lru_cache()
+def register_fonts() -> tuple:
+    """나눔고딕 폰트 등록 (프로세스당 1회)
+
+    Returns:
+        tuple: (기본 폰트명, 굵은 폰트명)
+    """
+    from reportlab.pdfbase import pdfmetrics
+    from reportlab.pdfbase.ttfonts import TTFont
+
+    if not os.path.exists(FONT_PATH):
+        return "Helvetica", "Helvetica-Bold"
+
+    try:
+        pdfmetrics.registerFont(TTFont("NanumGothic", FONT_PATH))
+        bold_path = BOLD_FONT_PATH if os.path.exists(BOLD_FONT_PATH) else FONT_PATH
+        pdfmetrics.registerFont(TTFont("NanumGothicBold", bold_path))
+    except Exception as e:
+        logger.warning(f"Font registration failed, falling back to Helvetica: {e}")
+        return "Helvetica", "Helvetica-Bold"
+
+    return "NanumGothic", "NanumGothicBold"
+
+
+@lru_cache(maxsize=64)
+def _color(hex_code: str):
+    """HexColor 객체 캐시"""
+    from reportlab.lib.colors import HexColor
+    return HexColor(hex_code)
+
+
+@lru_cache(maxsize=512)
+def _qr_png(url: str) -> bytes:
+    """QR 코드 PNG 캐시 (같은 TX Hash는 한 번만 생성)"""
+    import qrcode
+
+    qr = qrcode.QRCode(version=1, box_size=6, border=2)
+    qr.add_data(url)
+    qr.make(fit=True)
+    qr_img = qr.make_image(fill_color="#1E3A5F", back_color="white")
+
+    qr_buffer = BytesIO()
+    qr_img.save(qr_buffer, format='PNG')
+    return qr_buffer.getvalue()
+
+
+def _format_time(time_val) -> str:
+    """시간 값을 HH:MM 형식으로 변환"""
+    if not time_val:
+        return "-"
+    if isinstance(time_val, datetime):
+        return time_val.strftime("%H:%M")
+    if isinstance(time_val, str):
+        if "T" in time_val:
+            return time_val.split("T")[1][:5]
+        elif " " in time_val:
+            return time_val.split(" ")[1][:5]
+        elif ":" in time_val:
+            return time_val[:5]
+    return "-"
+
+
+# ============================================
+# 렌더러 (프로세스 풀에서 실행되는 순수 함수)
+# ============================================
+
+def render_certificate_pdf(worker: dict, log: dict, issued_date: str) -> bytes:
+    """블록체인 업무증명서 PDF 생성"""
+    from reportlab.lib.pagesizes import A4
+    from reportlab.lib.units import mm
+    from reportlab.lib.utils import ImageReader
+    from reportlab.pdfgen import canvas
+
+    font_name, bold_font = register_fonts()
+
+    buffer = BytesIO()
+    c = canvas.Canvas(buffer, pagesize=A4)
+    width, height = A4
+
+    # 색상 정의 (네이비, 그레이, 블랙, 화이트 톤)
+    NAVY = "#1E3A5F"
+    NAVY_DARK = "#152A45"
+    BLACK = "#1F2937"
+    DARK_GRAY = "#374151"
+    GRAY = "#6B7280"
+    LIGHT_GRAY = "#9CA3AF"
+    WHITE = "#FFFFFF"
+    BG_LIGHT = "#F3F4F6"
+
+    # 마진 설정
+    margin_x = 20 * mm
+    margin_y = 12 * mm
+    content_width = width - 2 * margin_x
+
+    # 문서번호 생성
+    tx_hash = log.get("tx_hash", "")
+    if tx_hash:
+        doc_number = f"WPC-{tx_hash[-8:].upper()}"
+    else:
+        doc_number = f"WPC-{hashlib.md5(str(log.get('id', 0)).encode()).hexdigest()[:8].upper()}"
+
+    # ==================== 상단 헤더 ====================
+    header_height = 38 * mm
+    c.setFillColor(_color(NAVY))
+    c.rect(0, height - header_height, width, header_height, stroke=0, fill=1)
+
+    # 헤더 하단 장식선
+    c.setFillColor(_color(NAVY_DARK))
+    c.rect(0, height - header_height, width, 2*mm, stroke=0, fill=1)
+
+    # 제목
+    y = height - 15 * mm
+    c.setFillColor(_color(WHITE))
+    c.setFont(bold_font, 22)
+    c.drawCentredString(width / 2, y, "블록체인 업무증명서")
+
+    y -= 7 * mm
+    c.setFont(font_name, 9)
+    c.setFillColor(_color("#D1D5DB"))
+    c.drawCentredString(width / 2, y, "Blockchain Work Certificate")
+
+    y -= 6 * mm
+    c.setFont(font_name, 8)
+    c.drawCentredString(width / 2, y, f"문서번호: {doc_number}")
+
+    # ==================== 본문 ====================
+    y = height - header_height - 8 * mm
+    row_height = 7 * mm
+    label_width = 28 * mm
+
+    def draw_section(y_pos, title, color):
+        c.setFillColor(_color(color))
+        c.roundRect(margin_x, y_pos - 5*mm, 3*mm, 5*mm, 1*mm, stroke=0, fill=1)
+        c.setFillColor(_color(BLACK))
+        c.setFont(bold_font, 10)
+        c.drawString(margin_x + 5*mm, y_pos - 4*mm, title)
+        return y_pos - 9 * mm
+
+    def draw_row(y_pos, label, value):
+        c.setStrokeColor(_color("#E5E7EB"))
+        c.setLineWidth(0.5)
+        # 라벨
+        c.setFillColor(_color(BG_LIGHT))
+        c.rect(margin_x, y_pos - row_height, label_width, row_height, stroke=1, fill=1)
+        # 값
+        c.setFillColor(_color(WHITE))
+        c.rect(margin_x + label_width, y_pos - row_height, content_width - label_width, row_height, stroke=1, fill=1)
+        # 텍스트
+        c.setFillColor(_color(DARK_GRAY))
+        c.setFont(bold_font, 8)
+        c.drawString(margin_x + 2*mm, y_pos - 5*mm, label)
+        c.setFillColor(_color(BLACK))
+        c.setFont(font_name, 8)
+        c.drawString(margin_x + label_width + 3*mm, y_pos - 5*mm, str(value) if value else "-")
+        return y_pos - row_height
+
+    # 인적사항
+    y = draw_section(y, "인적사항", NAVY)
+    y = draw_row(y, "성명", worker.get("name", "-"))
+    y = draw_row(y, "생년월일", worker.get("birth_date", "-") or "-")
+    y = draw_row(y, "연락처", worker.get("phone", "-"))
+
+    # 근무내용
+    y -= 5 * mm
+    y = draw_section(y, "근무내용", DARK_GRAY)
+
+    check_in_time = _format_time(log.get("check_in_time"))
+    check_out_time = _format_time(log.get("check_out_time"))
+
+    worked_minutes = log.get("worked_minutes", 0) or 0
+    hours = worked_minutes // 60
+    mins = worked_minutes % 60
+
+    y = draw_row(y, "행사명", log.get("event_title", "-"))
+    y = draw_row(y, "근무지", log.get("location", "-") or "-")
+    y = draw_row(y, "근무일", log.get("event_date", "-"))
+    y = draw_row(y, "근무시간", f"{check_in_time} ~ {check_out_time} ({hours}시간 {mins}분)")
+
+    # 급여내역
+    y -= 5 * mm
+    y = draw_section(y, "급여내역", GRAY)
+
+    # 행사 등록 금액 그대로 사용
+    gross_pay = log.get("pay_amount", 0) or 0
+    tax_amount = int(gross_pay * 0.033)
+    net_pay = gross_pay - tax_amount
+
+    y = draw_row(y, "총급여", f"{gross_pay:,}원 (세전)")
+    y = draw_row(y, "공제액", f"{tax_amount:,}원 (3.3%)")
+
+    # 실수령액 강조
+    c.setStrokeColor(_color("#E5E7EB"))
+    c.setFillColor(_color(BG_LIGHT))
+    c.rect(margin_x, y - row_height, label_width, row_height, stroke=1, fill=1)
+    c.setFillColor(_color("#E5E7EB"))
+    c.rect(margin_x + label_width, y - row_height, content_width - label_width, row_height, stroke=1, fill=1)
+    c.setFillColor(_color(DARK_GRAY))
+    c.setFont(bold_font, 8)
+    c.drawString(margin_x + 2*mm, y - 5*mm, "실수령액")
+    c.setFillColor(_color(BLACK))
+    c.setFont(bold_font, 9)
+    c.drawString(margin_x + label_width + 3*mm, y - 5*mm, f"{net_pay:,}원")
+    y -= row_height
+
+    # 블록체인 검증
+    y -= 5 * mm
+    y = draw_section(y, "블록체인 검증", NAVY_DARK)
+
+    block_num = log.get("block_number", "-")
+    y = draw_row(y, "네트워크", "Polygon Amoy Testnet")
+    y = draw_row(y, "블록번호", str(block_num))
+
+    # TX Hash
+    c.setStrokeColor(_color("#E5E7EB"))
+    c.setFillColor(_color(BG_LIGHT))
+    c.rect(margin_x, y - row_height, label_width, row_height, stroke=1, fill=1)
+    c.setFillColor(_color(WHITE))
+    c.rect(margin_x + label_width, y - row_height, content_width - label_width, row_height, stroke=1, fill=1)
+    c.setFillColor(_color(DARK_GRAY))
+    c.setFont(bold_font, 8)
+    c.drawString(margin_x + 2*mm, y - 5*mm, "TX Hash")
+    c.setFillColor(_color(NAVY))
+    c.setFont(font_name, 6)
+    if tx_hash:
+        display_hash = f"{tx_hash[:30]}...{tx_hash[-12:]}" if len(tx_hash) > 45 else tx_hash
+        c.drawString(margin_x + label_width + 3*mm, y - 5*mm, display_hash)
+    else:
+        c.setFillColor(_color(LIGHT_GRAY))
+        c.drawString(margin_x + label_width + 3*mm, y - 5*mm, "Pending")
+    y -= row_height
+
+    # ==================== 증명 문구 ====================
+    y -= 10 * mm
+    c.setFillColor(_color(BLACK))
+    c.setFont(font_name, 10)
+    c.drawCentredString(width / 2, y, "위 내용이 사실임을 블록체인 기록으로 증명합니다.")
+
+    # ==================== 발급정보 ====================
+    y -= 12 * mm
+    c.setFont(font_name, 10)
+    c.drawCentredString(width / 2, y, issued_date)
+
+    y -= 10 * mm
+    c.setFillColor(_color(NAVY))
+    c.setFont(bold_font, 13)
+    c.drawCentredString(width / 2, y, "WorkProof Chain")
+
+    y -= 5 * mm
+    c.setFont(font_name, 8)
+    c.setFillColor(_color(GRAY))
+    c.drawCentredString(width / 2, y, "블록체인 기반 업무이력 증명 시스템")
+
+    # ==================== QR 코드 ====================
+    if tx_hash:
+        qr_image = ImageReader(BytesIO(_qr_png(f"https://amoy.polygonscan.com/tx/{tx_hash}")))
+
+        qr_size = 18 * mm
+        qr_x = width - margin_x - qr_size - 3*mm
+        qr_y = margin_y + 6*mm
+        c.drawImage(qr_image, qr_x, qr_y, width=qr_size, height=qr_size)
+
+        c.setFont(font_name, 6)
+        c.setFillColor(_color(GRAY))
+        c.drawCentredString(qr_x + qr_size/2, qr_y - 2*mm, "QR 스캔 검증")
+
+    # ==================== 하단 고지 ====================
+    c.setFillColor(_color(LIGHT_GRAY))
+    c.setFont(font_name, 6)
+    c.drawString(margin_x, margin_y + 6*mm, "※ 본 증명서는 블록체인에 기록된 업무 내역을 바탕으로 자동 발급되었습니다.")
+    c.drawString(margin_x, margin_y + 2*mm, "※ QR코드 또는 TX Hash로 Polygonscan에서 원본 기록 검증이 가능합니다.")
+
+    c.save()
+    return buffer.getvalue()
+
+
+def render_payment_statement_pdf(worker: dict, attendance: dict, issued_date: str) -> bytes:
+    """프리랜서 지급명세서 PDF 생성 - 네이비/블루 테마, 한 페이지"""
+    from reportlab.lib.pagesizes import A4
+    from reportlab.lib.units import mm
+    from reportlab.pdfgen import canvas
+
+    font_name, bold_font = register_fonts()
+
+    # 색상 정의 (네이비/블루 테마)
+    NAVY = "#191F28"
+    BLUE = "#3182F6"
+    LIGHT_BLUE = "#E8F3FF"
+    GRAY = "#6B7280"
+    DARK_GRAY = "#374151"
+    TEXT = "#111827"
+    BORDER = "#E5E7EB"
+    GREEN = "#059669"
+    RED = "#DC2626"
+
+    # 급여 계산 (프리랜서 3.3% 공제)
+    gross_pay = attendance.get("pay_amount", 0) or 0
+    income_tax = int(gross_pay * 0.03)  # 소득세 3%
+    local_tax = int(gross_pay * 0.003)  # 지방소득세 0.3%
+    total_deduction = income_tax + local_tax
+    net_pay = gross_pay - total_deduction
+
+    buffer = BytesIO()
+    c = canvas.Canvas(buffer, pagesize=A4)
+    width, height = A4
+
+    # 배경
+    c.setFillColor(_color("#FFFFFF"))
+    c.rect(0, 0, width, height, fill=1)
+
+    # 테두리 (네이비)
+    c.setStrokeColor(_color(NAVY))
+    c.setLineWidth(2)
+    c.rect(15*mm, 15*mm, width-30*mm, height-30*mm)
+
+    # 헤더 (네이비)
+    c.setFillColor(_color(NAVY))
+    c.setFont(bold_font, 22)
+    c.drawCentredString(width/2, height - 40*mm, "프리랜서 지급명세서")
+
+    c.setFont(font_name, 9)
+    c.setFillColor(_color(GRAY))
+    c.drawCentredString(width/2, height - 48*mm, "Freelancer Payment Statement")
+
+    # 구분선
+    c.setStrokeColor(_color(BORDER))
+    c.setLineWidth(1)
+    c.line(25*mm, height - 55*mm, width - 25*mm, height - 55*mm)
+
+    # 내용 시작 (간격 축소)
+    y = height - 65*mm
+    line_height = 8*mm
+    section_gap = 3*mm
+
+    def draw_section(y_pos, title, with_divider=False):
+        if with_divider:
+            c.setStrokeColor(_color(BORDER))
+            c.line(25*mm, y_pos + 2*mm, width - 25*mm, y_pos + 2*mm)
+            y_pos -= section_gap
+        c.setFillColor(_color(DARK_GRAY))
+        c.setFont(bold_font, 11)
+        c.drawString(30*mm, y_pos, title)
+        return y_pos - line_height
+
+    def draw_items(y_pos, items, value_x=65*mm, value_color=None):
+        for label, value in items:
+            c.setFont(bold_font, 9)
+            c.setFillColor(_color(GRAY))
+            c.drawString(35*mm, y_pos, label)
+            c.setFont(font_name, 10)
+            c.setFillColor(_color(value_color(label, value) if value_color else TEXT))
+            c.drawString(value_x, y_pos, str(value))
+            y_pos -= 6*mm
+        return y_pos
+
+    # 생년월일 포맷
+    birth_date = worker.get("birth_date", "-") or "-"
+    if birth_date and birth_date != "-":
+        birth_date = birth_date.replace("-", "")[-6:]
+
+    # 근무자 정보 섹션
+    y = draw_section(y, "근무자 정보")
+    y = draw_items(y, [
+        ("이름", worker.get("name", "-")),
+        ("생년월일", birth_date),
+        ("연락처", worker.get("phone", "-")),
+    ])
+    y -= section_gap
+
+    # 회사 정보 섹션
+    y = draw_section(y, "회사 정보")
+    y = draw_items(y, [
+        ("회사명", COMPANY_INFO["name"]),
+        ("사업자등록번호", COMPANY_INFO["business_number"]),
+        ("대표자명", COMPANY_INFO["ceo_name"]),
+    ])
+    y -= section_gap
+
+    # 지급 정보 섹션
+    y = draw_section(y, "지급 정보", with_divider=True)
+    y = draw_items(y, [
+        ("지급일", "차주 수요일"),
+        ("용역 제공 기간", f"{attendance.get('event_date', '-')} {attendance.get('event_title', '')}"),
+    ])
+    y -= section_gap
+
+    # 지급 금액 섹션
+    y = draw_section(y, "지급 금액", with_divider=True)
+    y = draw_items(y, [
+        ("지급총액", f"{gross_pay:,}원"),
+        ("소득세(3%)", f"-{income_tax:,}원"),
+        ("지방소득세(0.3%)", f"-{local_tax:,}원"),
+        ("공제합계", f"-{total_deduction:,}원"),
+    ], value_x=95*mm, value_color=lambda label, value: RED if value.startswith("-") else TEXT)
+
+    # 실지급액 (강조 - 블루)
+    y -= 6*mm
+    c.setFillColor(_color(LIGHT_BLUE))
+    c.rect(30*mm, y - 2*mm, width - 60*mm, 12*mm, fill=1, stroke=0)
+
+    c.setFont(bold_font, 11)
+    c.setFillColor(_color(BLUE))
+    c.drawString(35*mm, y + 1*mm, "실지급액")
+    c.setFont(bold_font, 14)
+    c.drawRightString(width - 35*mm, y + 1*mm, f"{net_pay:,}원")
+    y -= 14*mm
+
+    # 근무 상태 섹션
+    check_in = attendance.get("check_in_time", "-")
+    check_out = attendance.get("check_out_time", "-")
+    if check_in and check_in != "-":
+        check_in = str(check_in).split(".")[0]  # 밀리초 제거
+    if check_out and check_out != "-":
+        check_out = str(check_out).split(".")[0]
+
+    y = draw_section(y, "업무 정보", with_divider=True)
+    draw_items(y, [
+        ("상태", "업무 종료"),
+        ("업무시작", str(check_in)),
+        ("업무종료", str(check_out)),
+    ], value_color=lambda label, value: GREEN if label == "상태" else TEXT)
+
+    # 발급일 (하단 고정)
+    c.setFillColor(_color(GRAY))
+    c.setFont(font_name, 9)
+    c.drawCentredString(width/2, 25*mm, f"발급일: {issued_date}")
+
+    c.save()
+    return buffer.getvalue()
+
+
+# 문서 유형 -> (렌더러, 레코드 필드)
+RENDERERS: Dict[str, tuple] = {
+    "certificate": (render_certificate_pdf, CERTIFICATE_FIELDS),
+    "payment_statement": (render_payment_statement_pdf, PAYMENT_STATEMENT_FIELDS),
+}
+
+
+# ============================================
+# 프로세스 풀 + 디스크 캐시
+# ============================================
+
+_executor: Optional[ProcessPoolExecutor] = None
+_inflight: Dict[str, asyncio.Future] = {}
+
+
+def _get_executor() -> Optional[ProcessPoolExecutor]:
+    """렌더링 프로세스 풀 (PDF_RENDER_WORKERS=0 이면 기본 스레드 풀 사용)"""
+    global _executor
+    settings = get_settings()
+    if settings.PDF_RENDER_WORKERS <= 0:
+        return None
+    if _executor is None:
+        _executor = ProcessPoolExecutor(
+            max_workers=settings.PDF_RENDER_WORKERS,
+            initializer=register_fonts,
+        )
+    return _executor
+
+
+def shutdown_executor():
+    """프로세스 풀 종료 (앱 종료 시)"""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
+
+
+def _project(record: dict, fields: tuple) -> dict:
+    """렌더링에 필요한 필드만 추출"""
+    return {field: record.get(field) for field in fields}
+
+
+def content_key(kind: str, worker: dict, record: dict, issued_date: str) -> str:
+    """PDF 내용을 결정하는 입력값의 해시"""
+    payload = json.dumps(
+        {"kind": kind, "worker": worker, "record": record, "issued": issued_date},
+        sort_keys=True, default=str, ensure_ascii=False,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def cache_path(key: str) -> Path:
+    """캐시 파일 경로 (data/pdf_cache/ab/abcdef....pdf)"""
+    return Path(get_settings().pdf_cache_path) / key[:2] / f"{key}.pdf"
+
+
+def _write_atomic(path: Path, data: bytes):
+    """임시 파일에 쓴 뒤 rename (동시 요청 시 깨진 파일 방지)"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+def prune_pdf_cache(max_age_days: int) -> int:
+    """
+    오래된 캐시 PDF 삭제 (batch/prune_pdf_cache.py)
+
+    캐시 키에 발급일이 포함되어 지난 날짜의 파일은 다시 사용되지 않는다.
+    중단된 렌더링이 남긴 임시 파일도 함께 정리한다.
+
+    Returns:
+        삭제한 파일 수
+    """
+    root = Path(get_settings().pdf_cache_path)
+    if not root.exists():
+        return 0
+    cutoff = datetime.now().timestamp() - max_age_days * 86400
+    removed = 0
+    for path in root.glob("*/*"):
+        try:
+            if path.is_file() and path.stat().st_mtime < cutoff:
+                path.unlink()
+                removed += 1
+        except FileNotFoundError:
+            continue
+    logger.info(f"PDF cache pruned: {removed} files older than {max_age_days} days")
+    return removed
+
+
+async def _render_to_cache(renderer: Callable, worker: dict, record: dict,
+                           issued_date: str, path: Path) -> Path:
+    loop = asyncio.get_running_loop()
+    pdf_bytes = await loop.run_in_executor(_get_executor(), renderer, worker, record, issued_date)
+    _write_atomic(path, pdf_bytes)
+    return path
+
+
+async def render_pdf(kind: str, worker: dict, record: dict) -> Path:
+    """
+    PDF 렌더링 (캐시 우선)
+
+    Args:
+        kind: 문서 유형 (certificate, payment_statement)
+        worker: 근무자 정보
+        record: 체인 로그(certificate) 또는 출석 정보(payment_statement)
+
+    Returns:
+        생성된 PDF 파일 경로
+    """
+    renderer, fields = RENDERERS[kind]
+    worker_view = _project(worker, WORKER_FIELDS)
+    record_view = _project(record, fields)
+    issued_date = now_kst().strftime("%Y년 %m월 %d일")
+
+    key = content_key(kind, worker_view, record_view, issued_date)
+    path = cache_path(key)
+    if path.exists():
+        return path
+
+    # 같은 문서를 동시에 요청하면 한 번만 렌더링
+    future = _inflight.get(key)
+    if future is None:
+        future = asyncio.ensure_future(
+            _render_to_cache(renderer, worker_view, record_view, issued_date, path)
+        )
+        _inflight[key] = future
+        future.add_done_callback(lambda _: _inflight.pop(key, None))
+
+    return await asyncio.shield(future)
+
+
+async def certificate_pdf(worker: dict, log: dict) -> Path:
+    """블록체인 업무증명서 PDF 경로"""
+    return await render_pdf("certificate", worker, log)
+
+
+async def payment_statement_pdf(worker: dict, attendance: dict) -> Path:
+    """지급명세서 PDF 경로"""
+    return await render_pdf("payment_statement", worker, attendance)
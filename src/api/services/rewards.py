@@ -0,0 +1,256 @@
+"""Check-in / Check-out Reward Pipeline (출퇴근 보상)
+
+연속 출석(worker_streaks), WPT 원장(wpt_transactions), 잔액/경험치/레벨(worker_metrics)
+갱신을 CTE 하나로 묶어 한 트랜잭션, 한 번의 왕복으로 처리한다.
+보상 금액은 gamification_config를 쿼리 안에서 읽고, 레벨 기준표는 프로세스 메모리에 캐시
+"""
+import logging
+from datetime import date
+from typing import Optional, Tuple
+
+from psycopg2 import errors
+
+from db import Database
+from . import wpt_ledger
+
+logger = logging.getLogger(__name__)
+
+# 출근 시 경험치
+CHECKIN_EXP = 5
+
+# (레벨 목록, 필요 경험치 목록) - worker_levels는 거의 바뀌지 않으므로 1회 로드
+_level_table: Optional[Tuple[list, list]] = None
+
+
+def get_level_table(db: Database) -> Tuple[list, list]:
+    """레벨 기준표 (캐시)"""
+    global _level_table
+    if _level_table is None:
+        with db.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT level, required_exp FROM worker_levels ORDER BY level")
+            rows = cursor.fetchall()
+        _level_table = ([row[0] for row in rows], [row[1] for row in rows])
+    return _level_table
+
+
+def clear_level_table():
+    """레벨 기준표 캐시 초기화 (worker_levels 변경 후 호출)"""
+    global _level_table
+    _level_table = None
+
+
+# 공통: 보상 설정, 직전 레벨 (문장 시작 시점 스냅샷)
+_BASE_CTES = """
+    cfg AS (
+        SELECT COALESCE(
+            (SELECT value FROM gamification_config WHERE key = 'wpt_rewards'), '{}'::jsonb
+        ) AS rewards
+    ),
+    prev AS (
+        SELECT COALESCE(MAX(level), 1) AS level
+        FROM worker_metrics WHERE worker_id = %(worker_id)s
+    ),
+"""
+
+# 공통: 잔액/경험치/레벨을 한 번에 갱신한 뒤 그 잔액으로 원장 기록
+# (reward CTE에 base_wpt, bonus_wpt, description 필요, 잔액 규칙은 services/wpt_ledger.py와 동일)
+_GRANT_CTES = """
+    metrics AS (
+        INSERT INTO worker_metrics AS wm (worker_id, wpt_balance, total_wpt_earned, experience_points, level)
+        SELECT %(worker_id)s, r.base_wpt + r.bonus_wpt, r.base_wpt + r.bonus_wpt, %(exp)s,
+               COALESCE((SELECT MAX(t.level) FROM unnest(%(levels)s::int[], %(required)s::int[]) AS t(level, required_exp)
+                         WHERE t.required_exp <= %(exp)s), 1)
+        FROM reward r
+        ON CONFLICT (worker_id) DO UPDATE SET
+            wpt_balance = COALESCE(wm.wpt_balance, 0) + EXCLUDED.wpt_balance,
+            total_wpt_earned = COALESCE(wm.total_wpt_earned, 0) + EXCLUDED.total_wpt_earned,
+            experience_points = COALESCE(wm.experience_points, 0) + EXCLUDED.experience_points,
+            level = COALESCE(
+                (SELECT MAX(t.level) FROM unnest(%(levels)s::int[], %(required)s::int[]) AS t(level, required_exp)
+                 WHERE t.required_exp <= COALESCE(wm.experience_points, 0) + EXCLUDED.experience_points),
+                wm.level
+            ),
+            last_updated = CURRENT_TIMESTAMP
+        RETURNING wpt_balance, level, experience_points
+    ),
+    tx AS (
+        INSERT INTO wpt_transactions
+        (worker_id, type, category, amount, balance_after, reference_type, reference_id, description)
+        SELECT %(worker_id)s, 'EARN', %(category)s, r.base_wpt + r.bonus_wpt,
+               m.wpt_balance, 'attendance', %(attendance_id)s, r.description
+        FROM reward r, metrics m
+        RETURNING id, amount, balance_after
+    )
+"""
+
+CHECKIN_REWARD_SQL = "WITH" + _BASE_CTES + """
+    streak AS (
+        INSERT INTO worker_streaks AS ws (worker_id, current_streak, longest_streak, last_checkin_date)
+        VALUES (%(worker_id)s, 1, 1, %(today)s)
+        ON CONFLICT (worker_id) DO UPDATE SET
+            current_streak = CASE WHEN ws.last_checkin_date = %(today)s::date - 1
+                                  THEN ws.current_streak + 1 ELSE 1 END,
+            longest_streak = GREATEST(
+                COALESCE(ws.longest_streak, 0),
+                CASE WHEN ws.last_checkin_date = %(today)s::date - 1 THEN ws.current_streak + 1 ELSE 1 END
+            ),
+            last_checkin_date = EXCLUDED.last_checkin_date,
+            updated_at = CURRENT_TIMESTAMP
+        WHERE ws.last_checkin_date IS DISTINCT FROM EXCLUDED.last_checkin_date
+        RETURNING current_streak, longest_streak
+    ),
+    amounts AS (
+        SELECT s.current_streak, s.longest_streak,
+               COALESCE((cfg.rewards->>'checkin')::int, 10) AS base_wpt,
+               COALESCE((cfg.rewards->>'streak_bonus')::int, 5) * (s.current_streak / 3) AS bonus_wpt
+        FROM streak s, cfg
+    ),
+    reward AS (
+        SELECT a.*, '출근 보상 (+' || a.base_wpt || ' WPT) + 연속 출석 보너스 (+' || a.bonus_wpt || ' WPT)' AS description
+        FROM amounts a
+    ),
+""" + _GRANT_CTES + """
+    SELECT r.current_streak, r.longest_streak, r.bonus_wpt,
+           tx.id AS transaction_id, tx.amount, tx.balance_after,
+           prev.level AS previous_level, m.level, m.experience_points
+    FROM reward r, tx, metrics m, prev
+"""
+
+CHECKOUT_REWARD_SQL = "WITH" + _BASE_CTES + """
+    reward AS (
+        SELECT COALESCE((cfg.rewards->>'checkout')::int, 10) AS base_wpt,
+               %(time_bonus)s AS bonus_wpt,
+               '퇴근 보상 (+' || COALESCE((cfg.rewards->>'checkout')::int, 10) || ' WPT) + '
+                   || %(bonus_description)s AS description
+        FROM cfg
+    ),
+""" + _GRANT_CTES + """
+    SELECT tx.id AS transaction_id, tx.amount, tx.balance_after,
+           prev.level AS previous_level, m.level, m.experience_points
+    FROM tx, metrics m, prev
+"""
+
+
+def _run(db: Database, query: str, params: dict):
+    levels, required = get_level_table(db)
+    try:
+        with db.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(query, {**params, "levels": levels, "required": required})
+            row = cursor.fetchone()
+            if not row:
+                return None
+            return dict(zip([col[0] for col in cursor.description], row))
+    except errors.UniqueViolation:
+        # 같은 출석으로 이미 지급된 보상 (동시 요청/재시도) - 잔액/경험치 변경은 함께 롤백됨
+        existing = _existing_reward(db, params["worker_id"], params["category"], params["attendance_id"])
+        if existing is None:
+            raise
+        return existing
+
+
+def _existing_reward(db: Database, worker_id: int, category: str, attendance_id: int) -> Optional[dict]:
+    """이미 기록된 보상 거래와 현재 레벨/연속 출석 (_run 결과와 같은 키, duplicate=True)"""
+    existing = wpt_ledger.find_existing(db, category, "attendance", attendance_id)
+    if existing is None:
+        return None
+    with db.get_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute("""
+            SELECT COALESCE(m.level, 1), COALESCE(m.experience_points, 0),
+                   COALESCE(s.current_streak, 0), COALESCE(s.longest_streak, 0)
+            FROM (SELECT %s AS worker_id) w
+            LEFT JOIN worker_metrics m ON m.worker_id = w.worker_id
+            LEFT JOIN worker_streaks s ON s.worker_id = w.worker_id
+        """, (worker_id,))
+        level, experience_points, current_streak, longest_streak = cursor.fetchone()
+    return {
+        "transaction_id": existing["id"],
+        "amount": existing["amount"],
+        "balance_after": existing["balance_after"],
+        "previous_level": level,
+        "level": level,
+        "experience_points": experience_points,
+        "current_streak": current_streak,
+        "longest_streak": longest_streak,
+        "bonus_wpt": 0,
+        "duplicate": True,
+    }
+
+
+def _exp_result(worker_id: int, row: dict, exp: int, reason: str) -> dict:
+    leveled_up = row["level"] > row["previous_level"]
+    if leveled_up:
+        logger.info(f"Worker {worker_id} leveled up: {row['previous_level']} -> {row['level']}")
+    return {
+        "exp_gained": exp,
+        "total_exp": row["experience_points"],
+        "level": row["level"],
+        "leveled_up": leveled_up,
+        "reason": reason
+    }
+
+
+def _wpt_result(row: dict, category: str) -> dict:
+    return {
+        "transaction_id": row["transaction_id"],
+        "amount": row["amount"],
+        "balance": row["balance_after"],
+        "category": category,
+        "duplicate": row.get("duplicate", False)
+    }
+
+
+def process_checkin_reward(db: Database, worker_id: int, attendance_id: int) -> Optional[dict]:
+    """
+    출근 보상 처리 (Streak 포함)
+
+    Returns:
+        보상 결과, 오늘 이미 출근 보상을 받았으면 None
+    """
+    row = _run(db, CHECKIN_REWARD_SQL, {
+        "worker_id": worker_id,
+        "attendance_id": attendance_id,
+        "category": "checkin",
+        "today": date.today(),
+        "exp": CHECKIN_EXP,
+    })
+    if not row:
+        return None
+
+    logger.info(f"WPT awarded: {row['amount']} to worker {worker_id}, category: checkin")
+    return {
+        "wpt_reward": _wpt_result(row, "checkin"),
+        "streak": {
+            "current": row["current_streak"],
+            "longest": row["longest_streak"],
+            "bonus_wpt": row["bonus_wpt"]
+        },
+        "exp": _exp_result(worker_id, row, 0 if row.get("duplicate") else CHECKIN_EXP, "출근 완료")
+    }
+
+
+def process_checkout_reward(db: Database, worker_id: int, attendance_id: int,
+                            work_hours: float) -> dict:
+    """퇴근 보상 처리 (근무 시간 보너스: 시간당 5 WPT, 경험치 시간당 2)"""
+    time_bonus = int(work_hours * 5)
+    exp_bonus = int(work_hours * 2)
+
+    row = _run(db, CHECKOUT_REWARD_SQL, {
+        "worker_id": worker_id,
+        "attendance_id": attendance_id,
+        "category": "checkout",
+        "time_bonus": time_bonus,
+        "bonus_description": f"근무시간 보너스 (+{time_bonus} WPT, {work_hours:.1f}h)",
+        "exp": exp_bonus,
+    })
+
+    logger.info(f"WPT awarded: {row['amount']} to worker {worker_id}, category: checkout")
+    return {
+        "wpt_reward": _wpt_result(row, "checkout"),
+        "work_hours": round(work_hours, 1),
+        "time_bonus": time_bonus,
+        "exp": _exp_result(worker_id, row, 0 if row.get("duplicate") else exp_bonus,
+                           f"근무 완료 ({work_hours:.1f}시간)")
+    }
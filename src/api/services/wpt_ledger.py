@@ -0,0 +1,181 @@
+"""WPT Ledger (WPT 원장)
+
+wpt_transactions는 추가만 하는 원장이고, worker_metrics.wpt_balance는 원장을 기록하는
+같은 문장에서 원자적으로 갱신되는 잔액 프로젝션이다.
+(category, reference_type, reference_id)가 같은 거래는 한 번만 기록된다 (멱등성)
+"""
+import logging
+from typing import Optional
+
+from psycopg2 import errors
+
+from db import Database
+
+logger = logging.getLogger(__name__)
+
+
+class InsufficientBalance(Exception):
+    """WPT 잔액 부족"""
+
+
+# 지급: 잔액 행이 없으면 생성, 있으면 원자적으로 증가
+CREDIT_SQL = """
+    WITH metrics AS (
+        INSERT INTO worker_metrics AS wm (worker_id, wpt_balance, total_wpt_earned)
+        VALUES (%(worker_id)s, %(amount)s, %(amount)s)
+        ON CONFLICT (worker_id) DO UPDATE SET
+            wpt_balance = COALESCE(wm.wpt_balance, 0) + EXCLUDED.wpt_balance,
+            total_wpt_earned = COALESCE(wm.total_wpt_earned, 0) + EXCLUDED.total_wpt_earned,
+            last_updated = CURRENT_TIMESTAMP
+        RETURNING wpt_balance
+    )
+    INSERT INTO wpt_transactions
+    (worker_id, type, category, amount, balance_after, reference_type, reference_id, description)
+    SELECT %(worker_id)s, %(type)s, %(category)s, %(amount)s, m.wpt_balance,
+           %(reference_type)s, %(reference_id)s, %(description)s
+    FROM metrics m
+    RETURNING id, amount, balance_after
+"""
+
+# 차감: 잔액이 충분할 때만 감소 (행 잠금으로 동시 차감 직렬화)
+DEBIT_SQL = """
+    WITH metrics AS (
+        UPDATE worker_metrics
+        SET wpt_balance = wpt_balance - %(amount)s,
+            total_wpt_spent = COALESCE(total_wpt_spent, 0) + %(amount)s,
+            last_updated = CURRENT_TIMESTAMP
+        WHERE worker_id = %(worker_id)s AND wpt_balance >= %(amount)s
+        RETURNING wpt_balance
+    )
+    INSERT INTO wpt_transactions
+    (worker_id, type, category, amount, balance_after, reference_type, reference_id, description)
+    SELECT %(worker_id)s, %(type)s, %(category)s, -%(amount)s, m.wpt_balance,
+           %(reference_type)s, %(reference_id)s, %(description)s
+    FROM metrics m
+    RETURNING id, amount, balance_after
+"""
+
+
+def find_existing(db: Database, category: str, reference_type: str, reference_id: int) -> Optional[dict]:
+    """같은 참조로 이미 기록된 원장 거래"""
+    with db.get_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute("""
+            SELECT id, amount, balance_after FROM wpt_transactions
+            WHERE category = %s AND reference_type = %s AND reference_id = %s
+        """, (category, reference_type, reference_id))
+        row = cursor.fetchone()
+        return {"id": row[0], "amount": row[1], "balance_after": row[2]} if row else None
+
+
+def _post(db: Database, query: str, params: dict) -> dict:
+    try:
+        with db.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(query, params)
+            row = cursor.fetchone()
+    except errors.UniqueViolation:
+        # 같은 참조로 이미 기록된 거래 (재시도/중복 요청) - 잔액 변경은 함께 롤백됨
+        existing = find_existing(db, params["category"], params["reference_type"], params["reference_id"])
+        if existing is None:
+            raise
+        return {
+            "transaction_id": existing["id"],
+            "amount": existing["amount"],
+            "balance": existing["balance_after"],
+            "category": params["category"],
+            "duplicate": True
+        }
+
+    if not row:
+        raise InsufficientBalance()
+
+    return {
+        "transaction_id": row[0],
+        "amount": row[1],
+        "balance": row[2],
+        "category": params["category"],
+        "duplicate": False
+    }
+
+
+def credit(db: Database, worker_id: int, amount: int, category: str, description: str,
+           reference_type: str = None, reference_id: int = None, tx_type: str = "EARN") -> dict:
+    """
+    WPT 지급 (원장 기록 + 잔액 증가, 단일 문장)
+
+    Returns:
+        {"transaction_id", "amount", "balance", "category", "duplicate"}
+    """
+    return _post(db, CREDIT_SQL, {
+        "worker_id": worker_id,
+        "amount": amount,
+        "type": tx_type,
+        "category": category,
+        "reference_type": reference_type,
+        "reference_id": reference_id,
+        "description": description,
+    })
+
+
+def debit(db: Database, worker_id: int, amount: int, category: str, description: str,
+          reference_type: str = None, reference_id: int = None, tx_type: str = "SPEND") -> dict:
+    """
+    WPT 차감 (잔액 부족 시 InsufficientBalance)
+
+    Returns:
+        {"transaction_id", "amount"(음수), "balance", "category", "duplicate"}
+    """
+    return _post(db, DEBIT_SQL, {
+        "worker_id": worker_id,
+        "amount": amount,
+        "type": tx_type,
+        "category": category,
+        "reference_type": reference_type,
+        "reference_id": reference_id,
+        "description": description,
+    })
+
+
+def get_balance(db: Database, worker_id: int) -> int:
+    """현재 잔액 (프로젝션 조회)"""
+    with db.get_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute("SELECT COALESCE(wpt_balance, 0) FROM worker_metrics WHERE worker_id = %s", (worker_id,))
+        row = cursor.fetchone()
+        return row[0] if row else 0
+
+
+def rebuild_balances(db: Database, worker_id: int = None) -> int:
+    """
+    원장 합계로 잔액 프로젝션 재계산 (정합성 점검/복구용)
+
+    Returns:
+        갱신된 근무자 수
+    """
+    with db.get_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute("""
+            UPDATE worker_metrics wm
+            SET wpt_balance = COALESCE(l.balance, 0),
+                total_wpt_earned = COALESCE(l.earned, 0),
+                total_wpt_spent = COALESCE(l.spent, 0),
+                last_updated = CURRENT_TIMESTAMP
+            FROM (
+                SELECT wm2.worker_id,
+                       SUM(t.amount) AS balance,
+                       SUM(CASE WHEN t.amount > 0 THEN t.amount ELSE 0 END) AS earned,
+                       SUM(CASE WHEN t.amount < 0 THEN -t.amount ELSE 0 END) AS spent
+                FROM worker_metrics wm2
+                LEFT JOIN wpt_transactions t ON t.worker_id = wm2.worker_id
+                WHERE %(worker_id)s::int IS NULL OR wm2.worker_id = %(worker_id)s
+                GROUP BY wm2.worker_id
+            ) l
+            WHERE wm.worker_id = l.worker_id
+              AND (wm.wpt_balance IS DISTINCT FROM COALESCE(l.balance, 0)
+                   OR wm.total_wpt_earned IS DISTINCT FROM COALESCE(l.earned, 0)
+                   OR wm.total_wpt_spent IS DISTINCT FROM COALESCE(l.spent, 0))
+        """, {"worker_id": worker_id})
+        if cursor.rowcount:
+            logger.warning(f"WPT balance projection corrected for {cursor.rowcount} worker(s)")
+        return cursor.rowcount
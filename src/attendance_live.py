@@ -0,0 +1,166 @@
+"""
+출석 현황 실시간 보드 (관리자 봇)
+
+attendance_changes 채널의 변경분만 메모리 상태에 반영하고, 보드를 열어 둔 메시지를
+주기적으로 편집한다. 행사 전체 조회는 보드를 처음 열 때와 이벤트 유실 시에만 실행
+"""
+import asyncio
+import logging
+from collections import deque
+from typing import Dict, Tuple
+
+from telegram import Bot, InlineKeyboardButton, InlineKeyboardMarkup
+from telegram.error import BadRequest, RetryAfter
+
+from db import Database
+from live_feed import ChannelHub
+from utils import now_kst
+
+logger = logging.getLogger(__name__)
+
+STATUS_LABELS = {
+    'PENDING': '대기',
+    'CHECKED_IN': '출근',
+    'COMPLETED': '퇴근',
+}
+
+
+class AttendanceLiveBoard:
+    """행사별 실시간 출석 보드"""
+
+    EDIT_INTERVAL = 3.0     # 메시지 편집 최소 간격 (초, 텔레그램 편집 제한)
+    WATCH_MINUTES = 180     # 보드 자동 종료 시간
+    RECENT_SIZE = 10        # 최근 변경 표시 수
+
+    def __init__(self, db: Database, hub: ChannelHub):
+        self.db = db
+        self.hub = hub
+        self._boards: Dict[int, dict] = {}
+
+    async def watch(self, bot: Bot, event_id: int, title: str, chat_id: int, message_id: int):
+        """메시지를 실시간 보드로 등록 (행사별 구독은 1개만 유지)"""
+        loop = asyncio.get_running_loop()
+        board = self._boards.get(event_id)
+        if board is None:
+            board = {
+                "title": title,
+                "rows": {},
+                "recent": deque(maxlen=self.RECENT_SIZE),
+                "watchers": {},
+                "queue": self.hub.subscribe(event_id),
+            }
+            self._boards[event_id] = board
+            await self._load(event_id)
+            board["task"] = loop.create_task(self._run(bot, event_id))
+
+        board["watchers"][(chat_id, message_id)] = loop.time() + self.WATCH_MINUTES * 60
+        await self._edit(bot, event_id, [(chat_id, message_id)])
+
+    def unwatch(self, event_id: int, chat_id: int, message_id: int):
+        board = self._boards.get(event_id)
+        if board:
+            board["watchers"].pop((chat_id, message_id), None)
+
+    async def _load(self, event_id: int):
+        rows = await asyncio.to_thread(self.db.list_attendance_by_event, event_id)
+        self._boards[event_id]["rows"] = {
+            row['id']: {"worker_name": row['worker_name'], "status": row['status']} for row in rows
+        }
+
+    def _apply(self, event_id: int, change: dict) -> bool:
+        """변경분 반영, 표시 내용이 바뀌었으면 True"""
+        board = self._boards[event_id]
+        rows = board["rows"]
+        att_id = change.get("id")
+        previous = rows.get(att_id)
+
+        if change.get("op") == "DELETE":
+            if rows.pop(att_id, None) is None:
+                return False
+            status_text = "삭제"
+        else:
+            rows[att_id] = {"worker_name": change.get("worker_name"), "status": change.get("status")}
+            if previous and previous["status"] == change.get("status"):
+                return False
+            status_text = STATUS_LABELS.get(change.get("status"), change.get("status"))
+
+        board["recent"].appendleft(f"{now_kst():%H:%M} {change.get('worker_name')} {status_text}")
+        return True
+
+    def render(self, event_id: int) -> Tuple[str, InlineKeyboardMarkup]:
+        board = self._boards[event_id]
+        statuses = [row["status"] for row in board["rows"].values()]
+
+        text = f"🔴 {board['title']} - 실시간 출석 현황\n\n"
+        text += f"⏳ 대기: {statuses.count('PENDING')}명\n"
+        text += f"✅ 출근완료: {statuses.count('CHECKED_IN')}명\n"
+        text += f"🎉 퇴근완료: {statuses.count('COMPLETED')}명\n"
+        text += "━━━━━━━━━━━━━━━━\n"
+        if board["recent"]:
+            text += "최근 변경:\n" + "\n".join(board["recent"]) + "\n"
+        else:
+            text += "변경 사항을 기다리는 중...\n"
+        text += f"\n갱신: {now_kst():%H:%M:%S}"
+
+        keyboard = [
+            [InlineKeyboardButton("⏹ 실시간 종료", callback_data=f"attendance_live_stop_{event_id}")],
+            [InlineKeyboardButton("🔙 출석 현황", callback_data=f"attendance_list_{event_id}")],
+        ]
+        return text, InlineKeyboardMarkup(keyboard)
+
+    async def _run(self, bot: Bot, event_id: int):
+        board = self._boards[event_id]
+        queue: asyncio.Queue = board["queue"]
+        loop = asyncio.get_running_loop()
+        try:
+            while True:
+                now = loop.time()
+                for key, expires in list(board["watchers"].items()):
+                    if expires < now:
+                        board["watchers"].pop(key, None)
+                if not board["watchers"]:
+                    break
+
+                # 첫 변경을 기다린 뒤 편집 간격 동안 들어온 변경을 모아서 반영
+                try:
+                    changes = [await asyncio.wait_for(queue.get(), timeout=60)]
+                except asyncio.TimeoutError:
+                    continue
+                await asyncio.sleep(self.EDIT_INTERVAL)
+                while not queue.empty():
+                    changes.append(queue.get_nowait())
+
+                dirty = False
+                for change in changes:
+                    if change.get("event") == "resync":
+                        await self._load(event_id)
+                        dirty = True
+                    else:
+                        dirty = self._apply(event_id, change) or dirty
+                if dirty:
+                    await self._edit(bot, event_id, list(board["watchers"]))
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Attendance live board for event {event_id} stopped: {e}", exc_info=True)
+        finally:
+            self.hub.unsubscribe(event_id, queue)
+            self._boards.pop(event_id, None)
+
+    async def _edit(self, bot: Bot, event_id: int, watchers: list):
+        text, reply_markup = self.render(event_id)
+        for chat_id, message_id in watchers:
+            try:
+                await bot.edit_message_text(chat_id=chat_id, message_id=message_id,
+                                            text=text, reply_markup=reply_markup)
+            except RetryAfter as e:
+                retry_after = e.retry_after
+                await asyncio.sleep(retry_after.total_seconds() if hasattr(retry_after, "total_seconds")
+                                    else float(retry_after))
+            except BadRequest as e:
+                if "not modified" not in str(e).lower():
+                    # 메시지 삭제 등: 더 이상 편집할 수 없는 보드
+                    logger.warning(f"Attendance live board message {message_id} dropped: {e}")
+                    self.unwatch(event_id, chat_id, message_id)
+            except Exception as e:
+                logger.error(f"Failed to update attendance live board: {e}")
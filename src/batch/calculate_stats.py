@@ -30,7 +30,7 @@ def calculate_all_worker_stats(db: Database, year: int, month: int):
     print(f"근무자 월별 통계 계산: {year}년 {month}월")
     print(f"{'='*50}")
 
-    workers = db.list_workers(limit=10000)
+    workers = list(db.iter_worker_refs())
     print(f"총 근무자 수: {len(workers)}명")
 
     success = 0
@@ -56,7 +56,7 @@ def update_all_cumulative_stats(db: Database):
     print("근무자 누적 통계 업데이트")
     print(f"{'='*50}")
 
-    workers = db.list_workers(limit=10000)
+    workers = list(db.iter_worker_refs())
     print(f"총 근무자 수: {len(workers)}명")
 
     success = 0
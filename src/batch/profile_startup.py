@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+시작 시간 프로파일 (import 단계별 소요 시간)
+
+대상 모듈을 새 인터프리터에서 `python -X importtime`으로 import하고,
+누적 시간이 큰 모듈과 자체 시간이 큰 모듈을 정리해 출력한다.
+웹3/엑셀/PDF 같은 무거운 의존성이 다시 시작 경로에 들어오면 여기서 드러난다.
+
+사용법:
+    python profile_startup.py [api|admin_bot|worker_bot|모듈명] [--top N] [--budget-ms MS]
+
+예시:
+    python profile_startup.py api                  # API 앱 import 시간
+    python profile_startup.py admin_bot --top 30   # 관리자 봇 상위 30개
+    python profile_startup.py api --budget-ms 1500 # 1.5초 초과 시 종료 코드 1 (CI용)
+"""
+
+import sys
+import os
+import argparse
+import subprocess
+import time
+
+SRC_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+TARGETS = {
+    'api': 'api.main',
+    'admin_bot': 'admin_bot',
+    'worker_bot': 'worker_bot',
+}
+
+
+def profile(module: str):
+    """(전체 소요 ms, [(자체 us, 누적 us, 모듈명)], 종료 코드, stderr)"""
+    env = {**os.environ, 'PYTHONPATH': SRC_DIR + os.pathsep + os.environ.get('PYTHONPATH', '')}
+    started = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=os.path.dirname(SRC_DIR), env=env, capture_output=True, text=True
+    )
+    elapsed_ms = (time.perf_counter() - started) * 1000
+
+    rows, other = [], []
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:'):
+            other.append(line)
+            continue
+        parts = line[len('import time:'):].split('|')
+        if len(parts) != 3 or not parts[0].strip().isdigit():
+            continue  # 헤더 행
+        rows.append((int(parts[0]), int(parts[1]), parts[2].rstrip()))
+    return elapsed_ms, rows, result.returncode, '\n'.join(other)
+
+
+def print_table(title: str, rows, key: int, top: int):
+    print(f"\n{title}")
+    print(f"  {'자체(ms)':>9} {'누적(ms)':>9}  모듈")
+    for row in sorted(rows, key=lambda r: r[key], reverse=True)[:top]:
+        print(f"  {row[0] / 1000:9.1f} {row[1] / 1000:9.1f}  {row[2]}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='시작 시간(import) 프로파일')
+    parser.add_argument('target', nargs='?', default='api',
+                        help=f"대상 ({', '.join(TARGETS)} 또는 모듈명, 기본: api)")
+    parser.add_argument('--top', type=int, default=20, help='출력할 모듈 수 (기본: 20)')
+    parser.add_argument('--budget-ms', type=float, default=None,
+                        help='import 시간 상한 (ms), 초과 시 종료 코드 1')
+    args = parser.parse_args()
+
+    module = TARGETS.get(args.target, args.target)
+    elapsed_ms, rows, returncode, stderr = profile(module)
+
+    if returncode != 0:
+        print(f"\n{module} import 실패 (종료 코드 {returncode})")
+        print(stderr[-2000:])
+        sys.exit(returncode)
+
+    import_ms = sum(row[0] for row in rows) / 1000
+    print(f"\n{module}: import {import_ms:.0f}ms / 프로세스 전체 {elapsed_ms:.0f}ms, 모듈 {len(rows)}개")
+    print_table("누적 시간 상위 (하위 import 포함)", rows, key=1, top=args.top)
+    print_table("자체 시간 상위", rows, key=0, top=args.top)
+    print()
+
+    if args.budget_ms is not None and import_ms > args.budget_ms:
+        print(f"❌ import 시간 {import_ms:.0f}ms가 상한 {args.budget_ms:.0f}ms를 초과했습니다\n")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""
+PDF 캐시 정리 배치 스크립트 (야간 실행)
+
+증명서/지급명세서 캐시(PDF_CACHE_DIR)에서 보존 기간이 지난 파일을 삭제한다.
+캐시 키에 발급일이 포함되므로 지난 날짜의 파일은 다시 사용되지 않는다.
+
+사용법:
+    python prune_pdf_cache.py [--days N]
+
+예시:
+    python prune_pdf_cache.py           # 기본 보존 기간 (PDF_CACHE_RETENTION_DAYS, 7일)
+    python prune_pdf_cache.py --days 1  # 1일보다 오래된 캐시 삭제
+"""
+
+import sys
+import os
+import argparse
+
+# 경로 설정
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from api.config import get_settings
+from api.services.pdf_service import prune_pdf_cache
+
+
+def main():
+    settings = get_settings()
+    parser = argparse.ArgumentParser(description='PDF 캐시 정리 배치')
+    parser.add_argument('--days', type=int, default=settings.PDF_CACHE_RETENTION_DAYS,
+                        help=f'보존 기간 (일, 기본: PDF_CACHE_RETENTION_DAYS 또는 {settings.PDF_CACHE_RETENTION_DAYS})')
+    args = parser.parse_args()
+
+    print(f"\nPDF 캐시 정리 시작 ({settings.pdf_cache_path}, {args.days}일 보존)")
+    removed = prune_pdf_cache(args.days)
+    print(f"\n완료: 캐시 파일 {removed:,}개 삭제\n")
+
+
+if __name__ == "__main__":
+    main()
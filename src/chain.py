@@ -1,11 +1,13 @@
 """
 Polygon 블록체인 연동 모듈
+
+web3 import와 RPC 클라이언트/컨트랙트 생성은 첫 사용 시점으로 미룬다
+(봇/API 시작 시간과 RPC 도달 가능 여부가 무관하도록)
 """
 import os
 import logging
+from functools import cached_property
 from typing import Dict, Optional
-from web3 import Web3
-from web3.middleware import geth_poa_middleware
 import json
 
 logger = logging.getLogger(__name__)
@@ -26,17 +28,31 @@ class PolygonChain:
             self.enabled = False
             return
 
-        self.w3 = Web3(Web3.HTTPProvider(self.rpc_url))
-        self.w3.middleware_onion.inject(geth_poa_middleware, layer=0)
-
-        self.account = self.w3.eth.account.from_key(self.private_key)
-        self.contract = self._load_contract()
         self.enabled = True
 
-        logger.info(f"Polygon chain initialized: network={self.network}, account={self.account.address}")
+    @cached_property
+    def w3(self):
+        """RPC 클라이언트 (첫 사용 시 생성)"""
+        from web3 import Web3
+        from web3.middleware import geth_poa_middleware
+
+        w3 = Web3(Web3.HTTPProvider(self.rpc_url))
+        w3.middleware_onion.inject(geth_poa_middleware, layer=0)
+        logger.info(f"Polygon chain initialized: network={self.network}")
+        return w3
+
+    @cached_property
+    def account(self):
+        return self.w3.eth.account.from_key(self.private_key)
+
+    @cached_property
+    def contract(self):
+        return self._load_contract()
 
     def _load_contract(self):
         """스마트 컨트랙트 로드"""
+        from web3 import Web3
+
         # ABI 파일 경로
         abi_path = os.path.join(os.path.dirname(__file__), '../contracts/compiled/WorkLogRegistry.json')
 
@@ -3,16 +3,20 @@
 """
 import psycopg2
 from psycopg2 import sql
-from psycopg2.extras import RealDictCursor
+from psycopg2.extras import RealDictCursor, execute_values
+import io
 import os
 import random
 import string
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterator
 from datetime import datetime, timezone, timedelta
 import logging
 from contextlib import contextmanager
 from urllib.parse import urlparse
 
+from utils import normalize_phone, generate_check_in_code
+from models import ApplicationListItem, WorkerListItem, WorkerRef
+
 logger = logging.getLogger(__name__)
 
 # 한국 시간대 (UTC+9)
@@ -26,13 +30,40 @@ def now_kst_naive():
     """현재 한국 시간 반환 (timezone 정보 없이)"""
     return datetime.now(KST).replace(tzinfo=None)
 
+# 알림 생성/읽음 이벤트를 전달하는 LISTEN/NOTIFY 채널
+NOTIFICATION_CHANNEL = 'worker_notifications'
+# 출석 INSERT/UPDATE/DELETE 이벤트 채널 (migrations/003 트리거)
+ATTENDANCE_CHANNEL = 'attendance_changes'
+
+# 목록 조회 시 한 번에 가져올 행 수 (fetchmany / 서버 커서 itersize)
+ROW_FETCH_SIZE = 500
+
+
+def _fetch_rows(cursor, row_type) -> list:
+    """튜플 커서 결과를 목록 행 객체로 변환 (서버 커서에서 fetchmany 단위로 가져옴)"""
+    rows = []
+    while True:
+        chunk = cursor.fetchmany(ROW_FETCH_SIZE)
+        if not chunk:
+            return rows
+        rows.extend(row_type(*row) for row in chunk)
+
+
+def haversine_sql(lat1: str, lng1: str, lat2: str, lng2: str) -> str:
+    """두 좌표 컬럼/식 사이 거리(미터) SQL 식 (Haversine, 행 단위로 한 번에 계산)"""
+    return f"""(2 * 6371000 * asin(sqrt(LEAST(1,
+        power(sin(radians(({lat2})::float8 - ({lat1})::float8) / 2), 2)
+        + cos(radians(({lat1})::float8)) * cos(radians(({lat2})::float8))
+        * power(sin(radians(({lng2})::float8 - ({lng1})::float8) / 2), 2)
+    ))))"""
+
 
 class Database:
     """PostgreSQL 데이터베이스 관리 클래스"""
 
     def __init__(self, database_url: str):
+        """연결 정보만 보관 (스키마는 배포 시 src/batch/migrate.py로 적용)"""
         self.database_url = database_url
-        self._init_tables()
 
     def _parse_database_url(self) -> dict:
         """DATABASE_URL 파싱"""
@@ -59,494 +90,12 @@ class Database:
         finally:
             conn.close()
 
-    def _init_tables(self):
-        """테이블 초기화"""
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
-
-            # Workers 테이블
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS workers (
-                    id SERIAL PRIMARY KEY,
-                    telegram_id BIGINT UNIQUE NOT NULL,
-                    name TEXT NOT NULL,
-                    birth_date TEXT,
-                    phone TEXT NOT NULL,
-                    driver_license BOOLEAN DEFAULT FALSE,
-                    security_cert BOOLEAN DEFAULT FALSE,
-                    ssn TEXT,
-                    bank_name TEXT,
-                    bank_account TEXT,
-                    contract_signed BOOLEAN DEFAULT FALSE,
-                    contract_sent_at TIMESTAMP,
-                    tokens INTEGER DEFAULT 3,
-                    wallet_address TEXT,
-                    gender TEXT,
-                    residence TEXT,
-                    face_photo_file_id TEXT,
-                    email TEXT UNIQUE,
-                    password_hash TEXT,
-                    is_admin BOOLEAN DEFAULT FALSE,
-                    region_id INTEGER,
-                    home_dong TEXT,
-                    career_months INTEGER DEFAULT 0,
-                    work_score REAL DEFAULT 0,
-                    work_score_updated_at TIMESTAMP,
-                    preferred_regions TEXT,
-                    preferred_job_types TEXT,
-                    preferred_work_days TEXT,
-                    min_pay_per_hour INTEGER,
-                    previous_experience TEXT,
-                    total_worked_events INTEGER DEFAULT 0,
-                    total_worked_hours INTEGER DEFAULT 0,
-                    first_work_date TEXT,
-                    last_work_date TEXT,
-                    reliability_score REAL DEFAULT 50,
-                    no_show_count INTEGER DEFAULT 0,
-                    same_day_cancel_count INTEGER DEFAULT 0,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-
-            # Events 테이블
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS events (
-                    id SERIAL PRIMARY KEY,
-                    short_code TEXT UNIQUE NOT NULL,
-                    title TEXT NOT NULL,
-                    event_date TEXT NOT NULL,
-                    event_time TEXT,
-                    start_time TEXT,
-                    end_time TEXT,
-                    location TEXT NOT NULL,
-                    pay_amount INTEGER NOT NULL,
-                    pay_description TEXT,
-                    headcount INTEGER,
-                    meal_provided BOOLEAN DEFAULT FALSE,
-                    dress_code TEXT,
-                    age_requirement TEXT,
-                    work_type TEXT,
-                    application_method TEXT,
-                    manager_name TEXT,
-                    manager_phone TEXT,
-                    status TEXT DEFAULT 'OPEN',
-                    created_by INTEGER,
-                    requires_driver_license BOOLEAN DEFAULT FALSE,
-                    requires_security_cert BOOLEAN DEFAULT FALSE,
-                    region_id INTEGER,
-                    category_id INTEGER,
-                    difficulty_level INTEGER DEFAULT 3,
-                    indoor_outdoor TEXT,
-                    weather_condition TEXT,
-                    temperature REAL,
-                    actual_headcount INTEGER,
-                    event_completion_rate REAL,
-                    avg_worker_rating REAL,
-                    client_satisfaction REAL,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-
-            # Applications 테이블
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS applications (
-                    id SERIAL PRIMARY KEY,
-                    event_id INTEGER NOT NULL REFERENCES events(id),
-                    worker_id INTEGER NOT NULL REFERENCES workers(id),
-                    status TEXT DEFAULT 'PENDING',
-                    applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    confirmed_at TIMESTAMP,
-                    confirmed_by INTEGER,
-                    rejection_reason TEXT,
-                    notified BOOLEAN DEFAULT FALSE,
-                    cancelled_at TIMESTAMP,
-                    cancel_reason TEXT,
-                    UNIQUE(event_id, worker_id)
-                )
-            """)
-
-            # Attendance 테이블
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS attendance (
-                    id SERIAL PRIMARY KEY,
-                    application_id INTEGER UNIQUE NOT NULL REFERENCES applications(id),
-                    event_id INTEGER NOT NULL REFERENCES events(id),
-                    worker_id INTEGER NOT NULL REFERENCES workers(id),
-                    check_in_code TEXT,
-                    check_in_time TIMESTAMP,
-                    check_out_time TIMESTAMP,
-                    worked_minutes INTEGER,
-                    status TEXT DEFAULT 'PENDING',
-                    completed_by INTEGER,
-                    late_minutes INTEGER DEFAULT 0,
-                    scheduled_start TEXT,
-                    scheduled_end TEXT,
-                    cancel_type TEXT,
-                    cancel_time TIMESTAMP,
-                    time_compliance INTEGER DEFAULT 100,
-                    check_in_lat REAL,
-                    check_in_lng REAL,
-                    check_out_lat REAL,
-                    check_out_lng REAL,
-                    distance_from_venue REAL,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-
-            # Chain logs 테이블
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS chain_logs (
-                    id SERIAL PRIMARY KEY,
-                    attendance_id INTEGER UNIQUE NOT NULL REFERENCES attendance(id),
-                    event_id INTEGER NOT NULL REFERENCES events(id),
-                    worker_uid_hash TEXT NOT NULL,
-                    log_hash TEXT NOT NULL,
-                    tx_hash TEXT,
-                    block_number INTEGER,
-                    network TEXT DEFAULT 'amoy',
-                    recorded_at TIMESTAMP,
-                    metadata_hash TEXT,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-
-            # Payroll exports 테이블
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS payroll_exports (
-                    id SERIAL PRIMARY KEY,
-                    event_id INTEGER NOT NULL REFERENCES events(id),
-                    file_path TEXT NOT NULL,
-                    exported_by INTEGER NOT NULL,
-                    worker_count INTEGER,
-                    total_amount INTEGER,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-
-            # Admin users 테이블
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS admin_users (
-                    id SERIAL PRIMARY KEY,
-                    telegram_id BIGINT UNIQUE NOT NULL,
-                    username TEXT,
-                    is_active BOOLEAN DEFAULT TRUE,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-
-            # Pending admin requests 테이블
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS pending_admin_requests (
-                    id SERIAL PRIMARY KEY,
-                    telegram_id BIGINT UNIQUE NOT NULL,
-                    username TEXT,
-                    first_name TEXT,
-                    last_name TEXT,
-                    status TEXT DEFAULT 'PENDING',
-                    requested_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    reviewed_by INTEGER,
-                    reviewed_at TIMESTAMP
-                )
-            """)
-
-            # Notifications 테이블
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS notifications (
-                    id SERIAL PRIMARY KEY,
-                    worker_id INTEGER NOT NULL REFERENCES workers(id),
-                    type TEXT NOT NULL,
-                    title TEXT NOT NULL,
-                    message TEXT NOT NULL,
-                    data TEXT,
-                    is_read BOOLEAN DEFAULT FALSE,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-
-            # Credit history 테이블
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS credit_history (
-                    id SERIAL PRIMARY KEY,
-                    worker_id INTEGER NOT NULL REFERENCES workers(id),
-                    amount INTEGER NOT NULL,
-                    balance_after INTEGER,
-                    tx_type TEXT NOT NULL,
-                    reason TEXT NOT NULL,
-                    tx_hash TEXT,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-
-            # Daily check-in 테이블
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS daily_checkins (
-                    id SERIAL PRIMARY KEY,
-                    worker_id INTEGER NOT NULL REFERENCES workers(id),
-                    check_date TEXT NOT NULL,
-                    reward_amount INTEGER DEFAULT 1,
-                    streak_days INTEGER DEFAULT 1,
-                    tx_hash TEXT,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    UNIQUE(worker_id, check_date)
-                )
-            """)
-
-            # Monthly bonuses 테이블
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS monthly_bonuses (
-                    id SERIAL PRIMARY KEY,
-                    worker_id INTEGER NOT NULL REFERENCES workers(id),
-                    year INTEGER NOT NULL,
-                    month INTEGER NOT NULL,
-                    bonus_type TEXT NOT NULL,
-                    amount INTEGER NOT NULL,
-                    tx_hash TEXT,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    UNIQUE(worker_id, year, month, bonus_type)
-                )
-            """)
-
-            # Email verifications 테이블
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS email_verifications (
-                    id SERIAL PRIMARY KEY,
-                    email TEXT NOT NULL,
-                    code TEXT NOT NULL,
-                    verified BOOLEAN DEFAULT FALSE,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    expires_at TIMESTAMP NOT NULL
-                )
-            """)
-
-            # Regions 테이블
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS regions (
-                    id SERIAL PRIMARY KEY,
-                    sido TEXT NOT NULL,
-                    sigungu TEXT NOT NULL,
-                    dong TEXT,
-                    lat REAL,
-                    lng REAL,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-
-            # Job categories 테이블
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS job_categories (
-                    id SERIAL PRIMARY KEY,
-                    name TEXT NOT NULL UNIQUE,
-                    parent_id INTEGER REFERENCES job_categories(id),
-                    avg_pay INTEGER,
-                    description TEXT,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-
-            # Skills 테이블
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS skills (
-                    id SERIAL PRIMARY KEY,
-                    name TEXT NOT NULL UNIQUE,
-                    category TEXT,
-                    description TEXT,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-
-            # Worker skills 테이블
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS worker_skills (
-                    id SERIAL PRIMARY KEY,
-                    worker_id INTEGER NOT NULL REFERENCES workers(id),
-                    skill_id INTEGER NOT NULL REFERENCES skills(id),
-                    acquired_date TEXT,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    UNIQUE(worker_id, skill_id)
-                )
-            """)
-
-            # Worker history 테이블
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS worker_history (
-                    id SERIAL PRIMARY KEY,
-                    worker_id INTEGER NOT NULL REFERENCES workers(id),
-                    field_name TEXT NOT NULL,
-                    old_value TEXT,
-                    new_value TEXT,
-                    changed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    changed_by INTEGER
-                )
-            """)
-
-            # Application status history 테이블
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS application_status_history (
-                    id SERIAL PRIMARY KEY,
-                    application_id INTEGER NOT NULL REFERENCES applications(id),
-                    old_status TEXT,
-                    new_status TEXT,
-                    changed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    changed_by INTEGER,
-                    reason TEXT
-                )
-            """)
-
-            # Worker monthly stats 테이블
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS worker_monthly_stats (
-                    id SERIAL PRIMARY KEY,
-                    worker_id INTEGER NOT NULL REFERENCES workers(id),
-                    year INTEGER NOT NULL,
-                    month INTEGER NOT NULL,
-                    worked_events INTEGER DEFAULT 0,
-                    worked_hours INTEGER DEFAULT 0,
-                    total_earnings INTEGER DEFAULT 0,
-                    on_time_rate REAL DEFAULT 100,
-                    completion_rate REAL DEFAULT 100,
-                    avg_rating REAL,
-                    cancellation_count INTEGER DEFAULT 0,
-                    no_show_count INTEGER DEFAULT 0,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    UNIQUE(worker_id, year, month)
-                )
-            """)
-
-            # Event monthly stats 테이블
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS event_monthly_stats (
-                    id SERIAL PRIMARY KEY,
-                    year INTEGER NOT NULL,
-                    month INTEGER NOT NULL,
-                    category_id INTEGER,
-                    region_id INTEGER,
-                    total_events INTEGER DEFAULT 0,
-                    total_workers INTEGER DEFAULT 0,
-                    total_revenue INTEGER DEFAULT 0,
-                    avg_pay INTEGER,
-                    fill_rate REAL,
-                    completion_rate REAL,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    UNIQUE(year, month, category_id, region_id)
-                )
-            """)
-
-            # Regional stats 테이블
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS regional_stats (
-                    id SERIAL PRIMARY KEY,
-                    region_id INTEGER NOT NULL REFERENCES regions(id),
-                    year INTEGER NOT NULL,
-                    month INTEGER NOT NULL,
-                    active_workers INTEGER DEFAULT 0,
-                    total_events INTEGER DEFAULT 0,
-                    avg_pay INTEGER,
-                    demand_index REAL,
-                    supply_index REAL,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    UNIQUE(region_id, year, month)
-                )
-            """)
-
-            # Ratings 테이블
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS ratings (
-                    id SERIAL PRIMARY KEY,
-                    attendance_id INTEGER NOT NULL REFERENCES attendance(id),
-                    rater_type TEXT NOT NULL,
-                    rating INTEGER NOT NULL,
-                    feedback TEXT,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    UNIQUE(attendance_id, rater_type)
-                )
-            """)
-
-            # 성과 배지 (Achievement Badges / NFT)
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS worker_badges (
-                    id SERIAL PRIMARY KEY,
-                    worker_id INTEGER NOT NULL REFERENCES workers(id),
-                    badge_type TEXT NOT NULL,
-                    badge_level INTEGER DEFAULT 1,
-                    title TEXT NOT NULL,
-                    description TEXT,
-                    icon TEXT,
-                    earned_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    tx_hash TEXT,
-                    is_nft BOOLEAN DEFAULT FALSE,
-                    metadata JSONB,
-                    event_id INTEGER REFERENCES events(id),
-                    batch_id INTEGER,
-                    template_type TEXT DEFAULT 'minimal',
-                    status TEXT DEFAULT 'ACTIVE',
-                    revoke_reason TEXT,
-                    image_url TEXT,
-                    UNIQUE(worker_id, badge_type, badge_level)
-                )
-            """)
-
-            # 프로젝트 NFT 발행 배치
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS project_nft_batches (
-                    id SERIAL PRIMARY KEY,
-                    event_id INTEGER NOT NULL REFERENCES events(id),
-                    title TEXT NOT NULL,
-                    description TEXT,
-                    template_type TEXT DEFAULT 'cert',
-                    issued_by INTEGER REFERENCES workers(id),
-                    issued_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    total_issued INTEGER DEFAULT 0,
-                    metadata JSONB
-                )
-            """)
-
-            # 감사 로그
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS audit_logs (
-                    id SERIAL PRIMARY KEY,
-                    action TEXT NOT NULL,
-                    entity_type TEXT NOT NULL,
-                    entity_id INTEGER,
-                    actor_id INTEGER,
-                    actor_type TEXT,
-                    details JSONB,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-
-            # 인덱스 생성
-            indexes = [
-                "CREATE INDEX IF NOT EXISTS idx_applications_event ON applications(event_id)",
-                "CREATE INDEX IF NOT EXISTS idx_applications_worker ON applications(worker_id)",
-                "CREATE INDEX IF NOT EXISTS idx_applications_status ON applications(status)",
-                "CREATE INDEX IF NOT EXISTS idx_attendance_event ON attendance(event_id)",
-                "CREATE INDEX IF NOT EXISTS idx_events_short_code ON events(short_code)",
-                "CREATE INDEX IF NOT EXISTS idx_events_status ON events(status)",
-                "CREATE INDEX IF NOT EXISTS idx_credit_history_worker ON credit_history(worker_id)",
-                "CREATE INDEX IF NOT EXISTS idx_email_verifications_email ON email_verifications(email)",
-                "CREATE INDEX IF NOT EXISTS idx_regions_sido ON regions(sido)",
-                "CREATE INDEX IF NOT EXISTS idx_regions_sigungu ON regions(sigungu)",
-                "CREATE INDEX IF NOT EXISTS idx_worker_history_worker ON worker_history(worker_id)",
-                "CREATE INDEX IF NOT EXISTS idx_app_status_history_app ON application_status_history(application_id)",
-                "CREATE INDEX IF NOT EXISTS idx_worker_monthly_stats ON worker_monthly_stats(worker_id, year, month)",
-                "CREATE INDEX IF NOT EXISTS idx_ratings_attendance ON ratings(attendance_id)",
-                "CREATE INDEX IF NOT EXISTS idx_worker_badges_worker ON worker_badges(worker_id)",
-                "CREATE INDEX IF NOT EXISTS idx_worker_badges_type ON worker_badges(badge_type)",
-                "CREATE INDEX IF NOT EXISTS idx_worker_badges_event ON worker_badges(event_id)",
-                "CREATE INDEX IF NOT EXISTS idx_worker_badges_status ON worker_badges(status)",
-                "CREATE INDEX IF NOT EXISTS idx_project_nft_batches_event ON project_nft_batches(event_id)",
-                "CREATE INDEX IF NOT EXISTS idx_audit_logs_entity ON audit_logs(entity_type, entity_id)",
-                "CREATE INDEX IF NOT EXISTS idx_audit_logs_actor ON audit_logs(actor_id)"
-            ]
-            for idx in indexes:
-                cursor.execute(idx)
-
-            logger.info("Database tables initialized successfully")
+    def listen(self, channel: str):
+        """LISTEN 전용 연결 (autocommit, 호출자가 poll/close 관리)"""
+        conn = psycopg2.connect(**self._parse_database_url())
+        conn.autocommit = True
+        conn.cursor().execute(sql.SQL("LISTEN {}").format(sql.Identifier(channel)))
+        return conn
 
     # ===== Workers =====
     def create_worker(self, telegram_id: int, name: str, phone: str, **kwargs) -> int:
@@ -574,9 +123,8 @@ class Database:
         """전화번호로 근무자 조회"""
         with self.get_connection() as conn:
             cursor = conn.cursor(cursor_factory=RealDictCursor)
-            # 전화번호 형식 정규화 (하이픈 제거)
-            normalized_phone = phone.replace("-", "").replace(" ", "")
-            cursor.execute("SELECT * FROM workers WHERE REPLACE(phone, '-', '') = %s", (normalized_phone,))
+            # 정규화된 전화번호 컬럼으로 조회 (idx_workers_phone_normalized, migrations/005)
+            cursor.execute("SELECT * FROM workers WHERE phone_normalized = %s", (normalize_phone(phone),))
             row = cursor.fetchone()
             return dict(row) if row else None
 
@@ -584,10 +132,10 @@ class Database:
         """사용자 ID로 연결된 근무자 조회"""
         with self.get_connection() as conn:
             cursor = conn.cursor(cursor_factory=RealDictCursor)
-            # users 테이블의 phone과 workers 테이블의 phone 매칭
+            # users 테이블의 phone과 workers 테이블의 phone 매칭 (정규화 컬럼, 인덱스 사용)
             cursor.execute("""
                 SELECT w.* FROM workers w
-                JOIN users u ON REPLACE(w.phone, '-', '') = REPLACE(u.phone, '-', '')
+                JOIN users u ON w.phone_normalized = u.phone_normalized
                 WHERE u.id = %s
             """, (user_id,))
             row = cursor.fetchone()
@@ -601,16 +149,25 @@ class Database:
             row = cursor.fetchone()
             return dict(row) if row else None
 
-    def list_workers(self, limit: int = 100) -> List[Dict]:
-        """모든 근무자 조회"""
+    def list_workers(self, limit: int = 100, offset: int = 0) -> List[WorkerListItem]:
+        """모든 근무자 조회 (목록 컬럼만, 서버 커서)"""
         with self.get_connection() as conn:
-            cursor = conn.cursor(cursor_factory=RealDictCursor)
-            cursor.execute("""
-                SELECT * FROM workers
+            cursor = conn.cursor(name='worker_list')
+            cursor.execute(f"""
+                SELECT {WorkerListItem.columns()} FROM workers
                 ORDER BY created_at DESC
-                LIMIT %s
-            """, (limit,))
-            return [dict(row) for row in cursor.fetchall()]
+                LIMIT %s OFFSET %s
+            """, (limit, offset))
+            return _fetch_rows(cursor, WorkerListItem)
+
+    def iter_worker_refs(self) -> Iterator[WorkerRef]:
+        """전체 근무자 ID/이름 순회 (서버 커서, 배치용)"""
+        with self.get_connection() as conn:
+            cursor = conn.cursor(name='worker_refs')
+            cursor.itersize = ROW_FETCH_SIZE
+            cursor.execute(f"SELECT {WorkerRef.columns()} FROM workers ORDER BY id")
+            for row in cursor:
+                yield WorkerRef(*row)
 
     def update_worker(self, worker_id: int, **kwargs):
         """근무자 정보 수정"""
@@ -758,27 +315,21 @@ class Database:
             row = cursor.fetchone()
             return dict(row) if row else None
 
-    def list_applications_by_event(self, event_id: int, status: Optional[str] = None) -> List[Dict]:
-        """행사별 지원자 목록"""
+    def list_applications_by_event(self, event_id: int, status: Optional[str] = None) -> List[ApplicationListItem]:
+        """행사별 지원자 목록 (서버 커서)"""
         with self.get_connection() as conn:
-            cursor = conn.cursor(cursor_factory=RealDictCursor)
-            if status:
-                cursor.execute("""
-                    SELECT a.*, w.name, w.phone, w.telegram_id
-                    FROM applications a
-                    JOIN workers w ON a.worker_id = w.id
-                    WHERE a.event_id = %s AND a.status = %s
-                    ORDER BY a.applied_at DESC
-                """, (event_id, status))
-            else:
-                cursor.execute("""
-                    SELECT a.*, w.name, w.phone, w.telegram_id
-                    FROM applications a
-                    JOIN workers w ON a.worker_id = w.id
-                    WHERE a.event_id = %s
-                    ORDER BY a.applied_at DESC
-                """, (event_id,))
-            return [dict(row) for row in cursor.fetchall()]
+            cursor = conn.cursor(name='event_applications')
+            cursor.execute("""
+                SELECT a.id, a.event_id, a.worker_id, a.status, a.applied_at,
+                       a.confirmed_at, a.confirmed_by, a.rejection_reason, a.notified,
+                       a.cancelled_at, a.cancel_reason,
+                       w.name, w.phone, w.telegram_id, w.residence, w.face_photo_file_id
+                FROM applications a
+                JOIN workers w ON a.worker_id = w.id
+                WHERE a.event_id = %s AND (%s::text IS NULL OR a.status = %s)
+                ORDER BY a.applied_at DESC
+            """, (event_id, status, status))
+            return _fetch_rows(cursor, ApplicationListItem)
 
     def list_applications_by_worker(self, worker_id: int) -> List[Dict]:
         """근무자별 지원 내역"""
@@ -826,6 +377,79 @@ class Database:
                     UPDATE applications SET status = %s WHERE id = %s
                 """, (status, app_id))
 
+    def bulk_update_application_status(self, app_ids: List[int], status: str,
+                                       changed_by: Optional[int] = None,
+                                       rejection_reason: Optional[str] = None,
+                                       build_notification=None) -> List[Dict]:
+        """
+        지원 상태 일괄 변경 (단일 트랜잭션)
+
+        상태 변경, application_status_history 기록, 확정 시 출석 레코드(출석 코드) 생성,
+        알림/발송 큐 등록을 다중 행 문장으로 한 번에 처리한다.
+        이미 같은 상태인 지원은 건너뛴다.
+
+        Args:
+            build_notification: 변경된 행(dict) -> enqueue_notifications 항목 (None이면 알림 없음)
+
+        Returns:
+            변경된 지원 목록 (근무자/행사 정보, check_in_code 포함)
+        """
+        if not app_ids:
+            return []
+        now = now_kst_naive()
+        codes = [generate_check_in_code() for _ in app_ids]
+
+        with self.get_connection() as conn:
+            cursor = conn.cursor(cursor_factory=RealDictCursor)
+            cursor.execute("""
+                WITH updated AS (
+                    UPDATE applications a
+                    SET status = %(status)s,
+                        confirmed_at = CASE WHEN %(status)s = 'CONFIRMED' THEN %(now)s ELSE a.confirmed_at END,
+                        confirmed_by = CASE WHEN %(status)s = 'CONFIRMED' THEN %(changed_by)s ELSE a.confirmed_by END,
+                        rejection_reason = CASE WHEN %(status)s = 'REJECTED' THEN %(reason)s ELSE a.rejection_reason END
+                    FROM applications old
+                    WHERE old.id = a.id
+                      AND a.id = ANY(%(app_ids)s)
+                      AND a.status IS DISTINCT FROM %(status)s
+                    RETURNING a.id, a.event_id, a.worker_id, old.status AS old_status
+                ),
+                history AS (
+                    INSERT INTO application_status_history
+                    (application_id, old_status, new_status, changed_by, reason)
+                    SELECT id, old_status, %(status)s, %(changed_by)s, %(reason)s FROM updated
+                ),
+                created AS (
+                    INSERT INTO attendance (application_id, event_id, worker_id, check_in_code)
+                    SELECT u.id, u.event_id, u.worker_id, c.code
+                    FROM updated u
+                    JOIN unnest(%(app_ids)s::int[], %(codes)s::text[]) AS c(app_id, code) ON c.app_id = u.id
+                    WHERE %(status)s = 'CONFIRMED'
+                    ON CONFLICT (application_id) DO NOTHING
+                    RETURNING application_id, check_in_code
+                )
+                SELECT u.id, u.event_id, u.worker_id, u.old_status,
+                       w.name AS worker_name, w.telegram_id AS worker_telegram_id,
+                       e.title AS event_title, e.event_date, e.event_time, e.location, e.pay_amount,
+                       COALESCE(c.check_in_code, att.check_in_code) AS check_in_code
+                FROM updated u
+                JOIN workers w ON w.id = u.worker_id
+                JOIN events e ON e.id = u.event_id
+                LEFT JOIN created c ON c.application_id = u.id
+                LEFT JOIN attendance att ON att.application_id = u.id
+                ORDER BY u.id
+            """, {
+                "status": status, "now": now, "changed_by": changed_by, "reason": rejection_reason,
+                "app_ids": list(app_ids), "codes": codes,
+            })
+            rows = [dict(row) for row in cursor.fetchall()]
+
+            if build_notification and rows:
+                self._insert_notifications(conn.cursor(), [build_notification(row) for row in rows])
+
+            logger.info(f"Applications bulk updated to {status}: {len(rows)}/{len(app_ids)}")
+            return rows
+
     def mark_application_notified(self, app_id: int):
         """알림 발송 완료 표시"""
         with self.get_connection() as conn:
@@ -1026,6 +650,71 @@ class Database:
             """, (event_id,))
             return [dict(row) for row in cursor.fetchall()]
 
+    def list_attendance_for_documents(self, event_id: int = None,
+                                      year: int = None, month: int = None) -> List[Dict]:
+        """일괄 서류 발급용 퇴근 완료 출석 목록 (지급명세서 + 증명서에 필요한 필드)"""
+        conditions = ["att.check_out_time IS NOT NULL"]
+        params = []
+        if event_id:
+            conditions.append("att.event_id = %s")
+            params.append(event_id)
+        if year and month:
+            # event_date는 봇 등록 시 자유 형식이라 퇴근 시각(KST)으로 월을 판정 (iter_period_payroll과 동일)
+            conditions.append("att.check_out_time >= make_date(%s, %s, 1)"
+                              " AND att.check_out_time < make_date(%s, %s, 1) + interval '1 month'")
+            params.extend([year, month, year, month])
+
+        with self.get_connection() as conn:
+            cursor = conn.cursor(cursor_factory=RealDictCursor)
+            cursor.execute(f"""
+                SELECT att.id, att.event_id, att.worker_id,
+                       att.check_in_time, att.check_out_time, att.worked_minutes,
+                       e.title as event_title, e.event_date, e.pay_amount, e.location,
+                       w.name, w.birth_date, w.phone,
+                       cl.id as chain_log_id, cl.tx_hash, cl.block_number
+                FROM attendance att
+                JOIN events e ON att.event_id = e.id
+                JOIN workers w ON att.worker_id = w.id
+                LEFT JOIN chain_logs cl ON cl.attendance_id = att.id
+                WHERE {' AND '.join(conditions)}
+                ORDER BY e.event_date, att.event_id, w.name
+            """, params)
+            return [dict(row) for row in cursor.fetchall()]
+
+    def iter_period_payroll(self, year: int = None, month: int = None,
+                            event_ids: List[int] = None) -> Iterator[Dict]:
+        """기간/여러 행사 급여 합계 (근무자·계좌별, 퇴근 완료 기준, 서버 커서로 스트리밍)"""
+        conditions = ["att.check_out_time IS NOT NULL"]
+        params = []
+        if year and month:
+            # event_date는 봇 등록 시 자유 형식("1월 25일 (토)")이라 퇴근 시각(KST)으로 월을 판정
+            conditions.append("att.check_out_time >= make_date(%s, %s, 1)"
+                              " AND att.check_out_time < make_date(%s, %s, 1) + interval '1 month'")
+            params.extend([year, month, year, month])
+        if event_ids:
+            conditions.append("att.event_id = ANY(%s)")
+            params.append(list(event_ids))
+
+        with self.get_connection() as conn:
+            cursor = conn.cursor(name='period_payroll', cursor_factory=RealDictCursor)
+            cursor.itersize = 2000
+            # 공제 후 금액은 행사별 int(금액 * 0.967)과 같도록 정수 연산 후 합산
+            cursor.execute(f"""
+                SELECT w.id as worker_id, w.name, w.birth_date, w.phone,
+                       w.bank_name, w.bank_account,
+                       COUNT(*) as event_count,
+                       SUM(e.pay_amount) as gross_pay,
+                       SUM(e.pay_amount * 967 / 1000) as net_pay
+                FROM attendance att
+                JOIN events e ON att.event_id = e.id
+                JOIN workers w ON att.worker_id = w.id
+                WHERE {' AND '.join(conditions)}
+                GROUP BY w.id, w.name, w.birth_date, w.phone, w.bank_name, w.bank_account
+                ORDER BY w.name, w.id
+            """, params)
+            for row in cursor:
+                yield dict(row)
+
     # ===== Chain Logs =====
     def create_chain_log(self, attendance_id: int, event_id: int, worker_uid_hash: str,
                          log_hash: str, network: str = 'amoy') -> int:
@@ -1280,60 +969,97 @@ class Database:
             return dict(row) if row else None
 
     def get_streak_days(self, worker_id: int) -> int:
-        """연속 출석 일수 계산"""
-        from datetime import timedelta
+        """연속 출석 일수 (오늘 또는 어제까지 이어진 경우만)"""
         today = now_kst_naive().date()
-
         with self.get_connection() as conn:
-            cursor = conn.cursor(cursor_factory=RealDictCursor)
+            cursor = conn.cursor()
             cursor.execute("""
-                SELECT check_date FROM daily_checkins
-                WHERE worker_id = %s
-                ORDER BY check_date DESC
-                LIMIT 30
-            """, (worker_id,))
-            rows = cursor.fetchall()
-
-            if not rows:
-                return 0
-
-            streak = 0
-            expected_date = today
-
-            for row in rows:
-                check_date = datetime.strptime(row['check_date'], '%Y-%m-%d').date()
-                if check_date == expected_date:
-                    streak += 1
-                    expected_date = expected_date - timedelta(days=1)
-                elif check_date == expected_date - timedelta(days=1):
-                    streak += 1
-                    expected_date = check_date - timedelta(days=1)
-                else:
-                    break
-
-            return streak
+                SELECT daily_current_streak FROM worker_streaks
+                WHERE worker_id = %s AND daily_last_date >= %s::date - 1
+            """, (worker_id, today))
+            row = cursor.fetchone()
+            return (row[0] or 0) if row else 0
 
-    def create_daily_checkin(self, worker_id: int, reward_amount: int = 1, tx_hash: str = None) -> Dict:
-        """일일 출석체크 생성"""
-        today = now_kst_naive().strftime('%Y-%m-%d')
-        streak = self.get_streak_days(worker_id) + 1
+    @contextmanager
+    def daily_checkin(self, worker_id: int, base_reward: int = 1, bonus_days: int = 7):
+        """
+        일일 출석체크 트랜잭션
 
+        연속 출석/월 비트맵 갱신, 보상 계산(기본 + 연속 bonus_days일마다 +1), 토큰 적립,
+        출석 기록 INSERT를 한 문장으로 실행하고 기록(dict)을 yield한다. 오늘 이미 했으면 None.
+        블록 안에서 외부 보상 발행을 하고 예외가 나면 전부 롤백되며, 동시 요청은
+        worker_streaks 행 잠금에서 기다렸다가 None을 받는다.
+        블록에서 checkin['tx_hash']를 채우면 커밋 전에 함께 저장한다.
+        """
+        today = now_kst_naive().date()
         with self.get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute("""
-                INSERT INTO daily_checkins (worker_id, check_date, reward_amount, streak_days, tx_hash)
-                VALUES (%s, %s, %s, %s, %s)
-                RETURNING id
-            """, (worker_id, today, reward_amount, streak, tx_hash))
-
-            return {
-                'id': cursor.fetchone()[0],
+                WITH streak AS (
+                    INSERT INTO worker_streaks AS ws
+                        (worker_id, daily_current_streak, daily_longest_streak, daily_last_date)
+                    VALUES (%(worker_id)s, 1, 1, %(today)s)
+                    ON CONFLICT (worker_id) DO UPDATE SET
+                        daily_current_streak = CASE WHEN ws.daily_last_date = %(today)s::date - 1
+                                                    THEN COALESCE(ws.daily_current_streak, 0) + 1 ELSE 1 END,
+                        daily_longest_streak = GREATEST(
+                            COALESCE(ws.daily_longest_streak, 0),
+                            CASE WHEN ws.daily_last_date = %(today)s::date - 1
+                                 THEN COALESCE(ws.daily_current_streak, 0) + 1 ELSE 1 END
+                        ),
+                        daily_last_date = EXCLUDED.daily_last_date,
+                        updated_at = CURRENT_TIMESTAMP
+                    WHERE ws.daily_last_date IS DISTINCT FROM EXCLUDED.daily_last_date
+                    RETURNING daily_current_streak
+                ),
+                reward AS (
+                    SELECT daily_current_streak AS streak_days,
+                           %(base_reward)s + (daily_current_streak - 1) / %(bonus_days)s AS reward_amount
+                    FROM streak
+                ),
+                month AS (
+                    INSERT INTO daily_checkin_months AS m (worker_id, month, days_bitmap)
+                    SELECT %(worker_id)s, date_trunc('month', %(today)s::date)::date,
+                           1 << (extract(day FROM %(today)s::date)::int - 1)
+                    FROM streak
+                    ON CONFLICT (worker_id, month) DO UPDATE SET days_bitmap = m.days_bitmap | EXCLUDED.days_bitmap
+                ),
+                tokens AS (
+                    UPDATE workers SET tokens = COALESCE(tokens, 0) + r.reward_amount
+                    FROM reward r
+                    WHERE id = %(worker_id)s
+                )
+                INSERT INTO daily_checkins (worker_id, check_date, reward_amount, streak_days)
+                SELECT %(worker_id)s, %(check_date)s, r.reward_amount, r.streak_days
+                FROM reward r
+                RETURNING id, reward_amount, streak_days
+            """, {
+                'worker_id': worker_id, 'today': today, 'check_date': today.strftime('%Y-%m-%d'),
+                'base_reward': base_reward, 'bonus_days': bonus_days,
+            })
+            row = cursor.fetchone()
+            checkin = {
+                'id': row[0],
                 'worker_id': worker_id,
-                'check_date': today,
-                'reward_amount': reward_amount,
-                'streak_days': streak,
-                'tx_hash': tx_hash
-            }
+                'check_date': today.strftime('%Y-%m-%d'),
+                'reward_amount': row[1],
+                'streak_days': row[2],
+                'tx_hash': None
+            } if row else None
+
+            yield checkin
+
+            if checkin and checkin['tx_hash']:
+                cursor.execute("UPDATE daily_checkins SET tx_hash = %s WHERE id = %s",
+                               (checkin['tx_hash'], checkin['id']))
+
+    def create_daily_checkin(self, worker_id: int, base_reward: int = 1, bonus_days: int = 7,
+                             tx_hash: str = None) -> Optional[Dict]:
+        """일일 출석체크 생성 (외부 발행 없이), 오늘 이미 했으면 None"""
+        with self.daily_checkin(worker_id, base_reward, bonus_days) as checkin:
+            if checkin:
+                checkin['tx_hash'] = tx_hash
+        return checkin
 
     def get_checkin_history(self, worker_id: int, limit: int = 30) -> List[Dict]:
         """출석체크 내역 조회"""
@@ -1360,11 +1086,18 @@ class Database:
             return [dict(row) for row in cursor.fetchall()]
 
     def check_perfect_attendance(self, worker_id: int, year: int, month: int) -> bool:
-        """해당 월에 매일 출석했는지 확인"""
+        """해당 월에 매일 출석했는지 확인 (월 비트맵)"""
         import calendar
         days_in_month = calendar.monthrange(year, month)[1]
-        checkins = self.get_monthly_checkins(worker_id, year, month)
-        return len(checkins) >= days_in_month
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT days_bitmap FROM daily_checkin_months
+                WHERE worker_id = %s AND month = make_date(%s, %s, 1)
+            """, (worker_id, year, month))
+            row = cursor.fetchone()
+            full = (1 << days_in_month) - 1
+            return bool(row) and row[0] & full == full
 
     def get_monthly_bonus(self, worker_id: int, year: int, month: int, bonus_type: str) -> Optional[Dict]:
         """월간 보너스 지급 기록 조회"""
@@ -1434,18 +1167,62 @@ class Database:
                 VALUES (%s, %s, %s, %s, %s)
                 RETURNING id
             """, (worker_id, notification_type, title, message, data))
-            return cursor.fetchone()[0]
+            notification_id = cursor.fetchone()[0]
+            self._increment_unread(cursor, [worker_id])
+            self._publish_notifications(cursor, [notification_id])
+            return notification_id
+
+    def _increment_unread(self, cursor, worker_ids: List[int]):
+        """읽지 않은 알림 카운터 증가 (알림 INSERT 후 같은 트랜잭션에서 호출)"""
+        cursor.execute("""
+            INSERT INTO notification_counters AS nc (worker_id, unread_count)
+            SELECT worker_id, COUNT(*) FROM unnest(%s::int[]) AS worker_id
+            GROUP BY worker_id ORDER BY worker_id  -- 잠금 순서 고정 (일괄 INSERT 간 교착 방지)
+            ON CONFLICT (worker_id) DO UPDATE SET
+                unread_count = nc.unread_count + EXCLUDED.unread_count,
+                updated_at = CURRENT_TIMESTAMP
+        """, (list(worker_ids),))
+
+    def _lock_unread_counter(self, cursor, worker_id: int):
+        """읽음 처리 전 카운터 행 잠금 (동시 알림 생성과의 순서 보장)"""
+        cursor.execute("""
+            INSERT INTO notification_counters (worker_id) VALUES (%s)
+            ON CONFLICT (worker_id) DO NOTHING
+        """, (worker_id,))
+        cursor.execute("SELECT 1 FROM notification_counters WHERE worker_id = %s FOR UPDATE", (worker_id,))
+
+    def _publish_notifications(self, cursor, notification_ids: List[int]):
+        """새 알림 NOTIFY (커밋 시 전달, 구독 중인 API 프로세스가 푸시)"""
+        # NOTIFY 페이로드 한도(8000바이트) 안에 들도록 본문은 잘라서 보냄
+        cursor.execute("""
+            SELECT pg_notify(%s, json_build_object(
+                'event', 'notification',
+                'worker_id', worker_id,
+                'notification', json_build_object(
+                    'id', id, 'type', type, 'title', left(title, 200), 'message', left(message, 1500),
+                    'data', left(data, 500), 'is_read', COALESCE(is_read, FALSE), 'created_at', created_at
+                )
+            )::text)
+            FROM notifications WHERE id = ANY(%s)
+        """, (NOTIFICATION_CHANNEL, list(notification_ids)))
+
+    def _publish_read(self, cursor, worker_ids: List[int]):
+        """읽음 처리 NOTIFY (다른 탭/기기의 배지 갱신용)"""
+        cursor.execute("""
+            SELECT pg_notify(%s, json_build_object('event', 'read', 'worker_id', worker_id)::text)
+            FROM unnest(%s::int[]) AS worker_id
+        """, (NOTIFICATION_CHANNEL, list(set(worker_ids))))
 
-    def get_notifications(self, worker_id: int, limit: int = 50) -> List[Dict]:
-        """근무자 알림 목록"""
+    def get_notifications(self, worker_id: int, limit: int = 50, before_id: int = None) -> List[Dict]:
+        """근무자 알림 목록 (최신순, before_id보다 오래된 알림부터 이어서 조회)"""
         with self.get_connection() as conn:
             cursor = conn.cursor(cursor_factory=RealDictCursor)
             cursor.execute("""
                 SELECT * FROM notifications
-                WHERE worker_id = %s
-                ORDER BY created_at DESC
+                WHERE worker_id = %s AND (%s::int IS NULL OR id < %s)
+                ORDER BY id DESC
                 LIMIT %s
-            """, (worker_id, limit))
+            """, (worker_id, before_id, before_id, limit))
             notifications = []
             for row in cursor.fetchall():
                 notif = dict(row)
@@ -1455,31 +1232,185 @@ class Database:
             return notifications
 
     def get_unread_notification_count(self, worker_id: int) -> int:
-        """읽지 않은 알림 수"""
+        """읽지 않은 알림 수 (카운터 조회)"""
         with self.get_connection() as conn:
-            cursor = conn.cursor(cursor_factory=RealDictCursor)
-            cursor.execute("""
-                SELECT COUNT(*) as cnt FROM notifications
-                WHERE worker_id = %s AND is_read = FALSE
-            """, (worker_id,))
+            cursor = conn.cursor()
+            cursor.execute("SELECT unread_count FROM notification_counters WHERE worker_id = %s", (worker_id,))
             row = cursor.fetchone()
-            return row['cnt'] if row else 0
+            return row[0] if row else 0
 
-    def mark_notification_read(self, notification_id: int):
-        """알림 읽음 처리"""
+    def mark_notification_read(self, notification_id: int, worker_id: int = None) -> bool:
+        """알림 읽음 처리 (worker_id 지정 시 본인 알림만)"""
         with self.get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute("""
-                UPDATE notifications SET is_read = TRUE WHERE id = %s
+                SELECT worker_id FROM notifications
+                WHERE id = %s AND (%s::int IS NULL OR worker_id = %s)
+            """, (notification_id, worker_id, worker_id))
+            row = cursor.fetchone()
+            if not row:
+                return False
+            self._lock_unread_counter(cursor, row[0])
+
+            cursor.execute("""
+                UPDATE notifications SET is_read = TRUE WHERE id = %s AND is_read = FALSE
             """, (notification_id,))
+            if cursor.rowcount:
+                cursor.execute("""
+                    UPDATE notification_counters
+                    SET unread_count = GREATEST(unread_count - 1, 0), updated_at = CURRENT_TIMESTAMP
+                    WHERE worker_id = %s
+                """, (row[0],))
+                self._publish_read(cursor, [row[0]])
+            return True
 
     def mark_all_notifications_read(self, worker_id: int):
         """모든 알림 읽음 처리"""
         with self.get_connection() as conn:
             cursor = conn.cursor()
+            self._lock_unread_counter(cursor, worker_id)
             cursor.execute("""
-                UPDATE notifications SET is_read = TRUE WHERE worker_id = %s
+                UPDATE notifications SET is_read = TRUE WHERE worker_id = %s AND is_read = FALSE
             """, (worker_id,))
+            if cursor.rowcount:
+                cursor.execute("""
+                    UPDATE notification_counters SET unread_count = 0, updated_at = CURRENT_TIMESTAMP
+                    WHERE worker_id = %s
+                """, (worker_id,))
+                self._publish_read(cursor, [worker_id])
+
+    def rebuild_notification_counters(self) -> int:
+        """카운터를 알림 테이블 기준으로 재계산 (정합성 점검/복구용), 보정된 근무자 수 반환"""
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                WITH actual AS (
+                    SELECT w.id AS worker_id, COUNT(n.id) AS unread_count
+                    FROM workers w
+                    LEFT JOIN notifications n ON n.worker_id = w.id AND n.is_read = FALSE
+                    GROUP BY w.id
+                )
+                INSERT INTO notification_counters AS nc (worker_id, unread_count)
+                SELECT worker_id, unread_count FROM actual
+                ON CONFLICT (worker_id) DO UPDATE SET
+                    unread_count = EXCLUDED.unread_count, updated_at = CURRENT_TIMESTAMP
+                WHERE nc.unread_count IS DISTINCT FROM EXCLUDED.unread_count
+            """)
+            return cursor.rowcount
+
+    # ===== Notification Outbox =====
+    def enqueue_notification(self, worker_id: int, notification_type: str, title: str, message: str,
+                             chat_id: int, text: str = None, data: str = None,
+                             reference_type: str = None, reference_id: int = None) -> int:
+        """알림 생성 + 텔레그램 발송 큐 등록 (같은 트랜잭션)"""
+        return self.enqueue_notifications([{
+            "worker_id": worker_id, "type": notification_type, "title": title, "message": message,
+            "chat_id": chat_id, "text": text, "data": data,
+            "reference_type": reference_type, "reference_id": reference_id,
+        }])[0]
+
+    def enqueue_notifications(self, items: List[Dict]) -> List[int]:
+        """
+        알림 일괄 생성 + 발송 큐 등록 (다중 행 INSERT)
+
+        Args:
+            items: [{"worker_id", "type", "title", "message", "chat_id",
+                     "text"(선택, 기본 message), "data", "reference_type", "reference_id"}]
+
+        Returns:
+            생성된 notification ID 목록 (items 순서)
+        """
+        if not items:
+            return []
+        with self.get_connection() as conn:
+            return self._insert_notifications(conn.cursor(), items)
+
+    def _insert_notifications(self, cursor, items: List[Dict]) -> List[int]:
+        """알림 + 발송 큐 INSERT (호출자의 트랜잭션 안에서 실행)"""
+        # ID를 먼저 할당해 알림과 발송 큐 행을 순서대로 연결
+        cursor.execute("""
+            SELECT nextval(pg_get_serial_sequence('notifications', 'id'))
+            FROM generate_series(1, %s)
+        """, (len(items),))
+        ids = [row[0] for row in cursor.fetchall()]
+
+        execute_values(cursor, """
+            INSERT INTO notifications (id, worker_id, type, title, message, data) VALUES %s
+        """, [(nid, item["worker_id"], item["type"], item["title"], item["message"], item.get("data"))
+              for nid, item in zip(ids, items)])
+
+        deliveries = [(nid, item["chat_id"], item.get("text") or item["message"],
+                       item.get("reference_type"), item.get("reference_id"))
+                      for nid, item in zip(ids, items) if item.get("chat_id")]
+        if deliveries:
+            execute_values(cursor, """
+                INSERT INTO notification_deliveries (notification_id, chat_id, text, reference_type, reference_id)
+                VALUES %s
+            """, deliveries)
+        self._increment_unread(cursor, [item["worker_id"] for item in items])
+        self._publish_notifications(cursor, ids)
+        return ids
+
+    def claim_notification_deliveries(self, limit: int = 100, lease_seconds: int = 300) -> List[Dict]:
+        """
+        발송할 알림 선점 (SKIP LOCKED, 여러 발송기가 동시에 실행돼도 중복 없음)
+
+        선점 후 lease_seconds 안에 완료/재시도 처리되지 않으면 다시 선점 가능
+        """
+        with self.get_connection() as conn:
+            cursor = conn.cursor(cursor_factory=RealDictCursor)
+            cursor.execute("""
+                UPDATE notification_deliveries
+                SET status = 'SENDING', attempts = attempts + 1,
+                    next_attempt_at = CURRENT_TIMESTAMP + %s * INTERVAL '1 second'
+                WHERE id IN (
+                    SELECT id FROM notification_deliveries
+                    WHERE status IN ('PENDING', 'SENDING') AND next_attempt_at <= CURRENT_TIMESTAMP
+                    ORDER BY id
+                    LIMIT %s
+                    FOR UPDATE SKIP LOCKED
+                )
+                RETURNING id, notification_id, chat_id, text, reference_type, reference_id, attempts
+            """, (lease_seconds, limit))
+            return sorted((dict(row) for row in cursor.fetchall()), key=lambda d: d["id"])
+
+    def complete_notification_deliveries(self, delivery_ids: List[int]):
+        """발송 완료 처리 (지원 확정 알림이면 applications.notified도 함께 갱신)"""
+        if not delivery_ids:
+            return
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                WITH sent AS (
+                    UPDATE notification_deliveries
+                    SET status = 'SENT', sent_at = CURRENT_TIMESTAMP, last_error = NULL
+                    WHERE id = ANY(%s)
+                    RETURNING reference_type, reference_id
+                )
+                UPDATE applications SET notified = TRUE
+                WHERE id IN (SELECT reference_id FROM sent WHERE reference_type = 'application')
+            """, (list(delivery_ids),))
+
+    def retry_notification_delivery(self, delivery_id: int, delay_seconds: float, error: str,
+                                    max_attempts: int = None):
+        """발송 재시도 예약 (max_attempts 초과 시 FAILED)"""
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                UPDATE notification_deliveries
+                SET status = CASE WHEN %s::int IS NOT NULL AND attempts >= %s THEN 'FAILED' ELSE 'PENDING' END,
+                    next_attempt_at = CURRENT_TIMESTAMP + %s * INTERVAL '1 second',
+                    last_error = %s
+                WHERE id = %s
+            """, (max_attempts, max_attempts, delay_seconds, error, delivery_id))
+
+    def fail_notification_delivery(self, delivery_id: int, error: str):
+        """발송 실패 처리 (재시도 안 함: 차단, 존재하지 않는 채팅 등)"""
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                UPDATE notification_deliveries SET status = 'FAILED', last_error = %s WHERE id = %s
+            """, (error, delivery_id))
 
     # ===== Email Verifications =====
     def create_email_verification(self, email: str, code: str, expires_at: datetime) -> int:
@@ -1603,16 +1534,22 @@ class Database:
             row = cursor.fetchone()
             return bool(row and row['is_admin'])
 
-    def get_all_workers(self, limit: int = 100, offset: int = 0) -> List[Dict]:
-        """모든 근무자 목록"""
+    def is_admin_principal(self, telegram_id: int, email: str) -> bool:
+        """관리자 여부 확인 (admin_users 또는 이메일 관리자, 1회 쿼리)"""
         with self.get_connection() as conn:
-            cursor = conn.cursor(cursor_factory=RealDictCursor)
+            cursor = conn.cursor()
             cursor.execute("""
-                SELECT * FROM workers
-                ORDER BY created_at DESC
-                LIMIT %s OFFSET %s
-            """, (limit, offset))
-            return [dict(row) for row in cursor.fetchall()]
+                SELECT EXISTS (
+                    SELECT 1 FROM admin_users WHERE telegram_id = %s AND is_active = TRUE
+                ) OR EXISTS (
+                    SELECT 1 FROM workers WHERE email = %s AND is_admin = TRUE
+                )
+            """, (telegram_id, email))
+            return bool(cursor.fetchone()[0])
+
+    def get_all_workers(self, limit: int = 100, offset: int = 0) -> List[WorkerListItem]:
+        """모든 근무자 목록"""
+        return self.list_workers(limit=limit, offset=offset)
 
     # ===== 빅데이터 분석용 메서드 =====
 
@@ -2099,6 +2036,21 @@ class Database:
             row = cursor.fetchone()
             return dict(row) if row else None
 
+    def get_badge_for_render(self, badge_id: int) -> Optional[Dict]:
+        """배지 이미지 렌더링용 조회 (근무자명, 텔레그램 ID, 이벤트명 포함)"""
+        with self.get_connection() as conn:
+            cursor = conn.cursor(cursor_factory=RealDictCursor)
+            cursor.execute("""
+                SELECT wb.*, w.name as worker_name, w.telegram_id as worker_telegram_id,
+                       e.title as event_name
+                FROM worker_badges wb
+                JOIN workers w ON wb.worker_id = w.id
+                LEFT JOIN events e ON wb.event_id = e.id
+                WHERE wb.id = %s
+            """, (badge_id,))
+            row = cursor.fetchone()
+            return dict(row) if row else None
+
     def has_badge(self, worker_id: int, badge_type: str, badge_level: int = 1) -> bool:
         """특정 배지 보유 여부 확인"""
         with self.get_connection() as conn:
@@ -2204,6 +2156,107 @@ class Database:
                 "rating_count": rating_count
             }
 
+    def get_badge_counters(self, worker_ids: List[int] = None) -> Dict[int, Dict]:
+        """
+        배지 조건 카운터 일괄 조회 (근무자별 그룹 집계, 단일 쿼리)
+
+        Args:
+            worker_ids: 대상 근무자 ID 목록 (None이면 전체)
+
+        Returns:
+            {worker_id: {"total_work_count", "perfect_attendance", "blockchain_records",
+                         "profile_complete", "has_photo"}}
+        """
+        def worker_filter(column: str) -> str:
+            return f"AND {column} = ANY(%(ids)s)" if worker_ids is not None else ""
+
+        with self.get_connection() as conn:
+            cursor = conn.cursor(cursor_factory=RealDictCursor)
+            cursor.execute(f"""
+                SELECT w.id as worker_id,
+                       COALESCE(wc.cnt, 0) as total_work_count,
+                       COALESCE(pa.cnt, 0) as perfect_attendance,
+                       COALESCE(bc.cnt, 0) as blockchain_records,
+                       CASE WHEN COALESCE(w.name, '') <> '' AND COALESCE(w.phone, '') <> ''
+                                 AND COALESCE(w.birth_date, '') <> '' AND COALESCE(w.bank_name, '') <> ''
+                                 AND COALESCE(w.bank_account, '') <> ''
+                            THEN 1 ELSE 0 END as profile_complete,
+                       CASE WHEN COALESCE(w.face_photo_file_id, '') <> '' THEN 1 ELSE 0 END as has_photo
+                FROM workers w
+                LEFT JOIN (
+                    SELECT worker_id, COUNT(*) as cnt FROM attendance
+                    WHERE check_out_time IS NOT NULL {worker_filter("worker_id")}
+                    GROUP BY worker_id
+                ) wc ON wc.worker_id = w.id
+                LEFT JOIN (
+                    SELECT ap.worker_id, COUNT(*) as cnt
+                    FROM applications ap
+                    JOIN attendance at ON ap.worker_id = at.worker_id AND ap.event_id = at.event_id
+                    WHERE ap.status = 'CONFIRMED' AND at.check_out_time IS NOT NULL
+                      {worker_filter("ap.worker_id")}
+                    GROUP BY ap.worker_id
+                ) pa ON pa.worker_id = w.id
+                LEFT JOIN (
+                    SELECT a.worker_id, COUNT(*) as cnt
+                    FROM chain_logs cl
+                    JOIN attendance a ON cl.attendance_id = a.id
+                    WHERE TRUE {worker_filter("a.worker_id")}
+                    GROUP BY a.worker_id
+                ) bc ON bc.worker_id = w.id
+                WHERE TRUE {worker_filter("w.id")}
+            """, {"ids": list(worker_ids) if worker_ids is not None else None})
+            return {row["worker_id"]: dict(row) for row in cursor.fetchall()}
+
+    def get_earned_badge_keys(self, worker_ids: List[int] = None) -> set:
+        """보유 배지 (worker_id, badge_type, badge_level) 집합"""
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            if worker_ids is None:
+                cursor.execute("SELECT worker_id, badge_type, badge_level FROM worker_badges")
+            else:
+                cursor.execute("""
+                    SELECT worker_id, badge_type, badge_level FROM worker_badges
+                    WHERE worker_id = ANY(%s)
+                """, (list(worker_ids),))
+            return {tuple(row) for row in cursor.fetchall()}
+
+    def award_badges_bulk(self, awards: List[tuple]) -> List[Dict]:
+        """
+        배지 일괄 발급 (다중 행 INSERT, 이미 있으면 건너뜀)
+
+        Args:
+            awards: [(worker_id, badge_type, badge_level, title, description, icon), ...]
+
+        Returns:
+            실제로 발급된 배지 목록 [{"id", "worker_id", "badge_type", "badge_level"}]
+        """
+        if not awards:
+            return []
+        with self.get_connection() as conn:
+            cursor = conn.cursor(cursor_factory=RealDictCursor)
+            rows = execute_values(cursor, """
+                INSERT INTO worker_badges (worker_id, badge_type, badge_level, title, description, icon)
+                VALUES %s
+                ON CONFLICT (worker_id, badge_type, badge_level) DO NOTHING
+                RETURNING id, worker_id, badge_type, badge_level
+            """, awards, fetch=True)
+            return [dict(row) for row in rows]
+
+    def get_badge_candidate_workers(self, since: datetime) -> List[int]:
+        """since 이후 배지 조건이 바뀌었을 수 있는 근무자 ID (퇴근, 블록체인 기록, 프로필 수정)"""
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT worker_id FROM attendance WHERE check_out_time >= %s
+                UNION
+                SELECT a.worker_id FROM chain_logs cl
+                JOIN attendance a ON cl.attendance_id = a.id
+                WHERE cl.created_at >= %s
+                UNION
+                SELECT id FROM workers WHERE updated_at >= %s
+            """, (since, since, since))
+            return [row[0] for row in cursor.fetchall()]
+
     # ===== Project NFT Batches =====
     def create_nft_batch(self, event_id: int, title: str, description: str = None,
                          template_type: str = 'cert', issued_by: int = None,
@@ -2264,6 +2317,71 @@ class Database:
                   template_type, image_url, json.dumps(metadata) if metadata else None))
             return cursor.fetchone()[0]
 
+    def issue_project_badges(self, event_id: int, worker_ids: List[int], title: str,
+                             description: str = None, icon: str = None,
+                             template_type: str = 'cert', issued_by: int = None,
+                             batch_metadata: dict = None) -> Dict:
+        """
+        프로젝트 배지 일괄 발급 (단일 트랜잭션)
+
+        배치 생성 후 출퇴근 완료자 중 아직 해당 이벤트 배지가 없는 근무자에게만
+        한 번의 INSERT로 발급하고, 감사 로그와 배치 수량도 같은 문장에서 기록
+
+        Returns:
+            {"batch_id": int, "issued": [{"badge_id": int, "worker_id": int}, ...]}
+        """
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            import json
+            cursor.execute("""
+                INSERT INTO project_nft_batches
+                (event_id, title, description, template_type, issued_by, metadata)
+                VALUES (%s, %s, %s, %s, %s, %s)
+                RETURNING id
+            """, (event_id, title, description, template_type, issued_by,
+                  json.dumps(batch_metadata) if batch_metadata else None))
+            batch_id = cursor.fetchone()[0]
+
+            audit_details = {"event_id": event_id, "batch_id": batch_id, "title": title}
+            cursor.execute("""
+                WITH eligible AS (
+                    SELECT DISTINCT a.worker_id
+                    FROM attendance a
+                    WHERE a.event_id = %s AND a.check_out_time IS NOT NULL
+                      AND a.worker_id = ANY(%s)
+                      AND NOT EXISTS (
+                          SELECT 1 FROM worker_badges wb
+                          WHERE wb.worker_id = a.worker_id AND wb.event_id = %s
+                            AND wb.badge_type = 'PROJECT'
+                      )
+                ),
+                issued AS (
+                    INSERT INTO worker_badges
+                    (worker_id, badge_type, badge_level, title, description, icon,
+                     event_id, batch_id, template_type, is_nft)
+                    SELECT worker_id, 'PROJECT', 1, %s, %s, %s, %s, %s, %s, TRUE
+                    FROM eligible
+                    ON CONFLICT DO NOTHING
+                    RETURNING id, worker_id
+                ),
+                logged AS (
+                    INSERT INTO audit_logs (action, entity_type, entity_id, actor_id, actor_type, details)
+                    SELECT 'BADGE_ISSUED', 'worker_badges', id, %s, 'ADMIN', %s::jsonb
+                    FROM issued
+                ),
+                counted AS (
+                    UPDATE project_nft_batches
+                    SET total_issued = (SELECT COUNT(*) FROM issued)
+                    WHERE id = %s
+                )
+                SELECT id, worker_id FROM issued ORDER BY id
+            """, (event_id, list(worker_ids), event_id,
+                  title, description, icon, event_id, batch_id, template_type,
+                  issued_by, json.dumps(audit_details),
+                  batch_id))
+            issued = [{"badge_id": row[0], "worker_id": row[1]} for row in cursor.fetchall()]
+            return {"batch_id": batch_id, "issued": issued}
+
     def get_completed_events(self, limit: int = 50) -> List[Dict]:
         """종료된 이벤트 목록 (배지 발급용)"""
         with self.get_connection() as conn:
@@ -2353,10 +2471,11 @@ class Database:
             return [dict(row) for row in cursor.fetchall()]
 
     def get_next_badge_progress(self, worker_id: int) -> Optional[Dict]:
-        """다음 배지까지의 진행률"""
-        stats = self.get_worker_stats_for_badges(worker_id)
-        badges = self.get_worker_badges(worker_id)
-        earned_types = {(b['badge_type'], b['badge_level']) for b in badges}
+        """다음 배지까지의 진행률 (배지 평가와 같은 카운터 사용)"""
+        stats = self.get_badge_counters([worker_id]).get(worker_id)
+        if not stats:
+            return None
+        earned_types = {(t, level) for _, t, level in self.get_earned_badge_keys([worker_id])}
 
         # 근무 횟수 배지 진행률
         work_thresholds = [(1, 1), (2, 10), (3, 50), (4, 100)]
@@ -2405,25 +2524,68 @@ class Database:
 
     def save_worker_location(self, worker_id: int, event_id: int,
                             latitude: float, longitude: float):
-        """근무자 GPS 위치 저장"""
+        """근무자 GPS 위치 저장 (단건, API는 services/location_ingest.py로 묶어서 저장)"""
+        point = (worker_id, event_id, latitude, longitude, datetime.now())
+        self.save_worker_locations([point], [point])
+
+    def save_worker_locations(self, latest: List[tuple], history: List[tuple]):
+        """
+        GPS 위치 일괄 저장 (단일 트랜잭션)
+
+        Args:
+            latest: 최신 위치 [(worker_id, event_id, lat, lng, recorded_at)] - (worker, event)당 1개
+            history: 이력으로 남길 위치 (같은 형식, 다운샘플링된 점)
+        """
         with self.get_connection() as conn:
             cursor = conn.cursor()
-            # 최근 10분 이내 위치 정보만 유지하고 새로운 위치 추가
-            cursor.execute("""
-                INSERT INTO worker_locations (worker_id, event_id, latitude, longitude)
-                VALUES (%s, %s, %s, %s)
-            """, (worker_id, event_id, latitude, longitude))
-            conn.commit()
+            if latest:
+                execute_values(cursor, """
+                    INSERT INTO worker_latest_locations AS l (worker_id, event_id, latitude, longitude, updated_at)
+                    VALUES %s
+                    ON CONFLICT (event_id, worker_id) DO UPDATE SET
+                        latitude = EXCLUDED.latitude,
+                        longitude = EXCLUDED.longitude,
+                        updated_at = EXCLUDED.updated_at
+                    WHERE l.updated_at <= EXCLUDED.updated_at
+                """, sorted(latest, key=lambda p: (p[1], p[0])))  # 잠금 순서 고정
+            if history:
+                buffer = io.StringIO()
+                for worker_id, event_id, latitude, longitude, recorded_at in history:
+                    buffer.write(f"{worker_id}\t{event_id}\t{latitude}\t{longitude}\t{recorded_at}\t{recorded_at}\n")
+                buffer.seek(0)
+                cursor.copy_expert("""
+                    COPY worker_locations (worker_id, event_id, latitude, longitude, created_at, updated_at)
+                    FROM STDIN
+                """, buffer)
+
+    def prune_worker_locations(self, before: datetime, batch_size: int = 10000) -> int:
+        """보존 기간이 지난 위치 이력/최신 위치 삭제 (배치 단위), 삭제된 이력 수 반환"""
+        deleted = 0
+        while True:
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute("""
+                    DELETE FROM worker_locations
+                    WHERE id IN (SELECT id FROM worker_locations WHERE created_at < %s LIMIT %s)
+                """, (before, batch_size))
+                count = cursor.rowcount
+            deleted += count
+            if count < batch_size:
+                break
+
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("DELETE FROM worker_latest_locations WHERE updated_at < %s", (before,))
+        return deleted
 
     def get_worker_location(self, worker_id: int, event_id: int) -> Optional[Dict]:
         """근무자의 최근 위치 정보 조회"""
         with self.get_connection() as conn:
             cursor = conn.cursor(cursor_factory=RealDictCursor)
             cursor.execute("""
-                SELECT * FROM worker_locations
+                SELECT worker_id, event_id, latitude, longitude, updated_at
+                FROM worker_latest_locations
                 WHERE worker_id = %s AND event_id = %s
-                ORDER BY updated_at DESC
-                LIMIT 1
             """, (worker_id, event_id))
             result = cursor.fetchone()
             return dict(result) if result else None
@@ -2449,67 +2611,87 @@ class Database:
 
         return R * c
 
-    def get_nearby_workers(self, event_id: int) -> List[Dict]:
+    def get_nearby_workers(self, event_id: int, max_age_minutes: int = 10) -> List[Dict]:
         """
-        행사 위치 근처에 있는 근무자 목록 조회
-        Returns: 범위 내 근무자 정보 (거리 포함)
+        행사 위치 근처에 있는 근무자 목록 조회 (지오펜스 평가)
+
+        근무자별 최신 위치(worker_latest_locations)에 대해 거리와 반경 포함 여부를
+        한 쿼리에서 일괄 계산한다.
+        Returns: 최근 위치가 있는 지원자 정보 (distance_meters, within_range 포함, 거리순)
         """
         with self.get_connection() as conn:
             cursor = conn.cursor(cursor_factory=RealDictCursor)
+            cursor.execute(f"""
+                WITH ev AS (
+                    SELECT location_lat::float8 AS lat, location_lng::float8 AS lng,
+                           COALESCE(location_radius, 100) AS radius
+                    FROM events
+                    WHERE id = %(event_id)s AND location_lat IS NOT NULL AND location_lng IS NOT NULL
+                ),
+                fenced AS (
+                    SELECT wl.worker_id, wl.latitude, wl.longitude, wl.updated_at,
+                           {haversine_sql('ev.lat', 'ev.lng', 'wl.latitude', 'wl.longitude')} AS distance,
+                           ev.radius
+                    FROM worker_latest_locations wl, ev
+                    WHERE wl.event_id = %(event_id)s
+                      AND wl.updated_at > NOW() - %(max_age)s * INTERVAL '1 minute'
+                )
+                SELECT
+                    f.worker_id,
+                    f.latitude,
+                    f.longitude,
+                    f.updated_at,
+                    w.name as worker_name,
+                    w.phone as worker_phone,
+                    a.check_in_time,
+                    a.check_out_time,
+                    round(f.distance)::int AS distance_meters,
+                    f.distance <= f.radius AS within_range
+                FROM fenced f
+                JOIN workers w ON f.worker_id = w.id
+                JOIN applications app ON app.worker_id = f.worker_id AND app.event_id = %(event_id)s
+                LEFT JOIN attendance a ON a.worker_id = f.worker_id AND a.event_id = %(event_id)s
+                ORDER BY f.distance
+            """, {"event_id": event_id, "max_age": max_age_minutes})
+            return [dict(row) for row in cursor.fetchall()]
 
-            # 행사 위치 정보 가져오기
-            cursor.execute("""
-                SELECT location_lat, location_lng, location_radius
-                FROM events WHERE id = %s
-            """, (event_id,))
-            event_location = cursor.fetchone()
-
-            if not event_location or not event_location['location_lat']:
-                return []
-
-            event_lat = float(event_location['location_lat'])
-            event_lng = float(event_location['location_lng'])
-            radius = event_location['location_radius'] or 100
+    def get_event_gps_board(self, event_id: int) -> List[Dict]:
+        """
+        행사 당일 GPS 보드 조회 (확정 근무자 + 최신 위치 + 출석, 1회 쿼리)
 
-            # 해당 행사에 지원한 근무자들의 최근 위치 정보 가져오기
-            cursor.execute("""
+        Returns: 행사 정보 컬럼(event_*)이 포함된 확정 근무자 행 목록.
+                 행사가 없으면 빈 목록, 확정 근무자가 없으면 application_id가 None인 행 1개
+        """
+        with self.get_connection() as conn:
+            cursor = conn.cursor(cursor_factory=RealDictCursor)
+            cursor.execute(f"""
                 SELECT
-                    wl.worker_id,
+                    e.title AS event_title,
+                    e.location_address AS event_address,
+                    e.location_lat AS event_lat,
+                    e.location_lng AS event_lng,
+                    COALESCE(e.location_radius, 100) AS event_radius,
+                    app.id AS application_id,
+                    app.worker_id,
+                    w.name AS worker_name,
+                    w.phone AS worker_phone,
                     wl.latitude,
                     wl.longitude,
-                    wl.updated_at,
-                    w.name as worker_name,
-                    w.phone as worker_phone,
+                    wl.updated_at AS location_updated_at,
+                    round({haversine_sql('e.location_lat', 'e.location_lng', 'wl.latitude', 'wl.longitude')})::int
+                        AS distance_meters,
+                    a.id AS attendance_id,
                     a.check_in_time,
                     a.check_out_time
-                FROM worker_locations wl
-                JOIN workers w ON wl.worker_id = w.id
-                JOIN applications app ON app.worker_id = w.id AND app.event_id = %s
-                LEFT JOIN attendance a ON a.worker_id = w.id AND a.event_id = %s
-                WHERE wl.event_id = %s
-                    AND wl.updated_at > NOW() - INTERVAL '10 minutes'
-                ORDER BY wl.updated_at DESC
-            """, (event_id, event_id, event_id))
-
-            workers = []
-            for row in cursor.fetchall():
-                worker = dict(row)
-
-                # 거리 계산
-                distance = self.calculate_distance(
-                    event_lat, event_lng,
-                    float(worker['latitude']), float(worker['longitude'])
-                )
-
-                worker['distance_meters'] = int(distance)
-                worker['within_range'] = distance <= radius
-
-                workers.append(worker)
-
-            # 거리순으로 정렬
-            workers.sort(key=lambda x: x['distance_meters'])
-
-            return workers
+                FROM events e
+                LEFT JOIN (applications app JOIN workers w ON w.id = app.worker_id)
+                    ON app.event_id = e.id AND app.status = 'CONFIRMED'
+                LEFT JOIN worker_latest_locations wl ON wl.event_id = e.id AND wl.worker_id = app.worker_id
+                LEFT JOIN attendance a ON a.application_id = app.id
+                WHERE e.id = %s
+                ORDER BY app.id
+            """, (event_id,))
+            return [dict(row) for row in cursor.fetchall()]
 
     def create_attendance_approval(self, worker_id: int, event_id: int,
                                    approval_type: str, distance_meters: int = None) -> int:
@@ -0,0 +1,118 @@
+"""
+LISTEN/NOTIFY 실시간 피드
+
+프로세스마다 채널당 LISTEN 연결 하나로 구독하고, 페이로드의 키(worker_id, event_id 등)별
+구독 큐로 분배한다. 변경이 없으면 연결만 유지한 채 기다리므로 구독자가 많아도 DB 부하가 없다.
+- worker_notifications: 알림 생성/읽음 (Database._publish_*)
+- attendance_changes: 출석 INSERT/UPDATE/DELETE (migrations/003 트리거)
+"""
+import asyncio
+import json
+import logging
+from collections import defaultdict
+from typing import Dict, Optional, Set
+
+from db import Database
+
+logger = logging.getLogger(__name__)
+
+
+class ChannelHub:
+    """LISTEN 연결 1개 -> 키별 구독 큐 분배"""
+
+    RECONNECT_DELAY = 5.0
+    QUEUE_SIZE = 100
+
+    def __init__(self, db: Database, channel: str, key: str):
+        self.db = db
+        self.channel = channel
+        self.key = key
+        self._subscribers: Dict[int, Set[asyncio.Queue]] = defaultdict(set)
+        self._task: Optional[asyncio.Task] = None
+
+    def subscribe(self, key_value: int) -> asyncio.Queue:
+        """키 값(근무자 ID, 행사 ID 등) 이벤트 구독 (첫 구독 시 LISTEN 시작)"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._listen())
+        queue = asyncio.Queue(maxsize=self.QUEUE_SIZE)
+        self._subscribers[key_value].add(queue)
+        return queue
+
+    def unsubscribe(self, key_value: int, queue: asyncio.Queue):
+        queues = self._subscribers.get(key_value)
+        if queues is not None:
+            queues.discard(queue)
+            if not queues:
+                del self._subscribers[key_value]
+
+    async def stop(self):
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _listen(self):
+        loop = asyncio.get_running_loop()
+        reconnecting = False
+        while True:
+            conn = None
+            fd = None
+            try:
+                conn = await asyncio.to_thread(self.db.listen, self.channel)
+                fd = conn.fileno()
+                lost = loop.create_future()
+                loop.add_reader(fd, self._on_readable, conn, lost)
+                logger.info(f"Listening on {self.channel}")
+                if reconnecting:
+                    # 끊긴 동안 놓친 이벤트가 있을 수 있으므로 클라이언트에 재조회 요청
+                    self._broadcast({"event": "resync"})
+                await lost
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Listener on {self.channel} lost: {e}")
+            finally:
+                if fd is not None:
+                    loop.remove_reader(fd)
+                if conn is not None:
+                    conn.close()
+            reconnecting = True
+            await asyncio.sleep(self.RECONNECT_DELAY)
+
+    def _on_readable(self, conn, lost: asyncio.Future):
+        try:
+            conn.poll()
+        except Exception as e:
+            if not lost.done():
+                lost.set_exception(e)
+            return
+        while conn.notifies:
+            self._dispatch(conn.notifies.pop(0).payload)
+
+    def _dispatch(self, payload: str):
+        try:
+            event = json.loads(payload)
+        except ValueError:
+            logger.warning(f"Invalid {self.channel} payload: {payload[:100]}")
+            return
+        for queue in list(self._subscribers.get(event.get(self.key), ())):
+            self._put(queue, event)
+
+    def _broadcast(self, event: dict):
+        for queues in list(self._subscribers.values()):
+            for queue in list(queues):
+                self._put(queue, event)
+
+    @staticmethod
+    def _put(queue: asyncio.Queue, event: dict):
+        try:
+            queue.put_nowait(event)
+        except asyncio.QueueFull:
+            # 느린 클라이언트: 이벤트를 버리고 재조회 요청으로 대체
+            while not queue.empty():
+                queue.get_nowait()
+            queue.put_nowait({"event": "resync"})
+
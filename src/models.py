@@ -133,3 +133,83 @@ class ParsedEvent:
     application_method: str
     manager: str
     missing_fields: list  # 누락된 필드
+
+
+# ===== 목록 조회용 행 (DB 목록 메서드 반환값) =====
+class Row:
+    """
+    슬롯 기반 목록 행 - 필요한 컬럼만 담고, 기존 dict 사용처와 호환되도록
+    row['col'], row.get('col'), dict(row), **row 를 지원한다.
+    필드 순서 = SELECT 컬럼 순서 (cls.columns())
+    """
+    __slots__ = ()
+
+    def __getitem__(self, key: str):
+        if key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def get(self, key: str, default=None):
+        return getattr(self, key) if key in self.__slots__ else default
+
+    def keys(self):
+        return self.__slots__
+
+    def __contains__(self, key) -> bool:
+        return key in self.__slots__
+
+    @classmethod
+    def columns(cls, alias: str = "") -> str:
+        """SELECT 컬럼 목록 (alias 지정 시 'w.id, w.name, ...')"""
+        prefix = f"{alias}." if alias else ""
+        return ", ".join(prefix + name for name in cls.__slots__)
+
+
+@dataclass(slots=True)
+class WorkerListItem(Row):
+    """근무자 목록 행 (주민번호/비밀번호/통계 컬럼 제외)"""
+    id: int
+    telegram_id: Optional[int]
+    name: str
+    phone: str
+    email: Optional[str]
+    birth_date: Optional[str]
+    gender: Optional[str]
+    residence: Optional[str]
+    region_id: Optional[int]
+    bank_name: Optional[str]
+    bank_account: Optional[str]
+    driver_license: bool
+    security_cert: bool
+    face_photo_file_id: Optional[str]
+    contract_signed: bool
+    is_admin: bool
+    created_at: Optional[datetime]
+
+
+@dataclass(slots=True)
+class WorkerRef(Row):
+    """근무자 ID/이름 (배치 순회용)"""
+    id: int
+    name: str
+
+
+@dataclass(slots=True)
+class ApplicationListItem(Row):
+    """행사별 지원자 목록 행 (지원 + 근무자 표시 정보)"""
+    id: int
+    event_id: int
+    worker_id: int
+    status: str
+    applied_at: Optional[datetime]
+    confirmed_at: Optional[datetime]
+    confirmed_by: Optional[int]
+    rejection_reason: Optional[str]
+    notified: bool
+    cancelled_at: Optional[datetime]
+    cancel_reason: Optional[str]
+    name: str
+    phone: str
+    telegram_id: Optional[int]
+    residence: Optional[str]
+    face_photo_file_id: Optional[str]
@@ -0,0 +1,137 @@
+"""
+텔레그램 알림 발송기 (notification_deliveries 큐 처리)
+
+관리자 봇/API는 Database.enqueue_notification(s)로 큐에 넣기만 하고,
+발송기가 텔레그램 제한(전체 초당 약 30건, 채팅당 초당 1건)을 지키며 병렬로 발송한다.
+429 응답은 retry_after만큼 쉬었다가 재시도
+"""
+import asyncio
+import logging
+from collections import defaultdict
+from typing import Dict, List, Optional
+
+from telegram import Bot
+from telegram.error import BadRequest, Forbidden, RetryAfter
+
+from db import Database
+
+logger = logging.getLogger(__name__)
+
+
+class TelegramDispatcher:
+    """notification_deliveries 큐를 비우는 비동기 발송기"""
+
+    GLOBAL_RATE = 25            # 전체 초당 발송 수 (텔레그램 한도 30 이하)
+    PER_CHAT_INTERVAL = 1.0     # 같은 채팅 연속 발송 간격 (초)
+    BATCH_SIZE = 100
+    POLL_INTERVAL = 5.0         # 깨우는 신호가 없을 때 큐 확인 주기 (초)
+    MAX_ATTEMPTS = 5
+
+    def __init__(self, db: Database, bot: Bot):
+        self.db = db
+        self.bot = bot
+        self._wake = asyncio.Event()
+        self._slot_lock = asyncio.Lock()
+        self._next_slot = 0.0
+        self._paused_until = 0.0
+        self._task: Optional[asyncio.Task] = None
+
+    def wake(self):
+        """새 알림이 큐에 들어왔음을 알림 (즉시 발송 시작)"""
+        self._wake.set()
+
+    def start(self) -> asyncio.Task:
+        """현재 이벤트 루프에서 발송 루프 시작"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self.run())
+        return self._task
+
+    async def stop(self):
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+    async def run(self):
+        logger.info("Notification dispatcher started")
+        while True:
+            try:
+                sent = await self.drain_once()
+                if sent >= self.BATCH_SIZE:
+                    continue
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Notification dispatch failed: {e}", exc_info=True)
+
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=self.POLL_INTERVAL)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+
+    async def drain_once(self) -> int:
+        """큐에서 한 묶음을 가져와 채팅별로 병렬 발송, 처리한 건수 반환"""
+        deliveries = await asyncio.to_thread(self.db.claim_notification_deliveries, self.BATCH_SIZE)
+        if not deliveries:
+            return 0
+
+        by_chat: Dict[int, List[dict]] = defaultdict(list)
+        for delivery in deliveries:
+            by_chat[delivery["chat_id"]].append(delivery)
+
+        results = await asyncio.gather(*(self._send_chat(items) for items in by_chat.values()))
+        sent_ids = [delivery_id for ids in results for delivery_id in ids]
+        await asyncio.to_thread(self.db.complete_notification_deliveries, sent_ids)
+
+        logger.info(f"Notifications dispatched: {len(sent_ids)}/{len(deliveries)}")
+        return len(deliveries)
+
+    async def _acquire_slot(self):
+        """전체 발송 속도 제한 (토큰 간격 방식)"""
+        loop = asyncio.get_running_loop()
+        async with self._slot_lock:
+            now = loop.time()
+            start = max(now, self._next_slot, self._paused_until)
+            self._next_slot = start + 1.0 / self.GLOBAL_RATE
+        if start > now:
+            await asyncio.sleep(start - now)
+
+    async def _send_chat(self, deliveries: List[dict]) -> List[int]:
+        """한 채팅의 알림을 순서대로 발송, 성공한 delivery ID 반환"""
+        loop = asyncio.get_running_loop()
+        sent = []
+        last_sent = None
+
+        for delivery in deliveries:
+            if last_sent is not None:
+                wait = self.PER_CHAT_INTERVAL - (loop.time() - last_sent)
+                if wait > 0:
+                    await asyncio.sleep(wait)
+
+            await self._acquire_slot()
+            try:
+                await self.bot.send_message(chat_id=delivery["chat_id"], text=delivery["text"])
+                sent.append(delivery["id"])
+            except RetryAfter as e:
+                retry_after = e.retry_after
+                retry_after = retry_after.total_seconds() if hasattr(retry_after, "total_seconds") else float(retry_after)
+                # 한도 초과: 전체 발송을 잠시 멈추고 이 알림은 그 이후로 재예약
+                self._paused_until = max(self._paused_until, loop.time() + retry_after)
+                logger.warning(f"Telegram flood limit, retry after {retry_after}s")
+                await asyncio.to_thread(self.db.retry_notification_delivery,
+                                        delivery["id"], retry_after, str(e))
+            except (Forbidden, BadRequest) as e:
+                # 봇 차단, 존재하지 않는 채팅 등은 재시도해도 실패
+                logger.warning(f"Notification {delivery['id']} to {delivery['chat_id']} failed: {e}")
+                await asyncio.to_thread(self.db.fail_notification_delivery, delivery["id"], str(e))
+            except Exception as e:
+                delay = min(3600, 5 * 2 ** delivery["attempts"])
+                logger.error(f"Notification {delivery['id']} send error (attempt {delivery['attempts']}): {e}")
+                await asyncio.to_thread(self.db.retry_notification_delivery,
+                                        delivery["id"], delay, str(e), self.MAX_ATTEMPTS)
+            last_sent = loop.time()
+
+        return sent
@@ -1,93 +1,156 @@
 """
 엑셀 급여 명세서 생성
+
+급여 명세서는 write-only 워크북(행 단위 스트리밍)과 이름 있는 공용 스타일로 작성해
+행 수와 무관하게 메모리 사용이 일정하다. 작성 메서드는 fileobj에 기록하므로 HTTP 응답으로
+바로 내보낼 때는 api/services/file_streams.iter_file로 청크 단위로 받는다.
 """
+import codecs
+import csv
+import io
 import os
 from datetime import datetime
-from typing import List, Dict
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 import logging
-from openpyxl import Workbook
-from openpyxl.styles import Font, Alignment, Border, Side, PatternFill
 from utils import calculate_net_pay, format_phone, get_bank_code, extract_yymmdd, now_kst
 
 logger = logging.getLogger(__name__)
 
+XLSX_MEDIA_TYPE = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+
+# 급여 명세서 컬럼 (헤더, 너비)
+PAYROLL_COLUMNS = [
+    ("날짜", 12),
+    ("행사명", 20),
+    ("이름", 12),
+    ("생년월일", 12),
+    ("은행", 12),
+    ("은행코드", 12),
+    ("계좌번호", 18),
+    ("3.3%공제후금액", 18),
+    ("세전금액", 15),
+    ("연락처", 15),
+]
+PAYROLL_MONEY_COLUMNS = (7, 8)  # 0부터: 3.3%공제후금액, 세전금액
+
+# 기간(월) 급여 정산 컬럼 - 근무자/계좌별 합계
+PERIOD_COLUMNS = [
+    ("이름", 12),
+    ("생년월일", 12),
+    ("연락처", 15),
+    ("은행", 12),
+    ("은행코드", 10),
+    ("계좌번호", 18),
+    ("근무건수", 10),
+    ("세전합계", 15),
+    ("공제액(3.3%)", 15),
+    ("실지급액", 15),
+]
+PERIOD_MONEY_COLUMNS = (6, 7, 8, 9)
+
+# 은행 대량이체 업로드 양식 (은행 업로드는 CP949 CSV)
+BANK_TRANSFER_HEADERS = ["입금은행코드", "입금계좌번호", "이체금액", "예금주명", "받는통장표시", "보내는통장표시"]
+BANK_TRANSFER_ENCODING = "cp949"
+CSV_ENCODING = "utf-8-sig"  # 엑셀에서 바로 열리도록 BOM 포함
+
+# CSV 인코딩/기록 단위
+CSV_CHUNK_SIZE = 64 * 1024
+
+
+@lru_cache()
+def _thin_border():
+    """테두리 스타일 (공용 객체 1개)"""
+    from openpyxl.styles import Border, Side
+
+    thin = Side(border_style="thin", color="000000")
+    return Border(left=thin, right=thin, top=thin, bottom=thin)
+
+
+def _add_payroll_styles(wb):
+    """급여 명세서 공용 스타일 등록 (셀에는 이름만 지정)"""
+    from openpyxl.styles import Alignment, Font, NamedStyle, PatternFill
+
+    center = Alignment(horizontal='center', vertical='center')
+    total_fill = PatternFill(start_color="E7E6E6", end_color="E7E6E6", fill_type="solid")
+    for style in (
+        NamedStyle("payroll_title", font=Font(size=16, bold=True), alignment=center),
+        NamedStyle("payroll_info", alignment=Alignment(horizontal='center')),
+        NamedStyle("payroll_header", font=Font(bold=True, color="FFFFFF"),
+                   fill=PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid"),
+                   alignment=center, border=_thin_border()),
+        NamedStyle("payroll_cell", alignment=center, border=_thin_border()),
+        NamedStyle("payroll_money", alignment=center, border=_thin_border(), number_format='#,##0'),
+        NamedStyle("payroll_total", font=Font(bold=True), fill=total_fill,
+                   alignment=center, border=_thin_border()),
+        NamedStyle("payroll_total_money", font=Font(bold=True), fill=total_fill,
+                   border=_thin_border(), number_format='#,##0'),
+    ):
+        wb.add_named_style(style)
+
+
+def workers_from_attendances(attendances: List[Dict]) -> Dict[int, Dict]:
+    """list_attendance_by_event 결과(근무자 컬럼 포함)로 근무자 dict 구성"""
+    return {
+        att['worker_id']: {
+            'name': att.get('worker_name'),
+            'phone': att.get('phone'),
+            'birth_date': att.get('birth_date'),
+            'bank_name': att.get('bank_name'),
+            'bank_account': att.get('bank_account'),
+        }
+        for att in attendances
+    }
 
-class PayrollExporter:
-    """급여 명세서 엑셀 생성 클래스"""
 
-    def __init__(self, export_dir: str):
-        self.export_dir = export_dir
-        os.makedirs(export_dir, exist_ok=True)
+def _write_csv(fileobj, header: List[str], rows: Iterable[list], encoding: str) -> int:
+    """CSV를 청크 단위로 인코딩해 바이너리 fileobj에 기록, 기록한 행 수 반환"""
+    encoder = codecs.getincrementalencoder(encoding)(errors='replace')
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
 
-    def generate_event_payroll(self, event: Dict, attendances: List[Dict],
-                                workers: Dict[int, Dict]) -> str:
-        """
-        행사별 급여 명세서 생성
+    def flush(final=False):
+        fileobj.write(encoder.encode(buffer.getvalue(), final))
+        buffer.seek(0)
+        buffer.truncate()
 
-        Args:
-            event: 행사 정보
-            attendances: 출석 기록 리스트
-            workers: 근무자 정보 dict (worker_id -> worker)
+    writer.writerow(header)
+    count = 0
+    for row in rows:
+        writer.writerow(row)
+        count += 1
+        if buffer.tell() >= CSV_CHUNK_SIZE:
+            flush()
+    flush(final=True)
+    return count
 
-        Returns:
-            str: 생성된 파일 경로
-        """
-        wb = Workbook()
-        ws = wb.active
-        ws.title = "급여명세서"
-
-        # 제목
-        ws.merge_cells('A1:J1')
-        title_cell = ws['A1']
-        title_cell.value = f"[{event['title']}] 급여 명세서"
-        title_cell.font = Font(size=16, bold=True)
-        title_cell.alignment = Alignment(horizontal='center', vertical='center')
-
-        # 행사 정보
-        ws.merge_cells('A2:J2')
-        info_cell = ws['A2']
-        info_cell.value = f"행사일: {event['event_date']} | 장소: {event['location']}"
-        info_cell.alignment = Alignment(horizontal='center')
-
-        # 헤더
-        headers = [
-            "날짜", "행사명", "이름", "생년월일", "은행", "은행코드",
-            "계좌번호", "3.3%공제후금액", "세전금액", "연락처"
-        ]
 
-        header_row = 4
-        for col, header in enumerate(headers, start=1):
-            cell = ws.cell(row=header_row, column=col)
-            cell.value = header
-            cell.font = Font(bold=True, color="FFFFFF")
-            cell.fill = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
-            cell.alignment = Alignment(horizontal='center', vertical='center')
-            cell.border = self._get_border()
-
-        # 데이터 입력
-        row = header_row + 1
-        total_deduction = 0
-        total_gross_pay = 0
+class PayrollExporter:
+    """급여 명세서 엑셀 생성 클래스"""
 
+    def __init__(self, export_dir: Optional[str] = None):
+        self.export_dir = export_dir
+        if export_dir:
+            os.makedirs(export_dir, exist_ok=True)
+
+    # ===== 급여 명세서 =====
+    def payroll_filename(self, event: Dict) -> str:
+        return f"급여명세_{event['short_code']}_{now_kst().strftime('%Y%m%d_%H%M%S')}.xlsx"
+
+    def event_payroll_rows(self, event: Dict, attendances: Iterable[Dict],
+                           workers: Dict[int, Dict]) -> Iterator[list]:
+        """행사 급여 행 (PAYROLL_COLUMNS 순서)"""
         # 날짜를 YYMMDD 형식으로 변환
         yymmdd_date = extract_yymmdd(event['event_date'])
+        gross_pay = event['pay_amount']
+        net_pay = int(gross_pay * 0.967)  # 3.3% 공제 후 금액
 
         for att in attendances:
             worker = workers.get(att['worker_id'], {})
-
-            # 급여 계산
-            gross_pay = event['pay_amount']
-            net_pay = int(gross_pay * 0.967)  # 3.3% 공제 후 금액
-
-            total_gross_pay += gross_pay
-            total_deduction += net_pay
-
             # 은행코드 자동 매칭
-            bank_name = worker.get('bank_name', '')
+            bank_name = worker.get('bank_name', '') or ''
             bank_code = get_bank_code(bank_name) if bank_name else ''
-
-            # 데이터
-            data_row = [
+            yield [
                 yymmdd_date,  # 날짜 (YYMMDD)
                 event['title'],  # 행사명
                 worker.get('name', ''),  # 이름
@@ -97,101 +160,216 @@ class PayrollExporter:
                 worker.get('bank_account', ''),  # 계좌번호
                 net_pay,  # 3.3% 공제 후 금액 (자동 계산)
                 gross_pay,  # 세전금액
-                format_phone(worker.get('phone', ''))  # 연락처
+                format_phone(worker.get('phone', '') or '')  # 연락처
             ]
 
-            for col, value in enumerate(data_row, start=1):
-                cell = ws.cell(row=row, column=col)
-                cell.value = value
-                cell.alignment = Alignment(horizontal='center', vertical='center')
-                cell.border = self._get_border()
-
-                # 금액 컬럼은 숫자 포맷
-                if col in [8, 9]:
-                    cell.number_format = '#,##0'
-
-            row += 1
-
-        # 합계 행
-        total_row = row
-        ws.merge_cells(f'A{total_row}:G{total_row}')
-        total_cell = ws.cell(row=total_row, column=1)
-        total_cell.value = f"합계 ({len(attendances)}명)"
-        total_cell.font = Font(bold=True)
-        total_cell.alignment = Alignment(horizontal='center', vertical='center')
-        total_cell.fill = PatternFill(start_color="E7E6E6", end_color="E7E6E6", fill_type="solid")
-        total_cell.border = self._get_border()
-
-        for col in range(1, 8):
-            ws.cell(row=total_row, column=col).border = self._get_border()
-            ws.cell(row=total_row, column=col).fill = PatternFill(start_color="E7E6E6", end_color="E7E6E6", fill_type="solid")
-
-        # 합계 금액 - 3.3% 공제 후 금액
-        ws.cell(row=total_row, column=8).value = total_deduction
-        ws.cell(row=total_row, column=8).number_format = '#,##0'
-        ws.cell(row=total_row, column=8).font = Font(bold=True)
-        ws.cell(row=total_row, column=8).border = self._get_border()
-        ws.cell(row=total_row, column=8).fill = PatternFill(start_color="E7E6E6", end_color="E7E6E6", fill_type="solid")
-
-        # 합계 금액 - 세전금액
-        ws.cell(row=total_row, column=9).value = total_gross_pay
-        ws.cell(row=total_row, column=9).number_format = '#,##0'
-        ws.cell(row=total_row, column=9).font = Font(bold=True)
-        ws.cell(row=total_row, column=9).border = self._get_border()
-        ws.cell(row=total_row, column=9).fill = PatternFill(start_color="E7E6E6", end_color="E7E6E6", fill_type="solid")
-
-        # 마지막 컬럼 (연락처) - 빈칸
-        ws.cell(row=total_row, column=10).border = self._get_border()
-        ws.cell(row=total_row, column=10).fill = PatternFill(start_color="E7E6E6", end_color="E7E6E6", fill_type="solid")
-
-        # 컬럼 너비 조정
-        column_widths = {
-            'A': 12,  # 날짜
-            'B': 20,  # 행사명
-            'C': 12,  # 이름
-            'D': 12,  # 생년월일
-            'E': 12,  # 은행
-            'F': 12,  # 은행코드
-            'G': 18,  # 계좌번호
-            'H': 18,  # 3.3%공제후금액
-            'I': 15,  # 세전금액
-            'J': 15   # 연락처
-        }
-        for col, width in column_widths.items():
-            ws.column_dimensions[col].width = width
+    def write_payroll(self, fileobj, title: str, subtitle: str, rows: Iterable[list],
+                      sheet_title: str = "급여명세서", columns: List[tuple] = PAYROLL_COLUMNS,
+                      money_columns: tuple = PAYROLL_MONEY_COLUMNS) -> int:
+        """
+        급여 명세서 작성 (write-only, 행 단위 스트리밍)
+
+        Args:
+            fileobj: 기록할 바이너리 파일 객체 (seek 불필요)
+            title: 제목 행
+            subtitle: 부제 행
+            rows: columns 순서의 행 (제너레이터 가능)
+            columns: (헤더, 너비) 목록
+            money_columns: 금액 서식 + 합계를 낼 컬럼 (0부터)
 
-        # 행 높이
+        Returns:
+            int: 기록한 행 수
+        """
+        from openpyxl import Workbook
+        from openpyxl.cell import WriteOnlyCell
+        from openpyxl.utils import get_column_letter
+
+        wb = Workbook(write_only=True)
+        _add_payroll_styles(wb)
+        ws = wb.create_sheet(sheet_title)
+
+        def cell(value, style):
+            c = WriteOnlyCell(ws, value=value)
+            c.style = style
+            return c
+
+        last_col = get_column_letter(len(columns))
+        for idx, (_, width) in enumerate(columns, start=1):
+            ws.column_dimensions[get_column_letter(idx)].width = width
         ws.row_dimensions[1].height = 30
         ws.row_dimensions[2].height = 20
-        ws.row_dimensions[header_row].height = 25
+        ws.row_dimensions[4].height = 25
+        ws.merged_cells.add(f'A1:{last_col}1')
+        ws.merged_cells.add(f'A2:{last_col}2')
+
+        # 제목, 정보, 빈 행, 헤더
+        ws.append([cell(title, "payroll_title")])
+        ws.append([cell(subtitle, "payroll_info")])
+        ws.append([])
+        ws.append([cell(header, "payroll_header") for header, _ in columns])
+
+        count = 0
+        totals = dict.fromkeys(money_columns, 0)
+        for values in rows:
+            ws.append([
+                cell(value, "payroll_money" if idx in totals else "payroll_cell")
+                for idx, value in enumerate(values)
+            ])
+            for idx in totals:
+                totals[idx] += values[idx] or 0
+            count += 1
+
+        # 합계 행 (첫 금액 컬럼 앞까지 병합)
+        total_row = 5 + count
+        first_money = min(money_columns)
+        ws.merged_cells.add(f'A{total_row}:{get_column_letter(first_money)}{total_row}')
+        ws.append([
+            cell(f"합계 ({count}명)", "payroll_total") if idx == 0
+            else cell(totals[idx], "payroll_total_money") if idx in totals
+            else cell(None, "payroll_total")
+            for idx in range(len(columns))
+        ])
+
+        wb.save(fileobj)
+        return count
+
+    def write_event_payroll(self, fileobj, event: Dict, attendances: List[Dict],
+                            workers: Dict[int, Dict]) -> int:
+        """행사별 급여 명세서를 fileobj에 작성"""
+        return self.write_payroll(
+            fileobj,
+            f"[{event['title']}] 급여 명세서",
+            f"행사일: {event['event_date']} | 장소: {event['location']}",
+            self.event_payroll_rows(event, attendances, workers),
+        )
 
-        # 파일명 생성 (한국 시간)
-        filename = f"급여명세_{event['short_code']}_{now_kst().strftime('%Y%m%d_%H%M%S')}.xlsx"
-        filepath = os.path.join(self.export_dir, filename)
+    def generate_event_payroll(self, event: Dict, attendances: List[Dict],
+                                workers: Dict[int, Dict]) -> str:
+        """
+        행사별 급여 명세서 생성
 
-        # 저장
-        wb.save(filepath)
+        Args:
+            event: 행사 정보
+            attendances: 출석 기록 리스트
+            workers: 근무자 정보 dict (worker_id -> worker)
+
+        Returns:
+            str: 생성된 파일 경로
+        """
+        filepath = os.path.join(self.export_dir, self.payroll_filename(event))
+        with open(filepath, 'wb') as f:
+            self.write_event_payroll(f, event, attendances, workers)
         logger.info(f"Payroll exported: {filepath}")
 
         return filepath
 
-    def _get_border(self) -> Border:
+    def _get_border(self):
         """테두리 스타일"""
-        thin = Side(border_style="thin", color="000000")
-        return Border(left=thin, right=thin, top=thin, bottom=thin)
+        return _thin_border()
+
+    # ===== 기간 급여 정산 =====
+    def period_filename(self, label: str, kind: str = "xlsx") -> str:
+        """kind: xlsx / csv / bank (대량이체)"""
+        timestamp = now_kst().strftime('%Y%m%d_%H%M%S')
+        if kind == "bank":
+            return f"대량이체_{label}_{timestamp}.csv"
+        return f"급여정산_{label}_{timestamp}.{kind}"
+
+    def period_payroll_rows(self, rows: Iterable[Dict]) -> Iterator[list]:
+        """Database.iter_period_payroll 결과 → PERIOD_COLUMNS 순서의 행"""
+        for row in rows:
+            bank_name = row.get('bank_name') or ''
+            gross_pay = row['gross_pay'] or 0
+            net_pay = row['net_pay'] or 0
+            yield [
+                row.get('name') or '',
+                row.get('birth_date') or '',
+                format_phone(row.get('phone') or ''),
+                bank_name,
+                get_bank_code(bank_name) if bank_name else '',
+                row.get('bank_account') or '',
+                row['event_count'],
+                gross_pay,
+                gross_pay - net_pay,
+                net_pay,
+            ]
+
+    def write_period_payroll(self, fileobj, label: str, rows: Iterable[Dict]) -> int:
+        """기간 급여 정산 엑셀 (근무자별 합계)"""
+        return self.write_payroll(
+            fileobj,
+            f"{label} 급여 정산",
+            f"퇴근 완료 출석 기준 | 출력: {now_kst().strftime('%Y-%m-%d %H:%M')}",
+            self.period_payroll_rows(rows),
+            sheet_title="급여정산",
+            columns=PERIOD_COLUMNS,
+            money_columns=PERIOD_MONEY_COLUMNS,
+        )
+
+    def write_period_payroll_csv(self, fileobj, rows: Iterable[Dict]) -> int:
+        """기간 급여 정산 CSV"""
+        return _write_csv(fileobj, [header for header, _ in PERIOD_COLUMNS],
+                          self.period_payroll_rows(rows), CSV_ENCODING)
+
+    def write_bank_transfer(self, fileobj, rows: Iterable[Dict], memo: str,
+                            sender_memo: str = "") -> Tuple[int, List[Dict]]:
+        """
+        은행 대량이체 파일 작성 (실지급액 기준)
+
+        은행코드를 찾지 못했거나 계좌번호가 없는 근무자는 이체 파일에서 빼고 따로 반환한다.
+
+        Returns:
+            tuple: (이체 건수, 제외된 행 목록)
+        """
+        skipped = []
+
+        def transfers():
+            for row in rows:
+                bank_code = get_bank_code(row.get('bank_name') or '') if row.get('bank_name') else ''
+                account = ''.join(ch for ch in (row.get('bank_account') or '') if ch.isdigit())
+                if not bank_code or not account or not row['net_pay']:
+                    skipped.append(row)
+                    continue
+                yield [bank_code, account, row['net_pay'], row.get('name') or '', memo, sender_memo or row.get('name') or '']
+
+        count = _write_csv(fileobj, BANK_TRANSFER_HEADERS, transfers(), BANK_TRANSFER_ENCODING)
+        if skipped:
+            logger.warning(f"Bank transfer: {len(skipped)} workers skipped (missing bank code/account)")
+        return count, skipped
+
+    # ===== 행사 보고서 =====
+    def report_filename(self, event: Dict) -> str:
+        return f"행사보고서_{event.get('short_code', 'report')}_{now_kst().strftime('%Y%m%d_%H%M%S')}.xlsx"
 
     def generate_event_report(self, event: Dict, attendances: List[Dict],
                                workers: Dict[int, Dict],
                                billing_items: List[Dict] = None,
                                expense_items: List[Dict] = None,
                                report_info: Dict = None) -> str:
+        """행사 보고서 파일 생성, 파일 경로 반환"""
+        filepath = os.path.join(self.export_dir, self.report_filename(event))
+        with open(filepath, 'wb') as f:
+            self.write_event_report(f, event, attendances, workers, billing_items, expense_items, report_info)
+        logger.info(f"Event report exported: {filepath}")
+
+        return filepath
+
+    def write_event_report(self, fileobj, event: Dict, attendances: List[Dict],
+                           workers: Dict[int, Dict],
+                           billing_items: List[Dict] = None,
+                           expense_items: List[Dict] = None,
+                           report_info: Dict = None):
         """
-        행사 보고서 생성 (LK PRIVATE 형식) - 개선된 버전
+        행사 보고서 작성 (LK PRIVATE 형식) - 개선된 버전
+        (셀 병합/수식 위치가 고정된 양식이라 일반 워크북 사용, 행 수는 행사 인원 규모)
         - 컬럼 너비 확대 (텍스트 짤림 방지)
         - 부가세 10% 자동계산 수식
         - 합계 자동계산 수식
         - 특이사항 빈칸 추가
         """
+        from openpyxl import Workbook
+        from openpyxl.styles import Font, Alignment, PatternFill
+
         wb = Workbook()
         ws = wb.active
         ws.title = "행사보고서"
@@ -673,12 +851,4 @@ class PayrollExporter:
         for col, width in column_widths.items():
             ws.column_dimensions[col].width = width
 
-        # 파일명 생성
-        filename = f"행사보고서_{event.get('short_code', 'report')}_{now_kst().strftime('%Y%m%d_%H%M%S')}.xlsx"
-        filepath = os.path.join(self.export_dir, filename)
-
-        # 저장
-        wb.save(filepath)
-        logger.info(f"Event report exported: {filepath}")
-
-        return filepath
+        wb.save(fileobj)
@@ -188,7 +188,7 @@ def format_phone(phone: str) -> str:
     Returns:
         str: "010-1234-5678"
     """
-    phone = phone.replace('-', '').replace(' ', '')
+    phone = normalize_phone(phone)
     if len(phone) == 11:
         return f"{phone[:3]}-{phone[3:7]}-{phone[7:]}"
     elif len(phone) == 10:
@@ -196,6 +196,19 @@ def format_phone(phone: str) -> str:
     return phone
 
 
+def normalize_phone(phone: str) -> str:
+    """
+    전화번호 정규화 (하이픈/공백 제거, workers.phone_normalized와 같은 규칙)
+
+    Args:
+        phone: "010-1234-5678" or "010 1234 5678"
+
+    Returns:
+        str: "01012345678"
+    """
+    return phone.replace('-', '').replace(' ', '')
+
+
 def calculate_net_pay(gross_pay: int, tax_rate: float = 0.033) -> int:
     """
     실지급액 계산 (3.3% 공제)
@@ -221,7 +234,7 @@ def validate_phone(phone: str) -> bool:
         bool: 유효 여부
     """
     import re
-    phone = phone.replace('-', '').replace(' ', '')
+    phone = normalize_phone(phone)
     return bool(re.match(r'^01[0-9]{8,9}$', phone))
 
 
@@ -3,14 +3,13 @@ WorkProof Token (WPT) 서비스
 - 커스토디얼 지갑 관리
 - 토큰 발행/소각
 - 크레딧 시스템 통합
+- web3 import와 RPC 클라이언트/컨트랙트 생성은 첫 사용 시점으로 미룸
 """
 import os
 import logging
+from functools import cached_property
 from typing import Dict, Optional
-from web3 import Web3
-from web3.middleware import geth_poa_middleware
 import json
-from eth_account import Account
 
 logger = logging.getLogger(__name__)
 
@@ -112,17 +111,31 @@ class WPTService:
             self.enabled = False
             return
 
-        self.w3 = Web3(Web3.HTTPProvider(self.rpc_url))
-        self.w3.middleware_onion.inject(geth_poa_middleware, layer=0)
+        self.enabled = True
+
+    @cached_property
+    def w3(self):
+        """RPC 클라이언트 (첫 사용 시 생성)"""
+        from web3 import Web3
+        from web3.middleware import geth_poa_middleware
+
+        w3 = Web3(Web3.HTTPProvider(self.rpc_url))
+        w3.middleware_onion.inject(geth_poa_middleware, layer=0)
+        logger.info(f"WPT Service initialized: contract={self.wpt_contract_address}")
+        return w3
 
-        self.account = self.w3.eth.account.from_key(self.private_key)
-        self.contract = self.w3.eth.contract(
+    @cached_property
+    def account(self):
+        return self.w3.eth.account.from_key(self.private_key)
+
+    @cached_property
+    def contract(self):
+        from web3 import Web3
+
+        return self.w3.eth.contract(
             address=Web3.to_checksum_address(self.wpt_contract_address),
             abi=WPT_ABI
         )
-        self.enabled = True
-
-        logger.info(f"WPT Service initialized: contract={self.wpt_contract_address}, admin={self.account.address}")
 
     def generate_wallet_address(self) -> Dict:
         """
@@ -132,6 +145,8 @@ class WPTService:
         Returns:
             dict: {"address": str}
         """
+        from eth_account import Account
+
         # 간단한 방식: 랜덤 계정 생성 (프라이빗키는 플랫폼이 관리하므로 저장 불필요)
         new_account = Account.create()
         return {"address": new_account.address}
@@ -147,6 +162,8 @@ class WPTService:
         Returns:
             str: 지갑 주소
         """
+        from web3 import Web3
+
         # 플랫폼 주소 + worker_id로 해시 생성
         seed = f"workproof_wallet_{worker_id}_{os.getenv('SALT_SECRET', 'default')}"
         seed_bytes = seed.encode('utf-8')
@@ -170,6 +187,8 @@ class WPTService:
         if not self.enabled:
             return {"success": False, "error": "WPT service not configured"}
 
+        from web3 import Web3
+
         try:
             nonce = self.w3.eth.get_transaction_count(self.account.address)
 
@@ -218,6 +237,8 @@ class WPTService:
         if not self.enabled:
             return {"success": False, "error": "WPT service not configured"}
 
+        from web3 import Web3
+
         try:
             nonce = self.w3.eth.get_transaction_count(self.account.address)
 
@@ -264,6 +285,8 @@ class WPTService:
         if not self.enabled:
             return 0
 
+        from web3 import Web3
+
         try:
             balance = self.contract.functions.balanceOf(
                 Web3.to_checksum_address(address)
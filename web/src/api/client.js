@@ -163,6 +163,17 @@ export const notificationsAPI = {
   getUnreadCount: () => api.get('/api/notifications/unread-count'),
   markAsRead: (id) => api.post(`/api/notifications/${id}/read`),
   markAllAsRead: () => api.post('/api/notifications/read-all'),
+  // 실시간 스트림 (SSE) - EventSource는 헤더를 보낼 수 없어 토큰을 쿼리로 전달
+  subscribe: (handlers) => {
+    const token = localStorage.getItem('token');
+    const source = new EventSource(
+      `${API_BASE_URL}/api/notifications/stream?token=${encodeURIComponent(token || '')}`
+    );
+    Object.entries(handlers).forEach(([event, handler]) => {
+      source.addEventListener(event, (e) => handler(JSON.parse(e.data)));
+    });
+    return () => source.close();
+  },
 };
 
 // Credits API (WPT)
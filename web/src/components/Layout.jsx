@@ -95,11 +95,14 @@ export default function Layout() {
   // 알림 개수
   const [unreadCount, setUnreadCount] = useState(0);
 
-  // 알림 개수 조회
+  // 알림 개수 조회 (접속 시 1회 조회 후 스트림으로 갱신)
   useEffect(() => {
-    if (user) {
-      loadUnreadCount();
-    }
+    if (!user) return;
+    loadUnreadCount();
+    return notificationsAPI.subscribe({
+      unread_count: (data) => setUnreadCount(data.unread_count || 0),
+      resync: () => loadUnreadCount(),
+    });
   }, [user]);
 
   const loadUnreadCount = async () => {